@@ -0,0 +1,391 @@
+import os
+import re
+import sys
+import time
+import random
+import asyncio
+import threading
+import subprocess
+import urllib.request
+import numpy as np
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from utils.logger import VARIABLE_EXECUTION, Logger, chemin_metriques, lire_metriques
+
+LOG = Logger()
+
+RACINE = Path(__file__).resolve().parents[1]
+SCRIPT_APP = RACINE / "dashboard" / "app.py"
+
+# Widgets pilotés (début du libellé) : le scénario échoue explicitement si la section les renomme
+WIDGETS = {
+    "section": "📂 Choisissez une section :",
+    "annees": "Sélectionne une ou plusieurs années",
+    "sexes": "Sexes",
+    "ages": "Tranche d’âge",
+    "tri": "Trier par",
+    "ordre": "Ordre",
+    "texte": "Contient",
+    "page": "Page (sur",
+}
+
+# Valeurs tirées par le scénario : ensembles finis, comme les choix réels des utilisateurs (qui se recoupent)
+TRANCHES_AGE = [(0, 150), (0, 64), (65, 150), (20, 59), (80, 150)]
+TEXTES = ["", "MAR", "PARIS"]
+
+# Changements de filtres et probabilités relatives
+ACTIONS = {
+    "annees": 3,
+    "sexes": 1,
+    "ages": 2,
+    "tri": 1,
+    "ordre": 1,
+    "texte": 1,
+    "page": 3,
+}
+
+DELAI_DEMARRAGE_S = 60
+PERIODE_RSS_S = 0.25
+
+
+#######################################################################
+#                       SERVEUR
+#######################################################################
+def _rss_mo(pid: int) -> float | None:
+    """Mémoire résidente actuelle d’un processus (Mo), `VmRSS` de `/proc` ; None hors Linux."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for ligne in f:
+                if ligne.startswith("VmRSS:"):
+                    return int(ligne.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Serveur:
+    """
+    Tableau de bord lancé par `streamlit run` dans un processus fils (répertoire courant : racine des données),
+    avec échantillonnage périodique de sa mémoire résidente. Ses spans portent l’exécution `execution`.
+    """
+
+    def __init__(self, port: int, execution: str):
+        self.port = port
+        self.execution = execution
+        self.rss = []
+        self._arret = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}"
+
+    def __enter__(self):
+        env = os.environ | {
+            VARIABLE_EXECUTION: self.execution,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(RACINE), os.environ.get("PYTHONPATH")])),
+        }
+        self._journal = open(chemin_metriques().parent / "charge_serveur.log", "w", encoding="utf-8")
+        self.processus = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", str(SCRIPT_APP),
+                "--server.headless", "true",
+                "--server.port", str(self.port),
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            env=env, stdout=self._journal, stderr=subprocess.STDOUT,
+        )
+        try:
+            self._attendre()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        self._echantillonneur = threading.Thread(target=self._echantillonner, daemon=True)
+        self._echantillonneur.start()
+        return self
+
+    def _attendre(self):
+        limite = time.monotonic() + DELAI_DEMARRAGE_S
+        while time.monotonic() < limite:
+            if self.processus.poll() is not None:
+                raise RuntimeError(f"Le serveur s’est arrêté au démarrage (code {self.processus.returncode}), voir {self._journal.name}")
+            try:
+                with urllib.request.urlopen(f"{self.url}/_stcore/health", timeout=1) as reponse:
+                    if reponse.status == 200:
+                        return
+            except OSError:
+                pass
+            time.sleep(0.2)
+        raise TimeoutError(f"Serveur injoignable après {DELAI_DEMARRAGE_S} s ({self.url})")
+
+    def _echantillonner(self):
+        debut = time.monotonic()
+        while not self._arret.is_set():
+            rss = _rss_mo(self.processus.pid)
+            if rss is not None:
+                self.rss.append((round(time.monotonic() - debut, 2), round(rss, 1)))
+            self._arret.wait(PERIODE_RSS_S)
+
+    def memoire_caches(self) -> dict[str, int]:
+        """
+        Mémoire (octets) de chaque cache `st.cache_data` / `st.cache_resource`, lue sur `/_stcore/metrics`.
+        """
+        try:
+            with urllib.request.urlopen(f"{self.url}/_stcore/metrics", timeout=10) as reponse:
+                texte = reponse.read().decode("utf-8")
+        except OSError as e:
+            LOG.warning(f"Métriques Streamlit indisponibles : {e}")
+            return {}
+        motif = re.compile(r'^cache_memory_bytes\{cache_type="(\w+)",cache="([^"]+)"\} (\d+)$', re.MULTILINE)
+        return {f"{nom} ({type_cache})": int(octets) for type_cache, nom, octets in motif.findall(texte)}
+
+    def __exit__(self, exc_type, exc, tb):
+        self._arret.set()
+        self.processus.terminate()
+        try:
+            self.processus.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.processus.kill()
+            self.processus.wait()
+        self._journal.close()
+        return False
+
+
+#######################################################################
+#                       SESSIONS
+#######################################################################
+class Session:
+    """
+    Client du protocole Streamlit (WebSocket `/_stcore/stream`, messages protobuf), comme le navigateur :
+    chaque interaction envoie l’état de tous les widgets modifiés (`rerun_script`) et la réexécution se
+    termine au message `script_finished`. Les widgets (identifiant, options) sont relus dans les deltas reçus.
+    """
+
+    def __init__(self, url: str, numero: int, graine: int):
+        self.url = url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.numero = numero
+        self.hasard = random.Random(graine + numero)
+        self.widgets = {}
+        self.etats = {}
+        self.mesures = []
+
+    async def __aenter__(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.ws.close()
+        return False
+
+    # -----------------------------------------------------------------
+    def _widget(self, nom: str):
+        libelle = WIDGETS[nom]
+        for widget_libelle, widget in self.widgets.items():
+            if widget_libelle.startswith(libelle):
+                return widget
+        raise LookupError(f"Widget introuvable : « {libelle} »")
+
+    def _present(self, nom: str) -> bool:
+        return any(libelle.startswith(WIDGETS[nom]) for libelle in self.widgets)
+
+    def _fixer(self, nom: str, **valeur):
+        etat = WidgetState(id=self._widget(nom).id)
+        for champ, v in valeur.items():
+            if champ.endswith("_array_value"):
+                getattr(etat, champ).data[:] = v
+            else:
+                setattr(etat, champ, v)
+        self.etats[nom] = etat
+
+    async def executer(self, action: str) -> float:
+        """
+        Envoie l’état des widgets, attend la fin de la réexécution et renvoie sa durée (s).
+        """
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.widget_states.widgets.extend(self.etats.values())
+        erreurs, widgets = [], {}
+        debut = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        while True:
+            reponse = ForwardMsg()
+            reponse.ParseFromString(await self.ws.recv())
+            genre = reponse.WhichOneof("type")
+            if genre == "script_finished":
+                break
+            if genre != "delta" or reponse.delta.WhichOneof("type") != "new_element":
+                continue
+            element = reponse.delta.new_element
+            proto = getattr(element, element.WhichOneof("type"))
+            if element.WhichOneof("type") == "exception":
+                erreurs.append(proto.message)
+            elif hasattr(proto, "id") and hasattr(proto, "label"):
+                widgets[proto.label] = proto
+        secondes = time.perf_counter() - debut
+
+        # Un widget absent de cette exécution, ou dont l’identifiant change (libellé dépendant des données),
+        # repart de sa valeur par défaut, comme dans le navigateur
+        self.widgets = widgets
+        for nom, etat in list(self.etats.items()):
+            if not self._present(nom) or self._widget(nom).id != etat.id:
+                del self.etats[nom]
+        self.mesures.append({"session": self.numero, "action": action, "secondes": round(secondes, 4), "erreurs": erreurs})
+        if erreurs:
+            LOG.warning(f"Session {self.numero} ({action}) : {erreurs[0]}")
+        return secondes
+
+    # -----------------------------------------------------------------
+    def tirer_action(self) -> str:
+        """
+        Tire un changement de filtres (parmi les widgets affichés) et l’applique aux états envoyés
+        à la prochaine réexécution.
+        """
+        possibles = {action: poids for action, poids in ACTIONS.items() if self._present(action)}
+        action = self.hasard.choices(list(possibles), weights=list(possibles.values()))[0]
+        if action == "annees":
+            options = list(self._widget("annees").options)
+            self._fixer("annees", string_array_value=self.hasard.sample(options, self.hasard.randint(1, min(3, len(options)))))
+        elif action == "sexes":
+            options = list(self._widget("sexes").options)
+            self._fixer("sexes", string_array_value=self.hasard.sample(options, self.hasard.randint(1, len(options))))
+        elif action == "ages":
+            self._fixer("ages", double_array_value=self.hasard.choice(TRANCHES_AGE))
+        elif action == "tri":
+            self._fixer("tri", string_value=self.hasard.choice(list(self._widget("tri").options)))
+        elif action == "ordre":
+            self._fixer("ordre", string_value=self.hasard.choice(list(self._widget("ordre").options)))
+        elif action == "texte":
+            self._fixer("texte", string_value=self.hasard.choice(TEXTES))
+        elif action == "page":
+            # Page suivante le plus souvent, sinon saut direct
+            widget = self._widget("page")
+            courante = self.etats["page"].double_value if "page" in self.etats else widget.default
+            page = courante + 1 if self.hasard.random() < 0.7 else self.hasard.randint(1, int(widget.max))
+            self._fixer("page", double_value=min(page, widget.max))
+        return action
+
+    async def jouer(self, nb_actions: int, pause_s: float, section: str):
+        """Ouverture, choix de la section, puis `nb_actions` changements de filtres espacés de `pause_s` en moyenne."""
+        await self.executer("ouverture")
+        self._fixer("section", string_value=section)
+        await self.executer("section")
+        for _ in range(nb_actions):
+            await asyncio.sleep(self.hasard.uniform(0, 2 * pause_s))
+            await self.executer(self.tirer_action())
+
+
+async def _simuler(url: str, nb_sessions: int, nb_actions: int, pause_s: float, montee_s: float, section: str, graine: int) -> list[dict]:
+    async def lancer(numero: int) -> list[dict]:
+        await asyncio.sleep(montee_s * numero / nb_sessions)
+        async with Session(url, numero, graine) as session:
+            await session.jouer(nb_actions, pause_s, section)
+        return session.mesures
+
+    resultats = await asyncio.gather(*(lancer(numero) for numero in range(nb_sessions)))
+    return [mesure for mesures in resultats for mesure in mesures]
+
+
+#######################################################################
+#                       RAPPORT
+#######################################################################
+def _centiles(secondes: list[float]) -> dict:
+    ms = np.asarray(secondes) * 1000
+    return {
+        "n": len(ms),
+        "p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "p95_ms": round(float(np.percentile(ms, 95)), 1),
+        "p99_ms": round(float(np.percentile(ms, 99)), 1),
+        "max_ms": round(float(ms.max()), 1),
+    }
+
+
+def taux_caches(spans: list[dict]) -> dict:
+    """
+    Succès des caches du tableau de bord d’après les spans : cache de figures (`figures.obtenir`,
+    servi de la mémoire ou du disque) et blocs de l’explorateur (`explorateur.page`).
+    """
+    caches = {}
+    for nom, span_nom, succes in [("figures", "figures.obtenir", ("memoire", "disque")), ("explorateur", "explorateur.page", ("cache",))]:
+        origines = [span.get("origine") for span in spans if span["span"] == span_nom]
+        if not origines:
+            continue
+        caches[nom] = {origine: origines.count(origine) for origine in sorted(set(origines))}
+        caches[nom]["taux_succes"] = round(sum(origine in succes for origine in origines) / len(origines), 3)
+    return caches
+
+
+def charge(
+    nb_sessions: int = 10,
+    nb_actions: int = 20,
+    pause_s: float = 0.5,
+    montee_s: float = 5.0,
+    section: str = "Décès",
+    port: int = 8599,
+    graine: int = 0,
+    execution: str | None = None,
+) -> dict:
+    """
+    Lance le tableau de bord, y joue `nb_sessions` sessions simultanées (scénario de filtres tiré au hasard,
+    reproductible par `graine`) et renvoie le rapport : latence des réexécutions (p50 / p95 / p99, globale
+    et par action), mémoire résidente du serveur (début, pic, fin), succès des caches et erreurs.
+    """
+    execution = execution or os.environ.get(VARIABLE_EXECUTION)
+    with Serveur(port, execution) as serveur:
+        rss_debut = _rss_mo(serveur.processus.pid)
+        debut = time.perf_counter()
+        mesures = asyncio.run(_simuler(serveur.url, nb_sessions, nb_actions, pause_s, montee_s, section, graine))
+        duree = time.perf_counter() - debut
+        rss_fin = _rss_mo(serveur.processus.pid)
+        caches_streamlit = serveur.memoire_caches()
+        rss = serveur.rss
+
+    # Les réexécutions de l’ouverture (import de la section, caches froids) sont rapportées à part
+    filtres = [m for m in mesures if m["action"] not in ("ouverture", "section")]
+    par_action = {}
+    for mesure in mesures:
+        par_action.setdefault(mesure["action"], []).append(mesure["secondes"])
+
+    rapport = {
+        "sessions": nb_sessions,
+        "actions_par_session": nb_actions,
+        "duree_s": round(duree, 1),
+        "reexecutions_par_s": round(len(mesures) / duree, 2) if duree else None,
+        "latence": _centiles([m["secondes"] for m in filtres]) if filtres else None,
+        "latence_par_action": {action: _centiles(secondes) for action, secondes in sorted(par_action.items())},
+        "erreurs": sum(len(m["erreurs"]) for m in mesures),
+        "caches": taux_caches(lire_metriques(execution)) if execution else {},
+        "caches_streamlit_octets": caches_streamlit,
+    }
+    if rss_debut is not None:
+        pic = max([r for _, r in rss] + [rss_debut, rss_fin or 0])
+        rapport["rss_mo"] = {
+            "debut": round(rss_debut, 1),
+            "pic": round(pic, 1),
+            "fin": round(rss_fin, 1),
+            "hausse": round(rss_fin - rss_debut, 1),
+        }
+        rapport["rss_echantillons"] = rss
+    return rapport
+
+
+def formater_rapport(rapport: dict) -> str:
+    lignes = [f"{rapport['sessions']} sessions × {rapport['actions_par_session']} actions en {rapport['duree_s']} s "
+              f"({rapport['reexecutions_par_s']} réexécutions/s, {rapport['erreurs']} erreur(s))"]
+    lignes.append(f"{'Action':<12} {'N':>6} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+    for action, c in list(rapport["latence_par_action"].items()) + [("TOTAL", rapport["latence"])]:
+        if c is not None:
+            lignes.append(f"{action:<12} {c['n']:>6} {c['p50_ms']:>10.0f} {c['p95_ms']:>10.0f} {c['p99_ms']:>10.0f} {c['max_ms']:>10.0f}")
+    if "rss_mo" in rapport:
+        rss = rapport["rss_mo"]
+        lignes.append(f"RSS serveur : {rss['debut']:.0f} Mo au début, pic {rss['pic']:.0f} Mo, {rss['fin']:.0f} Mo à la fin ({rss['hausse']:+.0f} Mo)")
+    for nom, cache in rapport["caches"].items():
+        detail = ", ".join(f"{origine} {n}" for origine, n in cache.items() if origine != "taux_succes")
+        lignes.append(f"Cache {nom} : {cache['taux_succes']:.0%} de succès ({detail})")
+    for nom, octets in rapport["caches_streamlit_octets"].items():
+        lignes.append(f"  {nom:<60} {octets / 1024:>10,.0f} Ko".replace(",", " "))
+    return "\n".join(lignes)
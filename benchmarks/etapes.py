@@ -0,0 +1,163 @@
+import time
+import shutil
+import multiprocessing
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.synthetique import generer_deces, generer_naissances
+from utils.logger import initialiser_journal_processus, queue_journal_processus, reinitialiser_pic_rss, rss_pic_mo
+
+
+#######################################################################
+#                       ÉTAPES MESURÉES
+#######################################################################
+# Chaque étape reçoit le dossier de travail et renvoie (secondes, lignes traitées).
+# Chaque étape tourne dans un processus neuf ; `utils.loader` y est importé avant la mémoire de référence.
+
+def lire_deces(dossier: Path) -> tuple[float, int]:
+    from utils.loader import lire_fichier_deces
+    fichiers = sorted((dossier / "brut").glob("deces-*.txt"))
+    debut = time.perf_counter()
+    lignes = sum(len(lire_fichier_deces(f)) for f in fichiers)
+    return time.perf_counter() - debut, lignes
+
+
+def nettoyer(dossier: Path) -> tuple[float, int]:
+    from utils.loader import lire_fichier_deces, nettoyer_deces
+    bruts = [lire_fichier_deces(f) for f in sorted((dossier / "brut").glob("deces-*.txt"))]
+    debut = time.perf_counter()
+    lignes = sum(len(nettoyer_deces(df)) for df in bruts)
+    return time.perf_counter() - debut, lignes
+
+
+def convertir(dossier: Path) -> tuple[float, int]:
+    from utils.loader import convert_to_parquet, lire_manifeste
+    sortie = dossier / "parquet"
+    shutil.rmtree(sortie, ignore_errors=True)
+    debut = time.perf_counter()
+    convert_to_parquet(dossier / "brut", sortie, workers=1)
+    secondes = time.perf_counter() - debut
+    return secondes, sum(entree["lignes"] for entree in lire_manifeste(sortie).values())
+
+
+def charger_parquet(dossier: Path) -> tuple[float, int]:
+    from utils.loader import charger_parquet_multi
+    debut = time.perf_counter()
+    df = charger_parquet_multi(dossier / "parquet")
+    return time.perf_counter() - debut, len(df)
+
+
+def lire_naissances(dossier: Path) -> tuple[float, int]:
+    from utils.loader import lire_fichier_naissances
+    fichiers = sorted((dossier / "brut").glob("naissances_*.parquet"))
+    debut = time.perf_counter()
+    lignes = sum(len(lire_fichier_naissances(str(f))) for f in fichiers)
+    return time.perf_counter() - debut, lignes
+
+
+def agreger_deces(dossier: Path) -> tuple[float, int]:
+    """
+    Chemin de calcul de `deces.render` : cube filtré, regroupements et traces Plotly.
+    """
+    import plotly.graph_objects as go
+    from utils.aggregation import traces_boite, traces_histogramme
+    from utils.cube import charger_cube, compter
+    from utils.loader import valeurs_partition
+
+    base = dossier / "parquet"
+    annees = [int(a) for a in valeurs_partition(base, "annee_deces")]
+    debut = time.perf_counter()
+    cube = charger_cube(base, annees=annees, sexes=["1", "2"], age_min=0, age_max=150)
+    data_age = compter(cube, ["age_deces", "sexe"])
+    go.Figure(traces_histogramme(data_age, "age_deces", "sexe", poids="nb_deces", nb_classes=80))
+    go.Figure(traces_boite(data_age, "age_deces", "sexe", poids="nb_deces"))
+    compter(cube, ["annee_deces", "mois_deces", "sexe"])
+    compter(cube, ["mois_deces", "sexe"])
+    return time.perf_counter() - debut, int(cube["nb_deces"].sum())
+
+
+# Ordre d’exécution : la conversion produit le jeu lu par les étapes suivantes
+ETAPES = {
+    "lire_fichier_deces": lire_deces,
+    "nettoyer_deces": nettoyer,
+    "convert_to_parquet": convertir,
+    "charger_parquet_multi": charger_parquet,
+    "lire_fichier_naissances": lire_naissances,
+    "deces.render (agrégation)": agreger_deces,
+}
+
+
+#######################################################################
+#                       EXÉCUTION
+#######################################################################
+def _executer(nom: str, dossier: Path) -> dict:
+    import utils.loader  # noqa: F401  (coût d’import exclu de la mémoire de référence)
+    reinitialiser_pic_rss()
+    base_mo = rss_pic_mo()
+    secondes, lignes = ETAPES[nom](dossier)
+    return {
+        "etape": nom,
+        "secondes": round(secondes, 4),
+        "lignes": lignes,
+        "lignes_par_s": round(lignes / secondes) if secondes else None,
+        "memoire_base_mo": round(base_mo, 1),
+        "memoire_max_mo": round(rss_pic_mo(), 1),
+    }
+
+
+def mesurer_etape(nom: str, dossier: Path) -> dict:
+    """
+    Exécute une étape dans un processus neuf : le pic mémoire (`VmHWM`) ne mesure que cette étape.
+    """
+    contexte = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=contexte,
+        initializer=initialiser_journal_processus,
+        initargs=(queue_journal_processus(),),
+    ) as pool:
+        return pool.submit(_executer, nom, dossier).result()
+
+
+# ---------------------------------------------------------------------
+def generer_jeu(dossier: Path, lignes: int, annees: list[int], seed: int = 0) -> Path:
+    """
+    Écrit les fichiers synthétiques (décès .txt et naissances .parquet) répartis sur `annees`.
+    """
+    brut = dossier / "brut"
+    shutil.rmtree(brut, ignore_errors=True)
+    par_annee = -(-lignes // len(annees))
+    for i, annee in enumerate(annees):
+        n = min(par_annee, lignes - i * par_annee)
+        if n <= 0:
+            break
+        generer_deces(brut / f"deces-{annee}.txt", n, annee, seed=seed + i)
+        # Environ 1,2 naissance pour 1 décès, comme en France sur la période
+        generer_naissances(brut / f"naissances_{annee}.parquet", int(n * 1.2), annee, seed=seed + i)
+    return brut
+
+
+def comparer(resultats: dict, reference: dict, seuil: float = 0.10) -> pd.DataFrame:
+    """
+    Compare deux exécutions étape par étape ; `regression` vaut vrai au-delà de `seuil` (+10 % par défaut).
+    """
+    avant = {e["etape"]: e for e in reference["etapes"]}
+    lignes = []
+    for etape in resultats["etapes"]:
+        ref = avant.get(etape["etape"])
+        if ref is None:
+            continue
+        ratio_temps = etape["secondes"] / ref["secondes"] if ref["secondes"] else float("nan")
+        ratio_memoire = etape["memoire_max_mo"] / ref["memoire_max_mo"] if ref["memoire_max_mo"] else float("nan")
+        lignes.append({
+            "etape": etape["etape"],
+            "secondes_avant": ref["secondes"],
+            "secondes": etape["secondes"],
+            "ratio_temps": round(ratio_temps, 3),
+            "memoire_avant_mo": ref["memoire_max_mo"],
+            "memoire_mo": etape["memoire_max_mo"],
+            "ratio_memoire": round(ratio_memoire, 3),
+            "regression": ratio_temps > 1 + seuil or ratio_memoire > 1 + seuil,
+        })
+    return pd.DataFrame(lignes)
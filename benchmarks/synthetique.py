@@ -0,0 +1,139 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+
+from utils.loader import COLSPECS_DECES
+
+# Quelques valeurs réalistes (fréquences approximatives des fichiers INSEE)
+NOMS = ["MARTIN", "BERNARD", "THOMAS", "PETIT", "ROBERT", "RICHARD", "DURAND", "DUBOIS", "MOREAU", "LAURENT",
+        "SIMON", "MICHEL", "LEFEBVRE", "LEROY", "ROUX", "DAVID", "BERTRAND", "MOREL", "FOURNIER", "GIRARD"]
+PRENOMS_H = ["JEAN", "PIERRE", "MICHEL", "ANDRE", "PHILIPPE", "RENE", "LOUIS", "ALAIN", "JACQUES", "BERNARD"]
+PRENOMS_F = ["MARIE", "JEANNE", "FRANCOISE", "MONIQUE", "CATHERINE", "NATHALIE", "ISABELLE", "JACQUELINE"]
+COMMUNES = ["PARIS", "MARSEILLE", "LYON", "TOULOUSE", "NICE", "NANTES", "STRASBOURG", "MONTPELLIER",
+            "BORDEAUX", "LILLE", "RENNES", "REIMS", "SAINT-ETIENNE", "LE HAVRE", "TOULON", "GRENOBLE"]
+PAYS = ["ALGERIE", "MAROC", "PORTUGAL", "ITALIE", "ESPAGNE", "TUNISIE", "BELGIQUE", "POLOGNE"]
+DEPARTEMENTS = [f"{d:02d}" for d in range(1, 96) if d != 20] + ["2A", "2B"]
+OUTRE_MER = ["971", "972", "973", "974", "976"]
+
+# Poids mensuels des décès (surmortalité hivernale)
+POIDS_MOIS = np.array([1.18, 1.05, 1.02, 0.95, 0.92, 0.88, 0.92, 0.90, 0.90, 0.97, 1.03, 1.15])
+
+LARGEUR_LIGNE = 198
+
+
+def _champ(valeurs: np.ndarray, largeur: int) -> np.ndarray:
+    """
+    Matrice d’octets (n, largeur) : chaînes ASCII complétées à droite par des espaces.
+    """
+    brut = np.char.ljust(valeurs.astype(f"U{largeur}"), largeur).astype(f"S{largeur}")
+    return brut.view(np.uint8).reshape(len(valeurs), largeur)
+
+
+def _dates(rng, annees: np.ndarray, mois: np.ndarray | None = None, part_partielle: float = 0.0) -> np.ndarray:
+    """
+    Dates AAAAMMJJ ; une fraction `part_partielle` a un jour / mois / année inconnus (00 / 0000).
+    """
+    n = len(annees)
+    mois = rng.integers(1, 13, n) if mois is None else mois
+    jours = rng.integers(1, 29, n)
+    partielles = rng.random(n) < part_partielle
+    type_partiel = rng.integers(0, 3, n)
+    jours = np.where(partielles, 0, jours)
+    mois = np.where(partielles & (type_partiel >= 1), 0, mois)
+    annees = np.where(partielles & (type_partiel == 2), 0, annees)
+    return np.char.zfill(annees.astype("U4"), 4) + np.char.zfill(mois.astype("U2"), 2) + np.char.zfill(jours.astype("U2"), 2)
+
+
+def _codes_cog(rng, n: int) -> np.ndarray:
+    departements = np.where(
+        rng.random(n) < 0.03,
+        rng.choice(OUTRE_MER, n),
+        rng.choice(DEPARTEMENTS, n),
+    )
+    largeur_commune = np.where(np.char.str_len(departements) == 3, 2, 3)
+    communes = rng.integers(1, 100, n)
+    return np.where(
+        largeur_commune == 2,
+        departements + np.char.zfill(communes.astype("U2"), 2),
+        departements + np.char.zfill(communes.astype("U3"), 3),
+    )
+
+
+# ---------------------------------------------------------------------
+def lignes_deces(n: int, annee: int, seed: int = 0) -> bytes:
+    """
+    Génère `n` lignes du fichier décès INSEE (largeur fixe, positions de `COLSPECS_DECES`).
+    """
+    rng = np.random.default_rng(seed)
+    sexes = rng.choice(np.array(["1", "2"]), n)
+    prenoms = np.where(sexes == "1", rng.choice(PRENOMS_H, n), rng.choice(PRENOMS_F, n))
+    noms = np.char.add(np.char.add(rng.choice(NOMS, n), "*"), np.char.add(prenoms, "/"))
+
+    ages = np.clip(rng.normal(79, 14, n), 0, 110).astype(np.int64)
+    mois_deces = rng.choice(np.arange(1, 13), n, p=POIDS_MOIS / POIDS_MOIS.sum())
+    # ~5 % de décès enregistrés tardivement (années antérieures)
+    annees_deces = annee - (rng.random(n) < 0.05) * rng.integers(1, 4, n)
+
+    nes_etranger = rng.random(n) < 0.12
+    champs = [
+        noms,
+        sexes,
+        _dates(rng, annees_deces - ages, part_partielle=0.01),
+        _codes_cog(rng, n),
+        np.where(nes_etranger, "", rng.choice(COMMUNES, n)),
+        np.where(nes_etranger, rng.choice(PAYS, n), ""),
+        _dates(rng, annees_deces, mois_deces, part_partielle=0.002),
+        _codes_cog(rng, n),
+        np.char.zfill(rng.integers(1, 5000, n).astype("U4"), 4),
+    ]
+
+    matrice = np.full((n, LARGEUR_LIGNE + 1), 0x20, dtype=np.uint8)
+    for valeurs, (debut, fin) in zip(champs, COLSPECS_DECES):
+        matrice[:, debut:fin] = _champ(np.asarray(valeurs), fin - debut)
+    matrice[:, -1] = 0x0A
+    return matrice.tobytes()
+
+
+def generer_deces(fichier: Path, n: int, annee: int, seed: int = 0, lignes_par_bloc: int = 500_000) -> Path:
+    """
+    Écrit un fichier `deces-AAAA.txt` synthétique de `n` lignes, par blocs (mémoire bornée).
+    """
+    fichier.parent.mkdir(parents=True, exist_ok=True)
+    with open(fichier, "wb") as f:
+        for i, debut in enumerate(range(0, n, lignes_par_bloc)):
+            f.write(lignes_deces(min(lignes_par_bloc, n - debut), annee, seed=seed * 1_000 + i))
+    return fichier
+
+
+# ---------------------------------------------------------------------
+def generer_naissances(fichier: Path, n: int, annee: int, seed: int = 0) -> Path:
+    """
+    Écrit un fichier Parquet de naissances synthétique au format INSEE (toutes colonnes en chaînes).
+    """
+    rng = np.random.default_rng(seed)
+    ages_meres = np.clip(rng.normal(31, 5, n), 17, 46).astype(np.int64)
+    deps = np.array(DEPARTEMENTS + OUTRE_MER)
+
+    def codes(valeurs, largeur=1):
+        return pa.array(np.char.zfill(np.asarray(valeurs).astype(f"U{largeur}"), largeur))
+
+    table = pa.table({
+        "ANAIS": codes(np.full(n, annee), 4),
+        "ACCOUCHR": pa.array(rng.choice(["ES", "AU"], n, p=[0.99, 0.01])),
+        "AGEMERE": codes(ages_meres, 2),
+        "AGEXACTM": codes(np.maximum(ages_meres - rng.integers(0, 2, n), 17), 2),
+        "DEPDOM": pa.array(rng.choice(deps, n)),
+        "DEPNAIS": pa.array(rng.choice(deps, n)),
+        "INDLNM": codes(rng.choice([1, 2, 3, 4], n, p=[0.78, 0.02, 0.01, 0.19])),
+        "INDNATM": codes(rng.choice([1, 2], n, p=[0.83, 0.17])),
+        "MNAIS": codes(rng.integers(1, 13, n), 2),
+        "NBENF": codes(rng.choice([1, 2, 3], n, p=[0.97, 0.029, 0.001])),
+        "ORIGINOM": codes(rng.integers(1, 6, n)),
+        "SEXE": codes(rng.choice([1, 2], n, p=[0.512, 0.488])),
+        "TUCOM": pa.array(rng.choice(["M", "P"], n)),
+        "TUDOM": codes(rng.integers(0, 10, n)),
+    })
+    fichier.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, fichier)
+    return fichier
@@ -1,5 +1,26 @@
+import sys
+import time
+import importlib
 import streamlit as st
-from sections import population, naissance, deces, viols, feminicides
+
+from sections import SECTIONS
+from utils.logger import Logger
+
+LOG = Logger()
+
+
+def charger_section(libelle: str):
+    """Importe le module d’une section (et ses dépendances lourdes) au premier affichage seulement."""
+    nom = SECTIONS[libelle]
+    deja_importee = nom in sys.modules
+    debut = time.perf_counter()
+    # Pas de lecture directe de `sys.modules` : un module en cours d’import par la session d’un autre
+    # thread y figure déjà, incomplet ; `import_module` attend la fin de cet import
+    module = importlib.import_module(nom)
+    if not deja_importee:
+        LOG.info(f"Section « {libelle} » importée en {(time.perf_counter() - debut) * 1000:.0f} ms")
+    return module
+
 
 st.set_page_config(
     page_title="Dashboard Population France",
@@ -12,24 +33,13 @@ st.title("Analyse de la population francaise")
 # --- Barre latérale ---
 section = st.sidebar.radio(
     "📂 Choisissez une section :",
-    ["Population", "Naissance", "Décès", "Viols", "Féminicides"]
+    list(SECTIONS)
 )
 
 # --- Navigation ---
-if section == "Décès":
-    deces.render()
-
-
-
-# if section == "Population":
-# population.show()
-#elif section == "Naissance":
-   # naissance.show()
-
-#elif section == "Viols":
-#    viols.show()
-#elif section == "Féminicides":
-  #  feminicides.show()
+module = charger_section(section)
+if hasattr(module, "render"):
+    module.render()
 
 st.markdown("---")
 st.caption("Source : data.gouv.fr | INSEE | Ministère de l'Intérieur  — © 2025 Alex LAMIZANA")
@@ -0,0 +1,8 @@
+# Sections du tableau de bord : libellé → module (importé seulement quand la section est choisie)
+SECTIONS = {
+    "Population": "sections.population",
+    "Naissance": "sections.naissance",
+    "Décès": "sections.deces",
+    "Viols": "sections.viols",
+    "Féminicides": "sections.feminicides",
+}
@@ -1,44 +1,207 @@
 import streamlit as st
 import plotly.express as px
-from pathlib import Path
-import pandas as pd
+import plotly.graph_objects as go
+import pyarrow as pa
+
+from utils.aggregation import traces_boite, traces_histogramme
+from utils.cube import CubeIndexe, compter
+from utils.cache import version_jeu
+from utils.dates import AGE_MAX
+from utils.explorateur import COLONNES_EXPLORATEUR, Explorateur
+from utils.figures import CacheFigures
+from utils.geo import ZOOMS, charger_couche, region
+from utils.logger import profiler
+from utils.plot_utils import carte_choroplethe
+from utils.recherche import IndexRecherche
+from utils.sql import connecter, deces_par_semaine
+from utils.surmortalite import SeriesMensuelles, agreger_surmortalite, libelles_tranches, surmortalite
+from utils.registre import jeu
+
+from .jeux import annees, valeurs
+
+# Couleurs par sexe
+COULEURS_SEXE = {"1": "DodgerBlue", "2": "LightCoral"}
+
+# Nombre maximal de personnes affichées par la recherche
+LIMITE_RECHERCHE = 200
+
+# Tailles de page proposées par l’explorateur de données
+TAILLES_PAGE = [50, 100, 500]
+
+# Noms des mois en français
+MOIS_LABELS = {
+    1: "Janvier", 2: "Février", 3: "Mars", 4: "Avril",
+    5: "Mai", 6: "Juin", 7: "Juillet", 8: "Août",
+    9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Décembre"
+}
 
-from utils.loader import charger_parquet_multi
+
+# ---------------------------------------------------------------------
+@st.cache_resource(show_spinner=False)
+def get_cube_index(base_dir, version):
+    """Cube d’agrégats lu et indexé une fois par version du jeu, partagé par toutes les sessions."""
+    return CubeIndexe(base_dir)
+
+
+def load_cube(selected_years, base_dir, sexes=None, age_range=None):
+    """Lignes du cube d’agrégats retenues pour les années, sexes et âges sélectionnés (bitmaps + bornes d’âge)."""
+    age_min, age_max = age_range if age_range is not None else (None, None)
+    index = get_cube_index(base_dir, version_jeu(base_dir))
+    return index.filtrer(annees=selected_years, sexes=sexes, age_min=age_min, age_max=age_max)
 
 
 # ---------------------------------------------------------------------
-@st.cache_data(show_spinner=True)
-def list_available_years():
-    """Liste toutes les années disponibles dans le dossier Parquet."""
-    data_dir = Path("data_processed/deces")
-    files = sorted(data_dir.glob("deces_*.parquet"))
-    years = [int(f.stem.split("_")[1]) for f in files if f.stem.split("_")[1].isdigit()]
-    return years, data_dir
+def filtres_figures(selected_years, sexes, age_range):
+    """État canonique des filtres (clé du cache de figures) : deux sessions aux mêmes filtres partagent l’entrée."""
+    age_min, age_max = age_range if age_range is not None else (0, AGE_MAX)
+    return {
+        "annees": sorted(int(a) for a in selected_years),
+        "sexes": sorted(str(s) for s in sexes) if sexes is not None else None,
+        "ages": [max(0, min(int(age_min), AGE_MAX + 1)), min(int(age_max), AGE_MAX)],
+    }
+
+
+def construire_figures(cube, selected_years):
+    """Figures calculées sur le cube (âge, mois, boîte, saisonnalité) et nombre de décès, sans appel Streamlit."""
+    if cube.empty:
+        return {"nb_deces": 0, "figures": {}}
+
+    # 📊 Histogramme âge
+    data_age = compter(cube, ["age_deces", "sexe"])
+    fig_age = go.Figure(traces_histogramme(data_age, "age_deces", "sexe", poids="nb_deces", nb_classes=80, couleurs=COULEURS_SEXE))
+    fig_age.update_layout(
+        barmode="overlay",
+        bargap=0,
+        xaxis_title="Âge au décès",
+        yaxis_title="Nombre de décès",
+        legend_title="Sexe",
+        title=f"Distribution de l'âge au décès ({min(selected_years)}–{max(selected_years)})"
+    )
+
+    # 📈 Décès par mois et par sexe
+    data_mois = compter(cube, ["annee_deces", "mois_deces", "sexe"])
+
+    # Créer un identifiant unique "année-mois" pour l’axe X
+    codes_mois = data_mois["annee_deces"].astype(int) * 100 + data_mois["mois_deces"].astype(int)
+    data_mois["annee_mois"] = etiquettes(codes_mois, lambda code: f"{code // 100}-{code % 100:02d}")
+
+    fig_mois = px.bar(
+        data_mois,
+        x="annee_mois",
+        y="nb_deces",
+        color="sexe",
+        barmode="group",  # ou "stack" selon préférence
+        color_discrete_map=COULEURS_SEXE,
+        title="Nombre de décès par mois et par sexe (2020–2024)",
+        labels={"annee_mois": "Mois", "nb_deces": "Nombre de décès", "sexe": "Sexe"}
+    )
+    fig_mois.update_layout(
+        xaxis_title="Période (AAAA-MM)",
+        yaxis_title="Décès mensuels",
+        xaxis_tickangle=-45,
+        bargap=0.05,
+        hovermode="x unified"
+    )
+
+    # 📦 Boxplot âge/sexe (quartiles et moustaches calculés côté serveur, pondérés par le cube)
+    fig_box = go.Figure(traces_boite(data_age, "age_deces", "sexe", poids="nb_deces", couleurs=COULEURS_SEXE))
+    fig_box.update_layout(
+        xaxis_title="sexe",
+        yaxis_title="age_deces",
+        legend_title="sexe",
+        title="Distribution de l’âge au décès par sexe"
+    )
+
+    # 📅 Saisonnalité mensuelle
+    data_saison = compter(cube, ["mois_deces", "sexe"])
+    data_saison["mois_nom"] = data_saison["mois_deces"].astype(int).map(MOIS_LABELS)
+    fig_month = px.bar(
+        data_saison,
+        x="mois_nom",
+        y="nb_deces",
+        color="sexe",
+        barmode="stack",
+        category_orders={"mois_nom": list(MOIS_LABELS.values())},
+        color_discrete_map=COULEURS_SEXE,
+        labels={"mois_nom": "Mois de décès", "sexe": "Sexe"},
+        title="Répartition mensuelle des décès par sexe (2020–2024)"
+    )
+    fig_month.update_layout(
+        xaxis_title="Mois de l'année",
+        yaxis_title="Nombre total de décès",
+        bargap=0.05,
+        hovermode="x unified",
+        legend_title="Sexe",
+        xaxis_tickangle=-30,
+    )
+
+    return {
+        "nb_deces": int(cube["nb_deces"].sum()),
+        "figures": {"age": fig_age, "mois": fig_mois, "boite": fig_box, "saison": fig_month},
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache(base_dir):
+    """Cache de figures sur disque (`_figures/`), partagé par toutes les sessions et par `main_figures.py`."""
+    return CacheFigures(base_dir)
+
+
+def load_figures(selected_years, base_dir, sexes=None, age_range=None):
+    """Figures du cube pour cet état de filtres : lues dans le cache, sinon construites depuis le cube puis gardées."""
+    version = version_jeu(base_dir)
+    return get_figure_cache(base_dir).obtenir(
+        "deces", version, filtres_figures(selected_years, sexes, age_range),
+        lambda: construire_figures(load_cube(selected_years, base_dir, sexes, age_range), selected_years),
+    )
 
 
 # ---------------------------------------------------------------------
-@st.cache_data(show_spinner=True)
-def load_data_by_years(selected_years, base_dir):
-    """Charge uniquement les années sélectionnées."""
-    dfs = []
-    for year in selected_years:
-        path = base_dir / f"deces_{year}.parquet"
-        if path.exists():
-            df = pd.read_parquet(path)
-            df["annee_deces"] = int(year)
-            dfs.append(df)
-    if not dfs:
-        return pd.DataFrame()
-    return pd.concat(dfs, ignore_index=True)
+@st.cache_resource(show_spinner=False)
+def get_sql(base_dir):
+    """Moteur SQL embarqué (vue `deces` sur les fichiers Parquet), partagé par toutes les sessions."""
+    return connecter(base_deces=base_dir)
+
+
+@st.cache_data(show_spinner=False)
+def load_weekly(selected_years, base_dir, sexes, version):
+    """Décès par semaine, agrégés en SQL directement sur les fichiers (une session DuckDB par appel)."""
+    return deces_par_semaine(get_sql(base_dir).cursor(), annees=selected_years, sexes=sexes)
+
+
+@st.cache_data(show_spinner=False)
+def load_excess(base_dir, version, nb_annees):
+    """Surmortalité mensuelle (série tenue à jour sur disque, attendus calculés sur `nb_annees` années précédentes)."""
+    return surmortalite(SeriesMensuelles(base_dir).charger(), nb_annees=nb_annees)
+
+
+@st.cache_resource(show_spinner=False)
+def get_explorer(base_dir, version):
+    """Explorateur paginé (tri / filtre / page exécutés en SQL sur les fichiers), blocs récents partagés entre sessions."""
+    return Explorateur(get_sql(base_dir))
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_index(base_dir, version):
+    """Index de recherche de personnes (segments projetés en mémoire), ouvert une fois par version du jeu."""
+    return IndexRecherche(base_dir)
+
+
+def etiquettes(codes, libelle):
+    """Libellés d’une colonne de codes, calculés une fois par valeur distincte (table de correspondance)."""
+    table = {code: libelle(code) for code in codes.unique()}
+    return codes.map(table)
 
 
 # ---------------------------------------------------------------------
+@profiler("deces.render")
 def render():
     st.header("📊 Décès — Analyse interactive")
     st.caption("Source : INSEE / data.gouv.fr")
 
-    # === Charger la liste des années disponibles ===
-    years, data_dir = list_available_years()
+    # === Années disponibles (registre des jeux : noms des partitions, sans lire de données) ===
+    years = annees("deces")
+    data_dir = jeu("deces").dossier
     if not years:
         st.error("Aucun fichier Parquet trouvé dans data_processed/deces/")
         return
@@ -53,152 +216,165 @@ def render():
         st.warning("Sélectionne au moins une année.")
         return
 
-    # === Chargement ciblé des fichiers ===
-    df = load_data_by_years(selected_years, data_dir)
-    if df.empty:
-        st.warning("Aucune donnée chargée pour ces années.")
-        return
-
-    # === Nettoyage rapide ===
-    df = df.dropna(subset=["age_deces", "sexe", "annee_deces"])
-    df["sexe"] = df["sexe"].astype(str)
-
-    # === Autres filtres ===
-    sexes = sorted(df["sexe"].unique())
+    # === Autres filtres (valeurs lues dans les partitions, sans charger de données) ===
+    sexes = valeurs("deces", "sexe")
     sexe_sel = st.sidebar.multiselect("Sexes", sexes, default=sexes)
-    age_min, age_max = int(df["age_deces"].min()), int(df["age_deces"].max())
     age_range = st.sidebar.slider("Tranche d’âge", 0, 150, (0, 155))
 
-    filtre = df[
-        (df["sexe"].isin(sexe_sel)) &
-        (df["age_deces"].between(age_range[0], age_range[1]))
-    ]
+    # === Figures du cube d’agrégats (servies par le cache de figures si cet état de filtres est déjà connu) ===
+    entree = load_figures(selected_years, data_dir, sexe_sel, age_range)
+    if not entree["nb_deces"]:
+        st.warning("Aucune donnée chargée pour ces années.")
+        return
+    figures = entree["figures"]
 
-    st.success(f"✅ {len(filtre):,} lignes chargées depuis {len(selected_years)} année(s).")
+    st.success(f"✅ {entree['nb_deces']:,} décès agrégés depuis {len(selected_years)} année(s).")
 
     # -----------------------------------------------------------------
     # 📊 Histogramme âge
     st.subheader("Répartition de l'âge au décès")
-    fig_age = px.histogram(
-        filtre,
-        x="age_deces",
-        nbins=80,
-        color="sexe",
-        barmode="overlay",
-        color_discrete_map={"1": "DodgerBlue", "2": "LightCoral"},
-        title=f"Distribution de l'âge au décès ({min(selected_years)}–{max(selected_years)})"
-    )
-    st.plotly_chart(fig_age, use_container_width=True)
+    st.plotly_chart(figures["age"], use_container_width=True)
 
     # -----------------------------------------------------------------
     # 📈 Décès par mois et par sexe
     st.subheader("Nombre de décès par mois et par sexe")
+    st.plotly_chart(figures["mois"], use_container_width=True)
 
-    if "mois_deces" in filtre.columns and "annee_deces" in filtre.columns:
-        # Créer un identifiant unique "année-mois" pour l’axe X
-        filtre["annee_mois"] = (
-                filtre["annee_deces"].astype(str) + "-" + filtre["mois_deces"].astype(int).astype(str).str.zfill(2)
-        )
-
-        # Agréger le nombre de décès par mois et sexe
-        data_mois = (
-            filtre.groupby(["annee_mois", "sexe"], as_index=False)
-                .size()
-                .rename(columns={"size": "nb_deces"})
-        )
-
-        # Créer un histogramme Plotly
-        fig_mois = px.bar(
-            data_mois,
-            x="annee_mois",
-            y="nb_deces",
-            color="sexe",
-            barmode="group",  # ou "stack" selon préférence
-            color_discrete_map={"1": "DodgerBlue", "2": "LightCoral"},
-            title="Nombre de décès par mois et par sexe (2020–2024)",
-            labels={"annee_mois": "Mois", "nb_deces": "Nombre de décès", "sexe": "Sexe"}
-        )
-
-        # Mise en forme de l’axe
-        fig_mois.update_layout(
-            xaxis_title="Période (AAAA-MM)",
-            yaxis_title="Décès mensuels",
-            xaxis_tickangle=-45,
-            bargap=0.05,
-            hovermode="x unified"
-        )
-
-        st.plotly_chart(fig_mois, use_container_width=True)
-
-    else:
-        st.warning("Les colonnes 'annee_deces' et 'mois_deces' sont nécessaires pour cette visualisation.")
+    # -----------------------------------------------------------------
+    # 📉 Décès par semaine (requête SQL sur les fichiers Parquet)
+    st.subheader("Nombre de décès par semaine")
+    data_semaine = load_weekly(selected_years, data_dir, sexe_sel, version_jeu(data_dir))
+    fig_semaine = px.line(
+        data_semaine,
+        x="semaine",
+        y="nb_deces",
+        labels={"semaine": "Semaine", "nb_deces": "Nombre de décès"},
+        title="Décès hebdomadaires (semaines ISO)"
+    )
+    fig_semaine.update_layout(hovermode="x unified")
+    st.plotly_chart(fig_semaine, use_container_width=True)
 
     # -----------------------------------------------------------------
-    # 📦 Boxplot âge/sexe
+    # 📦 Boxplot âge/sexe (quartiles et moustaches calculés côté serveur, pondérés par le cube)
     st.subheader("Distribution de l’âge au décès par sexe")
-    fig_box = px.box(
-        filtre,
-        x="sexe",
-        y="age_deces",
-        color="sexe",
-        color_discrete_map={"1": "DodgerBlue", "2": "LightCoral"},
-        points=False,
-        title="Distribution de l’âge au décès par sexe"
-    )
-    st.plotly_chart(fig_box, use_container_width=True)
+    st.plotly_chart(figures["boite"], use_container_width=True)
 
     # -----------------------------------------------------------------
     # 📅 Saisonnalité mensuelle explicite
-    if "mois_deces" in filtre.columns:
-        st.subheader("📅 Saisonnalité mensuelle des décès (2020–2024)")
-        st.caption("Analyse de la répartition des décès selon les mois de l'année — toutes années confondues.")
-
-        # Noms des mois en français
-        mois_labels = {
-            1: "Janvier", 2: "Février", 3: "Mars", 4: "Avril",
-            5: "Mai", 6: "Juin", 7: "Juillet", 8: "Août",
-            9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Décembre"
-        }
-        filtre["mois_nom"] = filtre["mois_deces"].astype(int).map(mois_labels)
-
-        # Ordre chronologique
-        ordre_mois = list(mois_labels.values())
-        filtre["mois_nom"] = pd.Categorical(filtre["mois_nom"], categories=ordre_mois, ordered=True)
-
-        # Histogramme des décès par mois et sexe
-        fig_month = px.histogram(
-            filtre,
-            x="mois_nom",
-            color="sexe",
-            barmode="stack",
-            category_orders={"mois_nom": ordre_mois},
-            color_discrete_map={"1": "DodgerBlue", "2": "LightCoral"},
-            labels={"mois_nom": "Mois de décès", "sexe": "Sexe"},
-            title="Répartition mensuelle des décès par sexe (2020–2024)"
-        )
+    st.subheader("📅 Saisonnalité mensuelle des décès (2020–2024)")
+    st.caption("Analyse de la répartition des décès selon les mois de l'année — toutes années confondues.")
+    st.plotly_chart(figures["saison"], use_container_width=True)
+
+    # Commentaire contextuel
+    st.markdown(
+        """
+        🔍 **Interprétation :**
+        - Aucune pour le moment ...
+        """
+    )
 
-        fig_month.update_layout(
-            xaxis_title="Mois de l'année",
-            yaxis_title="Nombre total de décès",
-            bargap=0.05,
+    # -----------------------------------------------------------------
+    # 📈 Surmortalité : décès observés / attendus (même mois des années précédentes)
+    st.subheader("📈 Surmortalité mensuelle")
+    nb_annees_ref = st.slider("Années de référence pour les décès attendus", 2, 10, 5)
+    exces = load_excess(data_dir, version_jeu(data_dir), nb_annees_ref)
+    exces = exces[exces["annee_deces"].isin(selected_years) & exces["sexe"].isin(sexe_sel)]
+    if exces.empty:
+        st.info("Pas assez d’années antérieures aux années sélectionnées pour estimer les décès attendus.")
+    else:
+        data_exces = agreger_surmortalite(exces, ["annee_deces", "mois_deces"])
+        codes_exces = data_exces["annee_deces"].astype(int) * 100 + data_exces["mois_deces"].astype(int)
+        data_exces["annee_mois"] = etiquettes(codes_exces, lambda code: f"{code // 100}-{code % 100:02d}")
+        haut = data_exces["attendus"] + 2 * data_exces["ecart_type"]
+        bas = data_exces["attendus"] - 2 * data_exces["ecart_type"]
+
+        fig_exces = go.Figure([
+            go.Scatter(x=data_exces["annee_mois"], y=haut, line_width=0, showlegend=False, hoverinfo="skip"),
+            go.Scatter(x=data_exces["annee_mois"], y=bas, line_width=0, fill="tonexty", fillcolor="rgba(128,128,128,0.2)",
+                       name="Attendus ± 2 écarts-types", hoverinfo="skip"),
+            go.Scatter(x=data_exces["annee_mois"], y=data_exces["attendus"], line_color="gray", line_dash="dash", name="Attendus"),
+            go.Scatter(x=data_exces["annee_mois"], y=data_exces["observes"], line_color="black", name="Observés",
+                       customdata=data_exces[["exces", "z"]], hovertemplate="%{y:,.0f} décès (excès %{customdata[0]:+,.0f}, z = %{customdata[1]:.1f})"),
+        ])
+        fig_exces.update_layout(
+            xaxis_title="Période (AAAA-MM)",
+            yaxis_title="Décès mensuels",
+            xaxis_tickangle=-45,
             hovermode="x unified",
-            legend_title="Sexe",
-            xaxis_tickangle=-30,
+            title=f"Décès observés et attendus (moyenne des {nb_annees_ref} années précédentes)"
         )
-
-        st.plotly_chart(fig_month, use_container_width=True)
-
-        # Commentaire contextuel
-        st.markdown(
-            """
-            🔍 **Interprétation :**
-            - Aucune pour le moment ...
-            """
+        st.plotly_chart(fig_exces, use_container_width=True)
+        st.caption("Sexes sélectionnés, tous âges (âges connus). Un mois hors de la bande grise (|z| > 2) est inhabituel.")
+
+        # Même période, par tranche d’âge (tranches de la série mensuelle)
+        data_tranches = agreger_surmortalite(exces, ["tranche_age"])
+        data_tranches["tranche"] = data_tranches["tranche_age"].map(dict(enumerate(libelles_tranches())))
+        fig_tranches = px.bar(
+            data_tranches,
+            x="tranche",
+            y="exces",
+            color="z",
+            color_continuous_scale="RdBu_r",
+            color_continuous_midpoint=0,
+            category_orders={"tranche": libelles_tranches()},
+            labels={"tranche": "Tranche d’âge", "exces": "Excès de décès (observés − attendus)", "z": "z"},
+            title="Surmortalité par tranche d’âge sur les années sélectionnées",
         )
+        st.plotly_chart(fig_tranches, use_container_width=True)
+
+    # -----------------------------------------------------------------
+    # 🗺️ Carte par département / région du lieu de décès (contours pré-simplifiés, voir main_geo.py)
+    st.subheader("🗺️ Décès par lieu de décès")
+    col_niveau, col_zoom = st.columns(2)
+    niveau = col_niveau.radio("Niveau", ["departement", "region"], format_func=str.capitalize, horizontal=True)
+    zoom = col_zoom.select_slider("Détail des contours", list(ZOOMS), value="moyen")
+    couche = charger_couche(niveau, zoom)
+    if couche is None:
+        st.info("Couches géographiques absentes : les construire avec `python main_geo.py --contours …`.")
     else:
-        st.warning("Les colonnes 'mois_deces' sont nécessaires pour l'analyse de saisonnalité.")
+        cube = load_cube(selected_years, data_dir, sexe_sel, age_range)
+        data_carte = compter(cube, ["departement_deces"])
+        if niveau == "region":
+            # Départements du cube rattachés par le référentiel COG (communes fusionnées comprises) : région exacte
+            data_carte["region"] = region(pa.array(data_carte["departement_deces"].astype(str))).to_pandas()
+            data_carte = data_carte.groupby("region", as_index=False)["nb_deces"].sum()
+        colonne = "departement_deces" if niveau == "departement" else "region"
+        fig_carte = carte_choroplethe(data_carte, colonne, "nb_deces", couche, "Décès par " + ("département" if niveau == "departement" else "région"))
+        st.plotly_chart(fig_carte, use_container_width=True)
 
     # -----------------------------------------------------------------
     # 📋 Échantillon de données
-    with st.expander("Voir un aperçu des données"):
-        st.dataframe(filtre.head(1000), use_container_width=True)
+    with st.expander("Explorer les données"):
+        explorateur = get_explorer(data_dir, version_jeu(data_dir))
+        col_tri, col_ordre, col_taille = st.columns(3)
+        tri = col_tri.selectbox("Trier par", COLONNES_EXPLORATEUR, index=COLONNES_EXPLORATEUR.index("date_deces"))
+        decroissant = col_ordre.radio("Ordre", ["Croissant", "Décroissant"], horizontal=True) == "Décroissant"
+        taille = col_taille.selectbox("Lignes par page", TAILLES_PAGE, index=1)
+        col_colonne, col_texte = st.columns([1, 2])
+        colonne_texte = col_colonne.selectbox("Filtrer la colonne", COLONNES_EXPLORATEUR)
+        texte = col_texte.text_input("Contient")
+
+        criteres = dict(
+            annees=selected_years, sexes=sexe_sel, age_min=age_range[0], age_max=age_range[1],
+            colonne_texte=colonne_texte, texte=texte.strip() or None,
+        )
+        total = explorateur.compter(**criteres)
+        nb_pages = max(1, -(-total // taille))
+        page = st.number_input(f"Page (sur {nb_pages:,})".replace(",", " "), min_value=1, max_value=nb_pages, value=1)
+        lignes = explorateur.page(page - 1, taille, tri, decroissant, **criteres)
+        st.dataframe(lignes, use_container_width=True, hide_index=True)
+        debut = (page - 1) * taille
+        st.caption(f"Lignes {debut + min(1, len(lignes)):,} à {debut + len(lignes):,} sur {total:,}".replace(",", " "))
+
+    # -----------------------------------------------------------------
+    # 🔎 Recherche d’une personne (toutes années, index construit à la conversion)
+    with st.expander("🔎 Rechercher une personne décédée"):
+        col_nom, col_prenom = st.columns(2)
+        nom = col_nom.text_input("Nom")
+        prenom = col_prenom.text_input("Prénom(s)")
+        contient = st.checkbox("Le nom contient le texte saisi (3 lettres minimum)")
+        if nom or prenom:
+            index = get_search_index(data_dir, version_jeu(data_dir))
+            resultats = index.chercher(nom, prenom, contient=contient, limite=LIMITE_RECHERCHE)
+            st.caption(f"{len(resultats)} personne(s) trouvée(s) parmi {len(index):,} (au plus {LIMITE_RECHERCHE}).")
+            st.dataframe(resultats, use_container_width=True)
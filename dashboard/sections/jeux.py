@@ -0,0 +1,56 @@
+# Lectures des jeux du registre (`utils/registre.py`) pour toutes les sections, avec caches partagés :
+# la version du jeu fait partie de la clé, une nouvelle conversion invalide les entrées.
+import streamlit as st
+from utils.cache import CacheAnnees
+from utils.registre import jeu
+from utils.schema import table_vers_pandas
+
+
+# ---------------------------------------------------------------------
+@st.cache_data(show_spinner=False)
+def _annees(nom, version):
+    return jeu(nom).annees()
+
+
+def annees(nom):
+    """Années disponibles (noms des partitions, sans lire de données)."""
+    return _annees(nom, jeu(nom).version())
+
+
+@st.cache_data(show_spinner=False)
+def _valeurs(nom, cle, version):
+    return jeu(nom).valeurs(cle)
+
+
+def valeurs(nom, cle):
+    """Valeurs d’une clé de partition (ex: sexe)."""
+    return _valeurs(nom, cle, jeu(nom).version())
+
+
+# ---------------------------------------------------------------------
+@st.cache_data(show_spinner=False, max_entries=256)
+def _compter(nom, version, dimensions, valeurs, bornes):
+    return jeu(nom).compter(dimensions, valeurs, bornes)
+
+
+def compter(nom, dimensions, valeurs=None, bornes=None):
+    """Comptages par dimensions (seules ces colonnes sont lues), partagés par toutes les sessions."""
+    return _compter(nom, jeu(nom).version(), list(dimensions), valeurs, bornes)
+
+
+@st.cache_resource(show_spinner=False)
+def cache_annees(nom):
+    """
+    Cache par année du jeu (fichiers Arrow projetés en mémoire, budget `DASHBOARD_CACHE_BUDGET_MO`),
+    partagé par toutes les sessions du processus ; il suit lui-même la version du jeu.
+    """
+    return CacheAnnees(jeu(nom))
+
+
+def charger(nom, colonnes, valeurs=None, bornes=None, limite=None):
+    """
+    Lignes filtrées et projetées, assemblées depuis le cache par année (une seule copie de chaque année,
+    quelle que soit la combinaison de filtres) ; préférer `compter` pour un graphique.
+    """
+    table = cache_annees(nom).selection(valeurs=valeurs, bornes=bornes, colonnes=list(colonnes), limite=limite)
+    return table_vers_pandas(table, jeu(nom).colonnes_categorielles)
@@ -0,0 +1,117 @@
+import streamlit as st
+import plotly.express as px
+
+from utils.geo import charger_couche
+from utils.logger import profiler
+from utils.plot_utils import carte_choroplethe
+
+from .jeux import annees, compter
+
+# Libellés et couleurs par sexe de l’enfant
+LIBELLES_SEXE = {"1": "Garçons", "2": "Filles"}
+COULEURS_SEXE = {"Garçons": "DodgerBlue", "Filles": "LightCoral"}
+
+# Noms des mois en français
+MOIS_LABELS = {
+    1: "Janvier", 2: "Février", 3: "Mars", 4: "Avril",
+    5: "Mai", 6: "Juin", 7: "Juillet", 8: "Août",
+    9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Décembre"
+}
+
+
+def libeller_sexe(data):
+    """Remplace le code du sexe de l’enfant par son libellé (colonne `sexe`)."""
+    data = data.dropna(subset=["sexe_enfant"])
+    return data.assign(sexe=data["sexe_enfant"].map(LIBELLES_SEXE).fillna(data["sexe_enfant"])).drop(columns="sexe_enfant")
+
+
+# ---------------------------------------------------------------------
+@profiler("naissance.render")
+def render():
+    st.header("👶 Naissances — Analyse interactive")
+    st.caption("Source : INSEE, fichier détail des naissances")
+
+    # === Années disponibles (registre des jeux : noms des partitions, sans lire de données) ===
+    years = annees("naissances")
+    if not years:
+        st.error("Aucune année dans data_processed/naissances/ : ingérer les fichiers INSEE avec `python main_convert.py --jeu naissances`.")
+        return
+
+    # --- Sidebar ---
+    st.sidebar.subheader("Filtres naissances")
+    selected_years = st.sidebar.multiselect("Années de naissance", years, default=[max(years)])
+    if not selected_years:
+        st.warning("Sélectionne au moins une année.")
+        return
+    filtres = {"annee_naissance": selected_years}
+
+    # -----------------------------------------------------------------
+    # 📈 Naissances par mois et par sexe (comptages lus colonne par colonne, partagés par les sessions)
+    data_mois = libeller_sexe(compter("naissances", ["annee_naissance", "mois_naissance_enfant", "sexe_enfant"], filtres))
+    data_mois = data_mois.dropna(subset=["mois_naissance_enfant"])
+    st.success(f"✅ {int(data_mois['nombre'].sum()):,} naissances sur {len(selected_years)} année(s).")
+
+    st.subheader("Nombre de naissances par mois et par sexe")
+    data_mois["annee_mois"] = (
+        data_mois["annee_naissance"].astype(int).astype(str) + "-"
+        + data_mois["mois_naissance_enfant"].astype(int).map("{:02d}".format)
+    )
+    fig_mois = px.bar(
+        data_mois,
+        x="annee_mois",
+        y="nombre",
+        color="sexe",
+        barmode="group",
+        color_discrete_map=COULEURS_SEXE,
+        labels={"annee_mois": "Période (AAAA-MM)", "nombre": "Naissances", "sexe": "Sexe"},
+    )
+    fig_mois.update_layout(xaxis_tickangle=-45, bargap=0.05, hovermode="x unified")
+    st.plotly_chart(fig_mois, use_container_width=True)
+
+    # -----------------------------------------------------------------
+    # 📅 Saisonnalité
+    st.subheader("📅 Saisonnalité mensuelle des naissances")
+    data_saison = data_mois.groupby(["mois_naissance_enfant", "sexe"], as_index=False)["nombre"].sum()
+    data_saison["mois_nom"] = data_saison["mois_naissance_enfant"].astype(int).map(MOIS_LABELS)
+    fig_saison = px.bar(
+        data_saison,
+        x="mois_nom",
+        y="nombre",
+        color="sexe",
+        barmode="stack",
+        category_orders={"mois_nom": list(MOIS_LABELS.values())},
+        color_discrete_map=COULEURS_SEXE,
+        labels={"mois_nom": "Mois de naissance", "nombre": "Naissances", "sexe": "Sexe"},
+    )
+    st.plotly_chart(fig_saison, use_container_width=True)
+
+    # -----------------------------------------------------------------
+    # 👩 Âge de la mère
+    st.subheader("Âge de la mère à l’accouchement")
+    data_age = compter("naissances", ["age_mere"], filtres).dropna(subset=["age_mere"])
+    fig_age = px.bar(
+        data_age,
+        x="age_mere",
+        y="nombre",
+        labels={"age_mere": "Âge de la mère (âge atteint dans l’année)", "nombre": "Naissances"},
+    )
+    fig_age.update_layout(bargap=0.05)
+    st.plotly_chart(fig_age, use_container_width=True)
+    st.caption("17 : 17 ans ou moins ; 46 : 46 ans ou plus (modalités INSEE).")
+
+    # -----------------------------------------------------------------
+    # 🗺️ Département de naissance
+    st.subheader("🗺️ Naissances par département")
+    data_dep = compter("naissances", ["dep_naissance_enfant"], filtres).dropna(subset=["dep_naissance_enfant"])
+    couche = charger_couche("departement")
+    if couche is None:
+        fig_dep = px.bar(
+            data_dep.nlargest(20, "nombre"),
+            x="dep_naissance_enfant",
+            y="nombre",
+            labels={"dep_naissance_enfant": "Département", "nombre": "Naissances"},
+            title="20 premiers départements de naissance",
+        )
+    else:
+        fig_dep = carte_choroplethe(data_dep, "dep_naissance_enfant", "nombre", couche, "Naissances par département")
+    st.plotly_chart(fig_dep, use_container_width=True)
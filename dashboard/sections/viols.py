@@ -0,0 +1,99 @@
+import streamlit as st
+import plotly.express as px
+
+from utils.geo import charger_couche
+from utils.logger import profiler
+from utils.plot_utils import carte_choroplethe
+
+from .jeux import annees, charger, compter
+
+# Indicateur SSMSI proposé par défaut (premier libellé qui le contient)
+MOT_INDICATEUR = "sexuel"
+
+
+def indicateur_defaut(indicateurs):
+    """Position de l’indicateur par défaut : le premier qui mentionne les violences sexuelles, sinon le premier."""
+    for position, indicateur in enumerate(indicateurs):
+        if MOT_INDICATEUR in indicateur.lower():
+            return position
+    return 0
+
+
+# ---------------------------------------------------------------------
+@profiler("viols.render")
+def render():
+    st.header("⚖️ Violences sexuelles — Faits enregistrés")
+    st.caption("Source : SSMSI, base départementale de la délinquance enregistrée par la police et la gendarmerie")
+
+    # === Années disponibles (registre des jeux : noms des partitions, sans lire de données) ===
+    years = annees("violences")
+    if not years:
+        st.error(
+            "Aucune année dans data_processed/violences/ : déposer la base départementale SSMSI (CSV) "
+            "dans data_processed/violences puis `python main_convert.py --jeu violences`."
+        )
+        return
+
+    # --- Sidebar ---
+    st.sidebar.subheader("Filtres violences")
+    indicateurs = compter("violences", ["indicateur"])["indicateur"].dropna().tolist()
+    indicateur = st.sidebar.selectbox("Indicateur", indicateurs, index=indicateur_defaut(indicateurs))
+    debut, fin = st.sidebar.select_slider("Années", options=years, value=(min(years), max(years)))
+    filtres = {"indicateur": [indicateur]}
+    bornes = {"annee": (debut, fin)}
+
+    # Une ligne par (année, département) : lue depuis le cache par année, partagé par les sessions
+    data = charger(
+        "violences",
+        ["annee", "code_departement", "unite_de_compte", "nombre", "taux_pour_mille", "population"],
+        filtres,
+        bornes,
+    )
+    if data.empty:
+        st.warning("Aucun fait enregistré pour cet indicateur sur la période.")
+        return
+    unites = data["unite_de_compte"].dropna().unique().tolist()
+    st.success(f"✅ {int(data['nombre'].sum()):,} faits ({indicateur}) de {debut} à {fin}.")
+    if unites:
+        st.caption(f"Unité de compte : {', '.join(unites)}.")
+
+    # -----------------------------------------------------------------
+    # 📈 Évolution nationale (taux rapporté à la population des départements renseignés)
+    st.subheader("Évolution annuelle")
+    data_annee = data.groupby("annee", as_index=False)[["nombre", "population"]].sum()
+    data_annee["taux_pour_mille"] = 1000 * data_annee["nombre"] / data_annee["population"].where(data_annee["population"] > 0)
+    fig_annee = px.bar(
+        data_annee,
+        x="annee",
+        y="nombre",
+        hover_data={"taux_pour_mille": ":.2f"},
+        labels={"annee": "Année", "nombre": "Faits enregistrés", "taux_pour_mille": "Taux pour 1 000 habitants"},
+    )
+    fig_annee.update_layout(bargap=0.1)
+    st.plotly_chart(fig_annee, use_container_width=True)
+
+    # -----------------------------------------------------------------
+    # 🗺️ Taux par département (dernière année retenue)
+    st.subheader(f"🗺️ Taux pour 1 000 habitants par département ({fin})")
+    data_dep = data[data["annee"] == fin].dropna(subset=["code_departement", "taux_pour_mille"])
+    couche = charger_couche("departement")
+    if couche is None:
+        fig_dep = px.bar(
+            data_dep.nlargest(20, "taux_pour_mille"),
+            x="code_departement",
+            y="taux_pour_mille",
+            labels={"code_departement": "Département", "taux_pour_mille": "Taux pour 1 000 habitants"},
+            title="20 départements aux taux les plus élevés",
+        )
+    else:
+        fig_dep = carte_choroplethe(
+            data_dep, "code_departement", "taux_pour_mille", couche, "Taux pour 1 000 habitants", couleurs="Purples"
+        )
+    st.plotly_chart(fig_dep, use_container_width=True)
+
+    with st.expander("Données par département"):
+        st.dataframe(
+            data_dep.sort_values("taux_pour_mille", ascending=False)[["code_departement", "nombre", "population", "taux_pour_mille"]],
+            use_container_width=True,
+            hide_index=True,
+        )
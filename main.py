@@ -1,6 +1,6 @@
 import sys
-from utils.loader import lire_fichier_naissances
 from utils.logger import Logger
+from utils.registre import jeu
 
 LOG = Logger("main.log")
 
@@ -10,10 +10,14 @@ def main() -> int:
 
     try:
         LOG.info("Bienvenue")
-        df = lire_fichier_naissances("./data_processed/naissances/naissances_2022.parquet")
+        naissances = jeu("naissances")
+        if not naissances.fichiers():
+            LOG.warning(f"Jeu naissances vide : ingestion des fichiers bruts de {naissances.dossier_source}")
+            naissances.convertir()
+        df = naissances.charger()
         print(df)
     except Exception as e:
-        LOG.error("FERMETURE FORCE - ", {e})
+        LOG.error(f"FERMETURE FORCE - {e}")
         return 1
     finally:
         LOG.info("Fin de l’exécution.")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d’essai du chargeur sur des données INSEE synthétiques :
+temps, débit (lignes/s) et pic mémoire de chaque étape, enregistrés en JSON.
+
+À exécuter depuis la racine du projet :
+    python main_bench.py [--lignes 1000000] [--sortie bench.json] [--comparer bench_avant.json]
+"""
+
+import sys
+import json
+import shutil
+import platform
+import argparse
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from benchmarks.etapes import ETAPES, comparer, generer_jeu, mesurer_etape
+from utils.logger import Logger
+
+LOG = Logger("bench.log")
+
+
+def _commit_git() -> str | None:
+    resultat = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+    return resultat.stdout.strip() or None
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Banc d’essai du chargeur sur données synthétiques")
+    parser.add_argument("--lignes", type=int, default=1_000_000, help="nombre total de décès générés (1M à 30M)")
+    parser.add_argument(
+        "--annees", type=int, nargs="+", default=[2021, 2022, 2023],
+        help="années générées ; les lignes sont réparties entre elles (défaut : 2021 2022 2023)",
+    )
+    parser.add_argument("--etapes", nargs="+", choices=list(ETAPES), default=list(ETAPES), help="étapes mesurées")
+    parser.add_argument("--dossier", type=Path, default=None, help="dossier de travail (défaut : dossier temporaire)")
+    parser.add_argument("--sortie", type=Path, default=None, help="fichier JSON des résultats")
+    parser.add_argument("--comparer", type=Path, default=None, help="résultats JSON d’une exécution précédente")
+    args = parser.parse_args()
+
+    dossier = args.dossier or Path(tempfile.mkdtemp(prefix="bench-deces-"))
+    try:
+        LOG.info(f"🚀 Génération de {args.lignes:_} décès synthétiques ({', '.join(map(str, args.annees))}) dans {dossier}")
+        generer_jeu(dossier, args.lignes, args.annees)
+
+        etapes = []
+        for nom in ETAPES:
+            if nom not in args.etapes and nom != "convert_to_parquet":
+                continue
+            # La conversion produit le jeu lu par les étapes suivantes : elle tourne toujours
+            mesure = mesurer_etape(nom, dossier)
+            LOG.info(
+                f"{nom:<28} {mesure['secondes']:>8.2f} s  {mesure['lignes_par_s'] or 0:>12_} lignes/s  "
+                f"{mesure['memoire_max_mo']:>8.0f} Mo"
+            )
+            if nom in args.etapes:
+                etapes.append(mesure)
+
+        resultats = {
+            "commit": _commit_git(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "lignes": args.lignes,
+            "annees": args.annees,
+            "etapes": etapes,
+        }
+        if args.sortie:
+            args.sortie.write_text(json.dumps(resultats, indent=2, ensure_ascii=False), encoding="utf-8")
+            LOG.info(f"Résultats écrits dans {args.sortie}")
+
+        if args.comparer:
+            reference = json.loads(args.comparer.read_text(encoding="utf-8"))
+            if reference["lignes"] != args.lignes:
+                LOG.warning(f"Volumes différents ({reference['lignes']:_} vs {args.lignes:_}) : comparaison indicative.")
+            tableau = comparer(resultats, reference)
+            print(tableau.to_string(index=False))
+            if tableau["regression"].any():
+                LOG.warning(f"Régression par rapport à {reference.get('commit')} : {', '.join(tableau.loc[tableau['regression'], 'etape'])}")
+                return 1
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        if args.dossier is None:
+            shutil.rmtree(dossier, ignore_errors=True)
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
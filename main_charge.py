@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test de charge du tableau de bord : N sessions simultanées changent les filtres de la section Décès
+(scénario aléatoire reproductible) ; latence des réexécutions (p50 / p95), mémoire du serveur et
+succès des caches, enregistrés en JSON.
+
+À exécuter depuis la racine du projet (le serveur lit `data_processed/` dans le répertoire courant) :
+    python main_charge.py [--sessions 10] [--actions 20] [--sortie logs/charge.json]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from benchmarks.charge import charge, formater_rapport
+from utils.logger import Logger, demarrer_execution
+
+LOG = Logger("charge.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Test de charge du tableau de bord (sessions simultanées)")
+    parser.add_argument("--sessions", type=int, default=10, help="nombre de sessions simultanées")
+    parser.add_argument("--actions", type=int, default=20, help="changements de filtres par session")
+    parser.add_argument("--pause", type=float, default=0.5, help="temps de réflexion moyen entre deux actions (s)")
+    parser.add_argument("--montee", type=float, default=5.0, help="durée d’arrivée des sessions (s)")
+    parser.add_argument("--section", default="Décès", help="section jouée")
+    parser.add_argument("--port", type=int, default=8599, help="port du serveur lancé pour le test")
+    parser.add_argument("--graine", type=int, default=0, help="graine du scénario")
+    parser.add_argument("--sortie", type=Path, default=None, help="fichier JSON du rapport")
+    parser.add_argument("--p95-max-ms", type=float, default=None, help="code 1 si la latence p95 dépasse ce seuil")
+    args = parser.parse_args()
+
+    try:
+        execution = demarrer_execution()
+        LOG.info(f"🚀 {args.sessions} sessions × {args.actions} actions sur la section « {args.section} » (exécution {execution})")
+        rapport = charge(
+            nb_sessions=args.sessions,
+            nb_actions=args.actions,
+            pause_s=args.pause,
+            montee_s=args.montee,
+            section=args.section,
+            port=args.port,
+            graine=args.graine,
+            execution=execution,
+        )
+        print(formater_rapport(rapport))
+
+        if args.sortie:
+            args.sortie.write_text(json.dumps(rapport, indent=2, ensure_ascii=False), encoding="utf-8")
+            LOG.info(f"Rapport écrit dans {args.sortie}")
+
+        if rapport["erreurs"]:
+            LOG.warning(f"{rapport['erreurs']} réexécution(s) en erreur pendant le test")
+            return 1
+        if args.p95_max_ms is not None and rapport["latence"] and rapport["latence"]["p95_ms"] > args.p95_max_ms:
+            LOG.warning(f"Latence p95 {rapport['latence']['p95_ms']:.0f} ms > {args.p95_max_ms:.0f} ms")
+            return 1
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Script de conversion massive des fichiers décès INSEE
-TXT → Parquet optimisé.
+Script de conversion massive des fichiers INSEE bruts vers le stockage Parquet optimisé
+d’un jeu du registre (`utils/registre.py`) : décès (TXT → Parquet partitionné) par défaut, naissances…
 
 À exécuter depuis la racine du projet :
-    python main_convert.py
+    python main_convert.py [--jeu deces] [--source DOSSIER] [--workers N] [--profil]
 """
 
+import os
+import argparse
 from pathlib import Path
-from utils.loader import convert_to_parquet
-from utils.logger import Logger
+from utils.registre import JEUX, jeu
+from utils.logger import Logger, demarrer_execution, lire_metriques, resume_metriques
 
 LOG = Logger("convert_main.log")
 
@@ -18,18 +20,32 @@ LOG = Logger("convert_main.log")
 #####################################################################
 def main():
 
+    parser = argparse.ArgumentParser(description="Conversion des fichiers INSEE bruts → Parquet")
+    parser.add_argument("--jeu", choices=list(JEUX), default="deces", help="jeu converti (défaut : deces)")
+    parser.add_argument(
+        "--source", type=Path, default=None,
+        help="dossier des fichiers bruts (défaut : dossier source déclaré par le jeu)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="nombre de fichiers convertis en parallèle (défaut : nombre de cœurs)",
+    )
+    parser.add_argument(
+        "--profil", action="store_true",
+        help="affiche en fin de conversion le résumé des étapes mesurées (logs/metrics.jsonl)",
+    )
+    args = parser.parse_args()
+    execution = demarrer_execution()
+
     try:
-        # Dossiers d’entrée et de sortie
-        source_dir = Path("data_processed/deces")
-        output_dir = Path("data_processed/deces")
+        # Dossiers d’entrée et de sortie, format source et convertisseur : déclarés par le jeu
+        # (⚠️ les .txt décès sont supprimés après conversion, voir `supprimer_sources`)
+        donnees = jeu(args.jeu)
+        output_dir = donnees.dossier
 
-        LOG.info("🚀 Démarrage de la conversion massive INSEE (TXT → Parquet)")
+        LOG.info(f"🚀 Démarrage de la conversion massive INSEE ({donnees.libelle} : {donnees.format_source} → Parquet)")
 
-        convert_to_parquet(
-            source_dir=source_dir,
-            output_dir=output_dir,
-            delete_original=True,  # ⚠️ Mets True si tu veux supprimer les .txt après conversion
-        )
+        donnees.convertir(args.source, workers=args.workers)
 
     except Exception as e:
         LOG.error(f"FERMETURE FORCE - {e}")
@@ -37,6 +53,8 @@ def main():
     else:
         LOG.info("✅ Conversion terminée avec succès.")
         LOG.info(f"Fichiers Parquet disponibles dans : {output_dir.resolve()}")
+        if args.profil:
+            print(resume_metriques(lire_metriques(execution)))
     finally:
         LOG.separator()
 
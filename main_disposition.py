@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapport avant / après sur la disposition physique des fichiers Parquet décès :
+taille sur disque, temps de conversion et temps de lecture de requêtes types,
+avec les options Parquet par défaut (« avant ») puis triées et réglées (« après », voir `EcrivainPartitions`).
+
+À exécuter depuis la racine du projet, sur de vrais fichiers annuels :
+    python main_disposition.py dashboard/assets/data/deces/deces-2023.txt [--sortie logs/disposition.json]
+ou sur des données synthétiques :
+    python main_disposition.py --lignes 1000000
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import pandas as pd
+from datetime import date
+from pathlib import Path
+from benchmarks.synthetique import generer_deces
+from utils.loader import dataset_deces, ecrire_deces_partitionne
+from utils.logger import Logger
+from utils.registre import jeu
+
+LOG = Logger("bench.log")
+
+
+def _taille_mo(dossier: Path) -> float:
+    return sum(f.stat().st_size for f in dossier.rglob("*.parquet") if not f.relative_to(dossier).parts[0].startswith("_")) / 1024 / 1024
+
+
+def _requetes(dossier: Path) -> dict:
+    """
+    Requêtes types (filtre, colonnes) ; les bornes viennent du jeu lui-même (première année, lieu le plus fréquent).
+    """
+    dataset = dataset_deces(dossier)
+    echantillon = dataset.head(100_000, columns=["annee_deces", "code_lieu_deces"]).to_pandas()
+    annee = int(echantillon["annee_deces"].dropna().min())
+    lieu = str(echantillon["code_lieu_deces"].mode().iloc[0])
+    deces = jeu("deces")
+    return {
+        "lecture complète": (None, None),
+        "dix jours (date_deces)": (deces.filtre(bornes={"date_deces": (date(annee, 3, 1), date(annee, 3, 10))}), None),
+        f"un lieu ({lieu})": (deces.filtre({"code_lieu_deces": [lieu]}), ["date_deces", "age_deces"]),
+        "âges 0-1 an": (deces.filtre(bornes={"age_deces": (0, 1)}), ["date_deces", "code_lieu_deces"]),
+    }
+
+
+def mesurer(dossier: Path, repetitions: int = 3) -> list[dict]:
+    mesures = []
+    for nom, (filtre, colonnes) in _requetes(dossier).items():
+        temps = []
+        for _ in range(repetitions):
+            debut = time.perf_counter()
+            lignes = dataset_deces(dossier).to_table(columns=colonnes, filter=filtre).num_rows
+            temps.append(time.perf_counter() - debut)
+        mesures.append({"requete": nom, "lignes": lignes, "secondes": round(min(temps), 4)})
+    return mesures
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Rapport avant / après sur la disposition des fichiers Parquet décès")
+    parser.add_argument("fichiers", type=Path, nargs="*", help="fichiers décès INSEE .txt (défaut : jeu synthétique)")
+    parser.add_argument("--lignes", type=int, default=1_000_000, help="taille du jeu synthétique")
+    parser.add_argument("--sortie", type=Path, default=None, help="fichier JSON du rapport")
+    args = parser.parse_args()
+
+    travail = Path(tempfile.mkdtemp(prefix="disposition-deces-"))
+    try:
+        fichiers = args.fichiers
+        if not fichiers:
+            fichiers = [travail / "brut" / "deces-2023.txt"]
+            generer_deces(fichiers[0], args.lignes, 2023)
+
+        rapport = {"fichiers": [f.name for f in fichiers], "dispositions": {}}
+        for nom, optimiser in (("avant", False), ("après", True)):
+            dossier = travail / nom
+            debut = time.perf_counter()
+            lignes = sum(
+                ecrire_deces_partitionne(f, dossier, f.stem.replace("-", "_"), cube=False, optimiser=optimiser)[0]
+                for f in fichiers
+            )
+            rapport["dispositions"][nom] = {
+                "lignes": lignes,
+                "conversion_s": round(time.perf_counter() - debut, 2),
+                "taille_mo": round(_taille_mo(dossier), 2),
+                "requetes": mesurer(dossier),
+            }
+
+        avant, apres = rapport["dispositions"]["avant"], rapport["dispositions"]["après"]
+        tableau = pd.DataFrame([
+            {"mesure": "taille (Mo)", "avant": avant["taille_mo"], "après": apres["taille_mo"]},
+            {"mesure": "conversion (s)", "avant": avant["conversion_s"], "après": apres["conversion_s"]},
+        ] + [
+            {"mesure": f"{a['requete']} (s)", "avant": a["secondes"], "après": b["secondes"]}
+            for a, b in zip(avant["requetes"], apres["requetes"])
+        ])
+        tableau["ratio"] = (tableau["après"] / tableau["avant"]).round(2)
+        print(tableau.to_string(index=False))
+
+        if args.sortie:
+            args.sortie.write_text(json.dumps(rapport, indent=2, ensure_ascii=False), encoding="utf-8")
+            LOG.info(f"Rapport écrit dans {args.sortie}")
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        shutil.rmtree(travail, ignore_errors=True)
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
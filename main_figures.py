@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pré-calcul des figures de la section Décès pour les vues les plus demandées
+(chaque année seule, toutes les années ; tous sexes et tous âges), à lancer après une conversion
+ou une ingestion : le tableau de bord les sert ensuite depuis le cache de figures (`_figures/`),
+sans relire le cube. Les entrées des versions précédentes du jeu sont supprimées.
+
+À exécuter depuis la racine du projet :
+    python main_figures.py [--dossier data_processed/deces]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from dashboard.sections.deces import construire_figures, filtres_figures
+from utils.cache import version_jeu
+from utils.cube import CubeIndexe
+from utils.figures import CacheFigures
+from utils.loader import valeurs_partition
+from utils.logger import Logger
+
+LOG = Logger("convert_main.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Pré-calcul des figures de la section Décès")
+    parser.add_argument(
+        "--dossier", type=Path, default=Path("data_processed/deces"),
+        help="racine du jeu Parquet partitionné (défaut : data_processed/deces)",
+    )
+    args = parser.parse_args()
+
+    try:
+        annees = [int(a) for a in valeurs_partition(args.dossier, "annee_deces")]
+        sexes = valeurs_partition(args.dossier, "sexe")
+        version = version_jeu(args.dossier)
+        cache = CacheFigures(args.dossier)
+        LOG.info(f"{cache.purger(version)} figure(s) d’une version précédente supprimée(s)")
+
+        index = CubeIndexe(args.dossier)
+        vues = [[annee] for annee in annees] + ([annees] if len(annees) > 1 else [])
+        debut = time.perf_counter()
+        for selection in vues:
+            cache.obtenir(
+                "deces", version, filtres_figures(selection, sexes, None),
+                lambda: construire_figures(index.filtrer(annees=selection, sexes=sexes), selection),
+            )
+        LOG.info(f"{len(vues)} vue(s) pré-calculée(s) en {time.perf_counter() - debut:.1f} s dans {cache.dossier}")
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
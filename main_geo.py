@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Construction hors ligne de la couche géographique du tableau de bord (`data_processed/geo/`) :
+référentiel COG (code commune actuel ou historique → département → région) puis contours
+région / département (et commune si demandé) simplifiés à plusieurs niveaux de détail,
+en GeoParquet et en GeoJSON prêt à servir.
+
+À exécuter depuis la racine du projet :
+    python main_geo.py --cog v_commune_2024.csv --mouvements v_mvt_commune_2024.csv \
+                       --contours communes-20240101.shp [--avec-communes]
+"""
+
+import sys
+import argparse
+import pyarrow.parquet as pq
+from pathlib import Path
+from utils.geo import DOSSIER_GEO, FICHIER_COG, construire_couches, table_cog
+from utils.logger import Logger
+
+LOG = Logger("app.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Référentiel COG et contours simplifiés multi-résolution")
+    parser.add_argument("--cog", type=Path, default=None, help="fichier INSEE v_commune_AAAA.csv")
+    parser.add_argument("--mouvements", type=Path, default=None, help="fichier INSEE v_mvt_commune_AAAA.csv (codes historiques)")
+    parser.add_argument("--contours", type=Path, default=None, help="contours communaux (shp, geojson, gpkg, GeoParquet…)")
+    parser.add_argument("--colonne-code", default=None, help="colonne du code INSEE dans les contours (détectée sinon)")
+    parser.add_argument("--avec-communes", action="store_true", help="écrire aussi la couche commune")
+    parser.add_argument("--sortie", type=Path, default=DOSSIER_GEO, help="dossier de sortie")
+    args = parser.parse_args()
+
+    try:
+        args.sortie.mkdir(parents=True, exist_ok=True)
+        if args.cog or args.mouvements:
+            cog = table_cog(args.cog, args.mouvements)
+            pq.write_table(cog, args.sortie / FICHIER_COG)
+            LOG.info(f"Référentiel COG : {cog.num_rows:_} codes dans {args.sortie / FICHIER_COG}")
+        if args.contours:
+            construire_couches(args.contours, args.sortie, colonne_code=args.colonne_code, avec_communes=args.avec_communes)
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingestion incrémentale de fichiers décès INSEE (ex: fichiers mensuels)
+dans le jeu Parquet partitionné, sans doublons.
+
+À exécuter depuis la racine du projet :
+    python main_ingest.py data_processed/deces/deces-2025-m01.txt [...]
+"""
+
+import argparse
+from pathlib import Path
+from utils.loader import ingerer_deces
+from utils.logger import Logger, demarrer_execution
+
+LOG = Logger("convert_main.log")
+
+
+#####################################################################
+def main():
+
+    parser = argparse.ArgumentParser(description="Ingestion incrémentale des fichiers décès INSEE")
+    parser.add_argument("fichiers", nargs="+", type=Path, help="fichiers .txt à ingérer, dans l’ordre")
+    parser.add_argument(
+        "--dossier", type=Path, default=Path("data_processed/deces"),
+        help="racine du jeu Parquet partitionné (défaut : data_processed/deces)",
+    )
+    args = parser.parse_args()
+    demarrer_execution()
+
+    try:
+        LOG.info(f"🚀 Ingestion de {len(args.fichiers)} fichier(s) décès")
+        ingerer_deces(args.fichiers, args.dossier)
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    main()
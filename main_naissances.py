@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingestion de fichiers naissances INSEE (détail, un millésime par fichier) dans le jeu normalisé
+`data_processed/naissances/annee_naissance=AAAA/` : colonnes renommées et typées une fois pour toutes.
+Une année déjà ingérée est remplacée.
+
+À exécuter depuis la racine du projet :
+    python main_naissances.py data_processed/naissances/naissances_2022.parquet FD_NAIS_2021.csv [...]
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from utils.loader import ingerer_naissances
+from utils.logger import Logger, demarrer_execution
+
+LOG = Logger("convert_main.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Ingestion des fichiers naissances INSEE")
+    parser.add_argument("fichiers", nargs="+", type=Path, help="fichiers .csv ou .parquet à ingérer")
+    parser.add_argument(
+        "--dossier", type=Path, default=Path("data_processed/naissances"),
+        help="racine du jeu naissances (défaut : data_processed/naissances)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="nombre de fichiers lus et normalisés en parallèle (défaut : nombre de cœurs)",
+    )
+    args = parser.parse_args()
+    demarrer_execution()
+
+    try:
+        LOG.info(f"🚀 Ingestion de {len(args.fichiers)} fichier(s) naissances")
+        ingerer_naissances(args.fichiers, args.dossier, workers=args.workers)
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Requêtes SQL ad hoc sur les données traitées (vues `deces` et `naissances`, moteur DuckDB embarqué).
+Les fichiers Parquet sont lus en flux : le résultat seul est matérialisé.
+
+À exécuter depuis la racine du projet :
+    python main_sql.py "SELECT departement(code_lieu_deces) AS dep, date_trunc('week', date_deces) AS semaine,
+                               count(*) AS nb FROM deces GROUP BY ALL ORDER BY ALL" --sortie logs/semaines.parquet
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from utils.logger import Logger
+from utils.sql import connecter, requete
+
+LOG = Logger("app.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Requête SQL sur les vues deces / naissances")
+    parser.add_argument("sql", help="requête SQL (vues : deces, naissances ; macro : departement(code))")
+    parser.add_argument("--deces", type=Path, default=Path("data_processed/deces"), help="jeu décès partitionné")
+    parser.add_argument("--naissances", type=Path, default=Path("data_processed/naissances"), help="dossier des naissances")
+    parser.add_argument("--memoire-mo", type=int, default=None, help="mémoire de travail DuckDB (Mo)")
+    parser.add_argument("--sortie", type=Path, default=None, help="fichier résultat (.csv ou .parquet) ; sinon affichage")
+    args = parser.parse_args()
+
+    try:
+        con = connecter(args.deces, args.naissances, memoire_mo=args.memoire_mo)
+        resultat = requete(con, args.sql)
+        if args.sortie is None:
+            print(resultat.to_string(index=False, max_rows=100))
+        elif args.sortie.suffix == ".parquet":
+            resultat.to_parquet(args.sortie, index=False)
+        else:
+            resultat.to_csv(args.sortie, index=False)
+        LOG.info(f"{len(resultat):_} lignes" + (f" écrites dans {args.sortie}" if args.sortie else ""))
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapport de démarrage à froid du tableau de bord : temps d’import de chaque section
+(dans un interpréteur neuf), comparé à un budget.
+
+À exécuter depuis la racine du projet :
+    python main_startup.py [--budget-ms 1500] [--json rapport.json]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from dashboard.sections import SECTIONS
+from utils.logger import Logger
+from utils.startup import formater_rapport, rapport_demarrage
+
+LOG = Logger("startup.log")
+
+
+#####################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description="Temps d’import à froid des sections du tableau de bord")
+    parser.add_argument("--budget-ms", type=float, default=None, help="budget d’import par module (ms)")
+    parser.add_argument("--json", type=Path, default=None, help="écrit aussi le rapport au format JSON")
+    args = parser.parse_args()
+
+    try:
+        modules = ["streamlit"] + list(SECTIONS.values())
+        rapport = rapport_demarrage(modules)
+        print(formater_rapport(rapport, args.budget_ms))
+
+        if args.json:
+            args.json.write_text(json.dumps(rapport, indent=2, ensure_ascii=False), encoding="utf-8")
+            LOG.info(f"Rapport écrit dans {args.json}")
+
+        hors_budget = [r["module"] for r in rapport if args.budget_ms is not None and r["total_ms"] > args.budget_ms]
+        if hors_budget:
+            LOG.warning(f"Budget de démarrage dépassé ({args.budget_ms:.0f} ms) : {', '.join(hors_budget)}")
+            return 1
+
+    except Exception as e:
+        LOG.error(f"FERMETURE FORCE - {e}")
+        return 1
+    finally:
+        LOG.separator()
+
+    return 0
+
+
+#####################################################################
+if __name__ == "__main__":
+    sys.exit(main())
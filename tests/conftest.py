@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# Les modules créent leur `Logger` dès l’import : le dossier des journaux est choisi avant la collecte,
+# hors de l’arbre de travail
+os.environ["DASHBOARD_LOGS"] = tempfile.mkdtemp(prefix="dashboard-logs-")
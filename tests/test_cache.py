@@ -0,0 +1,70 @@
+import copy
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from benchmarks.synthetique import lignes_deces
+from utils.cache import CacheAnnees
+from utils.loader import convert_to_parquet, ingerer_deces
+from utils.registre import jeu
+
+COLONNES = ["nom_prenom", "numero_acte", "annee_deces", "sexe", "mois_deces", "age_deces", "code_lieu_deces"]
+
+
+@pytest.fixture
+def deces(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    for annee in (2021, 2022):
+        (source / f"deces-{annee}.txt").write_bytes(lignes_deces(1_500, annee, seed=annee))
+    convert_to_parquet(source, tmp_path / "deces")
+    donnees = copy.copy(jeu("deces"))
+    donnees.dossier = tmp_path / "deces"
+    return donnees
+
+
+def _lignes(table: pa.Table) -> list[tuple]:
+    """Lignes comparables (l’ordre du cache est celui de l’âge, pas celui des fichiers)."""
+    colonnes = [pc.cast(table[nom], pa.string()).to_pylist() for nom in table.column_names]
+    return sorted(zip(*colonnes), key=repr)
+
+
+CRITERES = [
+    ({}, {}),
+    ({"sexe": ["2"]}, {"age_deces": (60, None)}),                       # moteur de filtres (âge, sexe, mois)
+    ({"mois_deces": [1, 12], "annee_deces": [2022]}, {"age_deces": (None, 30)}),
+    ({"code_lieu_deces": ["75056", "13055"]}, {}),                       # autres colonnes : filtre Arrow
+    ({"sexe": ["1"]}, {"age_deces": (20, 80), "annee_deces": (2022, 2022)}),
+]
+
+
+@pytest.mark.parametrize("valeurs, bornes", CRITERES)
+def test_selection_comme_lecture_directe(deces, tmp_path, valeurs, bornes):
+    cache = CacheAnnees(deces)
+    attendu = deces.table(COLONNES, valeurs, {"annee_deces": (1, None)} | bornes)   # lignes avec une année
+    obtenu = cache.selection(valeurs=valeurs, bornes=bornes, colonnes=COLONNES)
+    assert obtenu.schema.field("annee_deces").type == pa.int16()
+    assert _lignes(obtenu) == _lignes(attendu)
+    # Deuxième lecture : années servies par le cache, sans nouvelle matérialisation
+    cache.selection(valeurs=valeurs, bornes=bornes, colonnes=COLONNES)
+    assert cache.succes >= cache.echecs
+
+
+def test_limite_et_eviction(deces):
+    cache = CacheAnnees(deces, budget_octets=1)
+    assert cache.selection(colonnes=["numero_acte"], limite=10).num_rows == 10
+    attendu = deces.table(["numero_acte"], valeurs={"annee_deces": [2021, 2022]}).num_rows
+    assert cache.selection([2021, 2022], colonnes=["numero_acte"]).num_rows == attendu
+    assert len(cache._tables) == 1    # budget dépassé : seule l’année demandée en dernier reste ouverte
+
+
+def test_invalidation_apres_ingestion(deces, tmp_path):
+    cache = CacheAnnees(deces)
+    avant = cache.selection(colonnes=["numero_acte"]).num_rows
+    mensuel = tmp_path / "source" / "deces-2022-m12.txt"
+    mensuel.write_bytes(lignes_deces(200, 2022, seed=7))
+    ingerer_deces([mensuel], deces.dossier)
+    apres = cache.selection(colonnes=["numero_acte"])
+    assert apres.num_rows == deces.table(["numero_acte"], bornes={"annee_deces": (1, None)}).num_rows > avant
+    assert [d.name for d in (deces.dossier / "_cache").iterdir()] == [cache.dossier.name]
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from utils.dates import (
+    AGE_MAX,
+    PRECISION_ANNEE,
+    PRECISION_INCONNUE,
+    PRECISION_JOUR,
+    PRECISION_MOIS,
+    age_revolu,
+    dates_completes,
+    decoder_aaaammjj,
+)
+
+DATES = [
+    "20240315",                                          # date complète
+    "20000229", "20240229", "19000229", "20230229",      # 29 février : bissextiles (400, 4) / non (100, ordinaire)
+    "20230431", "20231232", "20231200", "20230000",      # jour invalide / inconnu, mois inconnu
+    "20231315", "19991300",                              # mois invalide
+    "00000000", "00001231",                              # année inconnue
+    "", None, "2023121", "202312011", "2023-1-1", "ABCDEFGH", "2023 315",  # vides, longueurs, non numériques
+]
+
+
+def _reference(valeur) -> tuple[int, int, int, int]:
+    """Décodage de référence d’une date INSEE, valeur par valeur (pandas pour la validité des dates complètes)."""
+    if not isinstance(valeur, str) or len(valeur) != 8 or not valeur.isascii() or not valeur.isdigit():
+        return 0, 0, 0, PRECISION_INCONNUE
+    annee, mois, jour = int(valeur[:4]), int(valeur[4:6]), int(valeur[6:])
+    if annee == 0:
+        return 0, 0, 0, PRECISION_INCONNUE
+    if not 1 <= mois <= 12:
+        return annee, 0, 0, PRECISION_ANNEE
+    if pd.isna(pd.to_datetime(valeur, format="%Y%m%d", errors="coerce")):
+        return annee, mois, 0, PRECISION_MOIS
+    return annee, mois, jour, PRECISION_JOUR
+
+
+def test_decodage_comme_reference():
+    annee, mois, jour, precision = decoder_aaaammjj(pd.Series(DATES, dtype=object))
+    obtenu = list(zip(annee.tolist(), mois.tolist(), jour.tolist(), precision.tolist()))
+    assert obtenu == [_reference(valeur) for valeur in DATES]
+
+
+def test_dates_completes_comme_pandas():
+    attendu = pd.to_datetime(pd.Series(DATES, dtype=object), format="%Y%m%d", errors="coerce")
+    # Seules les valeurs de 8 chiffres sont des dates INSEE (pandas accepte aussi « 2023121 »)
+    attendu[[_reference(valeur)[3] != PRECISION_JOUR for valeur in DATES]] = pd.NaT
+    obtenu = dates_completes(*decoder_aaaammjj(pd.Series(DATES, dtype=object)))
+    assert obtenu.isna().tolist() == attendu.isna().tolist()
+    assert [d for d in obtenu.dropna()] == [d.date() for d in attendu.dropna()]
+
+
+def test_age_revolu_dates_completes():
+    rng = np.random.default_rng(0)
+    jours = pd.date_range("1900-01-01", "2024-12-31").strftime("%Y%m%d").to_numpy()
+    naissances = rng.choice(jours, 20_000)
+    deces = rng.choice(jours, 20_000)
+    # Anniversaires exacts, veilles, et 29 février (années suivantes non bissextiles)
+    naissances[:6] = ["19500315", "19500315", "20000229", "20000229", "20000229", "19991231"]
+    deces[:6] = ["20000315", "20000314", "20010228", "20010301", "20040229", "20000101"]
+
+    n = pd.to_datetime(pd.Series(naissances), format="%Y%m%d")
+    d = pd.to_datetime(pd.Series(deces), format="%Y%m%d")
+    attendu = (d.dt.year - n.dt.year) - ((d.dt.month * 100 + d.dt.day) < (n.dt.month * 100 + n.dt.day))
+    attendu = attendu.where((attendu >= 0) & (attendu <= AGE_MAX))
+
+    obtenu = age_revolu(decoder_aaaammjj(pd.Series(naissances)), decoder_aaaammjj(pd.Series(deces)))
+    assert obtenu.isna().tolist() == attendu.isna().tolist()
+    assert obtenu.dropna().astype(int).tolist() == attendu.dropna().astype(int).tolist()
+    assert obtenu[:6].tolist() == [50, 49, 0, 1, 4, 0]
+
+
+def test_age_revolu_dates_partielles():
+    naissances = ["19500000", "19500600", "19500615", "00000000", "19500615", "20300101"]
+    deces = ["20000315", "20000315", "20000600", "20000315", "        ", "20000101"]
+    obtenu = age_revolu(decoder_aaaammjj(pd.Series(naissances)), decoder_aaaammjj(pd.Series(deces)))
+    # Mois de naissance inconnu : anniversaire réputé passé ; mois connus des deux côtés : ils départagent ;
+    # année inconnue ou âge négatif : manquant
+    assert obtenu.tolist() == [50, 49, 50, pd.NA, pd.NA, pd.NA]
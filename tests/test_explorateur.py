@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetique import lignes_deces
+from utils.explorateur import COLONNES_EXPLORATEUR, PAGES_PAR_BLOC, Explorateur
+from utils.loader import convert_to_parquet
+from utils.sql import connecter, requete
+
+TAILLE = 40
+
+
+@pytest.fixture(scope="module")
+def con(tmp_path_factory):
+    dossier = tmp_path_factory.mktemp("explorateur")
+    (dossier / "source").mkdir()
+    (dossier / "source" / "deces-2022.txt").write_bytes(lignes_deces(2_500, 2022, seed=1))
+    convert_to_parquet(dossier / "source", dossier / "deces")
+    return connecter(base_deces=dossier / "deces", threads=2)
+
+
+def _reference(con, tri: str, decroissant: bool, where: str = "TRUE") -> pd.DataFrame:
+    """Ordre complet (tri, fichier, ligne) : les pages attendues sont ses tranches, comme avec `OFFSET`."""
+    sens = "DESC" if decroissant else "ASC"
+    return requete(con, f"""
+        SELECT {', '.join(COLONNES_EXPLORATEUR)} FROM deces_lignes WHERE {where}
+        ORDER BY {tri} {sens} NULLS LAST, filename, file_row_number
+    """)
+
+
+# Colonnes avec valeurs nulles et égalités, et `sexe` (égalités seulement : le tri repose sur (fichier, ligne))
+@pytest.mark.parametrize("tri", ["age_deces", "date_deces", "date_naissance", "commune_naissance", "pays_naissance", "sexe"])
+@pytest.mark.parametrize("decroissant", [False, True])
+def test_pages_suivantes_comme_offset(con, monkeypatch, tri, decroissant):
+    appels = []
+    apres = Explorateur._apres
+    monkeypatch.setattr(Explorateur, "_apres", staticmethod(lambda *args: appels.append(args) or apres(*args)))
+
+    attendu = _reference(con, tri, decroissant)
+    assert attendu[tri].dropna().duplicated().any() and (tri == "sexe" or attendu[tri].isna().any())
+    explorateur = Explorateur(con)
+    nb_pages = -(-len(attendu) // TAILLE)
+    for numero in range(nb_pages):
+        page = explorateur.page(numero, TAILLE, tri=tri, decroissant=decroissant)
+        pd.testing.assert_frame_equal(page, attendu.iloc[numero * TAILLE:(numero + 1) * TAILLE].reset_index(drop=True))
+    # Chaque bloc après le premier a été lu par clé (après la dernière ligne du bloc précédent)
+    assert len(appels) == -(-nb_pages // PAGES_PAR_BLOC) - 1
+
+
+def test_pages_suivantes_filtrees_comme_offset(con):
+    attendu = _reference(con, "commune_naissance", True, "age_deces >= 40")
+    explorateur = Explorateur(con)
+    pages = [
+        explorateur.page(numero, TAILLE, tri="commune_naissance", decroissant=True, age_min=40)
+        for numero in range(-(-len(attendu) // TAILLE) + 1)
+    ]
+    assert pages[-1].empty
+    pd.testing.assert_frame_equal(pd.concat(pages, ignore_index=True), attendu)
+
+
+def test_saut_direct_comme_offset(con):
+    attendu = _reference(con, "age_deces", False)
+    numero = len(attendu) // TAILLE - 1
+    page = Explorateur(con).page(numero, TAILLE, tri="age_deces")
+    pd.testing.assert_frame_equal(page, attendu.iloc[numero * TAILLE:(numero + 1) * TAILLE].reset_index(drop=True))
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from utils.filtres import MoteurFiltres, trier_par_age
+
+
+@pytest.fixture(scope="module")
+def table():
+    rng = np.random.default_rng(0)
+    n = 10_001  # pas un multiple de 8 : bitmaps avec octet final partiel
+    ages = rng.integers(0, 111, n).astype(float)
+    ages[rng.random(n) < 0.03] = np.nan
+    sexes = rng.choice(np.array(["1", "2"], dtype=object), n)
+    sexes[rng.random(n) < 0.01] = None
+    mois = rng.integers(1, 13, n).astype(float)
+    mois[rng.random(n) < 0.02] = np.nan
+    brute = pa.table({
+        "age_deces": pa.array(ages, type=pa.int16(), from_pandas=True),
+        "sexe": pa.array(sexes, type=pa.string()).dictionary_encode(),
+        "mois_deces": pa.array(mois, type=pa.int8(), from_pandas=True),
+    })
+    return trier_par_age(brute)
+
+
+def _masque(df, age_min, age_max, sexe, mois_deces) -> np.ndarray:
+    """Sélection de référence : masque booléen pandas sur les colonnes."""
+    masque = pd.Series(True, index=df.index)
+    if age_min is not None or age_max is not None:
+        masque &= df["age_deces"].notna()
+        if age_min is not None:
+            masque &= df["age_deces"] >= age_min
+        if age_max is not None:
+            masque &= df["age_deces"] <= age_max
+    if sexe is not None:
+        masque &= df["sexe"].isin(sexe)
+    if mois_deces is not None:
+        masque &= df["mois_deces"].isin(mois_deces)
+    return np.flatnonzero(masque.fillna(False).to_numpy(dtype=bool))
+
+
+CRITERES = [
+    (None, None, None, None),
+    (None, None, ["2"], None),
+    (0, 0, None, None),
+    (60, None, ["1"], [1, 2, 12]),
+    (None, 17.5, None, [7]),
+    (20.2, 64.8, ["1", "2"], list(range(1, 13))),
+    (110, 200, ["2"], None),
+    (-5, 3, None, [2]),
+    (80, 40, None, None),            # tranche vide
+    (None, None, [], None),          # aucune valeur retenue
+    (30, 50, ["3"], None),           # valeur absente de la table
+    (None, None, ["1"], [13]),
+]
+
+
+@pytest.mark.parametrize("age_min, age_max, sexe, mois_deces", CRITERES)
+def test_selection_comme_masque_booleen(table, age_min, age_max, sexe, mois_deces):
+    moteur = MoteurFiltres(table)
+    df = table.to_pandas()
+    df["sexe"] = df["sexe"].astype(object)
+    indices = moteur.selection(age_min, age_max, sexe=sexe, mois_deces=mois_deces)
+    assert indices.tolist() == _masque(df, age_min, age_max, sexe, mois_deces).tolist()
+
+
+def test_selection_aleatoire_comme_masque_booleen(table):
+    moteur = MoteurFiltres(table)
+    df = table.to_pandas()
+    df["sexe"] = df["sexe"].astype(object)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        age_min = None if rng.random() < 0.3 else int(rng.integers(0, 111))
+        age_max = None if rng.random() < 0.3 else int(rng.integers(0, 111))
+        sexe = None if rng.random() < 0.3 else list(rng.choice(["1", "2"], rng.integers(1, 3), replace=False))
+        mois = None if rng.random() < 0.3 else rng.choice(np.arange(1, 13), rng.integers(1, 13), replace=False).tolist()
+        indices = moteur.selection(age_min, age_max, sexe=sexe, mois_deces=mois)
+        assert indices.tolist() == _masque(df, age_min, age_max, sexe, mois).tolist()
+
+
+def test_table_non_triee_refusee(table):
+    with pytest.raises(ValueError):
+        MoteurFiltres(table.take(np.arange(table.num_rows)[::-1]))
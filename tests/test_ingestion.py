@@ -0,0 +1,69 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from benchmarks.synthetique import lignes_deces
+from utils.cube import agreger_lot
+from utils.geo import FICHIER_COG, SCHEMA_COG, ReferentielCOG
+from utils.loader import convert_to_parquet, dataset_deces, ingerer_deces, iter_fichier_deces
+from utils.index_deces import cles_deces
+
+
+def _lignes(n, annee, seed):
+    return lignes_deces(n, annee, seed=seed).splitlines(keepends=True)
+
+
+def _cles_distinctes(*fichiers) -> int:
+    return len(np.unique(np.concatenate([cles_deces(lot) for f in fichiers for lot in iter_fichier_deces(f)])))
+
+
+def _actes_stockes(dossier) -> list[tuple]:
+    table = dataset_deces(dossier).to_table(columns=["numero_acte", "code_lieu_deces", "date_deces", "nom_prenom"])
+    return list(zip(*(pc.cast(table[nom], "string").to_pylist() for nom in table.column_names)))
+
+
+def test_reingestion_du_meme_mois_sans_doublon(tmp_path):
+    source, sortie = tmp_path / "source", tmp_path / "deces"
+    source.mkdir()
+    annuel = _lignes(2_000, 2022, seed=1)
+    (source / "deces-2022.txt").write_bytes(b"".join(annuel))
+    convert_to_parquet(source, sortie)
+
+    # Fichier mensuel : une partie déjà publiée dans l’annuel, des nouveaux actes et un acte répété dans le fichier
+    nouveaux = _lignes(300, 2023, seed=2)
+    mensuel = source / "deces-2023-m01.txt"
+    mensuel.write_bytes(b"".join(annuel[:500] + nouveaux + nouveaux[:10]))
+    ingerer_deces([mensuel], sortie)
+    attendu = _cles_distinctes(source / "deces-2022.txt", mensuel)
+    assert dataset_deces(sortie).count_rows() == attendu
+
+    # Même mois republié (corrigé : quelques actes en plus) : ses anciennes partitions sont remplacées
+    corrections = _lignes(50, 2023, seed=3)
+    mensuel.write_bytes(mensuel.read_bytes() + b"".join(corrections))
+    ingerer_deces([mensuel], sortie)
+    ingerer_deces([mensuel], sortie)
+
+    actes = _actes_stockes(sortie)
+    assert len(actes) == len(set(actes))
+    assert len(actes) == _cles_distinctes(source / "deces-2022.txt", mensuel)
+
+
+def test_cube_suit_le_referentiel_cog(tmp_path):
+    # Code historique 14666 rattaché à 14712, code inconnu du référentiel (repli sur le préfixe) et code nul
+    pq.write_table(pa.table({
+        "code_commune": ["14666", "14712", "2A004"],
+        "code_actuel": ["14712", "14712", "2A004"],
+        "departement": ["14", "14", "2A"],
+        "region": ["28", "28", "94"],
+    }, schema=SCHEMA_COG), tmp_path / FICHIER_COG)
+    lot = pa.table({
+        "annee_deces": pa.array([2022] * 4, pa.int16()),
+        "mois_deces": pa.array([1] * 4, pa.int8()),
+        "sexe": ["1"] * 4,
+        "age_deces": pa.array([80] * 4, pa.int16()),
+        "code_lieu_deces": pc.dictionary_encode(pa.array(["14666", "14712", "97411", None])),
+    })
+    cube = agreger_lot(lot, ReferentielCOG(tmp_path))
+    comptes = dict(zip(cube["departement_deces"].to_pylist(), cube["nb_deces"].to_pylist()))
+    assert comptes == {"14": 2, "974": 1, None: 1}
@@ -0,0 +1,28 @@
+import copy
+import shutil
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from utils.loader import dataset_naissances, lire_fichier_naissances
+from utils.registre import jeu
+
+DOSSIER = Path("data_processed/naissances")
+SOURCE = DOSSIER / "naissances_2022.parquet"
+
+
+def test_jeu_ignore_les_fichiers_hors_partitions(tmp_path):
+    # Même disposition que le dépôt : README, paquet Python et fichier INSEE brut à la racine du jeu
+    for nom in ("README.md", "__init__.py", SOURCE.name):
+        shutil.copy(DOSSIER / nom, tmp_path / nom)
+    naissances = copy.copy(jeu("naissances"))
+    naissances.dossier = naissances.dossier_source = tmp_path
+    assert dataset_naissances(tmp_path).count_rows() == 0
+    assert naissances.charger().empty
+
+    naissances.convertir()
+    assert naissances.annees() == [2022]
+    df = naissances.charger(["annee_naissance", "mois_naissance_enfant"], valeurs={"annee_naissance": [2022]})
+    assert len(df) == pq.read_metadata(SOURCE).num_rows
+    assert df["annee_naissance"].unique().tolist() == [2022]
+    assert len(naissances.charger()) == len(lire_fichier_naissances(SOURCE))
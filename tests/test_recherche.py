@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from utils.recherche import LONGUEUR_PREFIXE, SegmentRecherche, ecrire_segment_recherche, normaliser_noms, normaliser_requete
+
+NOMS = [
+    "MARTIN*JEAN PIERRE/", "MARTINEZ*JEANNE/", "MARTIN*MARIE/", "MART*JEAN/", "LEMARTIN*PAUL/",
+    "DE LA ROCHEFOUCAULD*FRANÇOIS/", "DE LA ROCHEFOUCAULD LIANCOURT*MARIE THÉRÈSE JOSÉPHINE/",
+    "DE LA ROCHEFOUCAULD LIANCOURT*MARIE ANNE/", "DE LA ROCHEFOUCAULT*LOUIS/",
+    "MONTMORENCY LAVAL BOUTEVILLE*ANNE/", "MONTMORENCY LAVAL*ANNE/",
+    "D'ARTAGNAN*CHARLES/", "DARTAGNAN*CHARLES/", "LŒUVRE*ÉMILE/", "ÉLODIE*ÀNNE/",
+    "JEAN*JEAN/", "SANSPRENOM", "O'NEIL-DUPONT*SÉBASTIEN JEAN/", "DUPONT*JEAN/", "DUPONT*JEANNE MARIE/",
+]
+
+
+@pytest.fixture(scope="module")
+def segment(tmp_path_factory):
+    dossier = tmp_path_factory.mktemp("deces")
+    rng = np.random.default_rng(0)
+    syllabes = np.array(["MA", "RI", "TIN", "DU", "PON", "LE", "ROY", "BER", "NARD", "CHA", "LOT", "TE"])
+    aleatoires = [
+        "".join(rng.choice(syllabes, rng.integers(2, 9))) + "*" + "".join(rng.choice(syllabes, rng.integers(1, 5))) + "/"
+        for _ in range(3_000)
+    ]
+    noms = NOMS + aleatoires
+    fichiers = []
+    for i, morceau in enumerate(np.array_split(np.array(noms, dtype=object), 3)):
+        fichier = f"annee_deces=2020/mois_deces={i + 1}/sexe=1/t-0.parquet"
+        (dossier / fichier).parent.mkdir(parents=True)
+        pq.write_table(pa.table({"nom_prenom": pa.array(morceau.tolist(), pa.string())}), dossier / fichier)
+        fichiers.append(fichier)
+    ecrire_segment_recherche(dossier, "t", fichiers)
+    return SegmentRecherche(dossier / "_recherche" / "t")
+
+
+def _reference(cles: pd.Series, nom: str, prenom: str, contient: bool) -> list[int]:
+    """Sélection de référence (pandas) sur les clés normalisées, dans l’ordre des rangs."""
+    parties = cles.str.split("*", n=1, expand=True).reindex(columns=[0, 1]).fillna("")
+    noms, prenoms = parties[0], parties[1]
+    if nom and contient and len(nom) >= 3:
+        masque = noms.str.contains(nom, regex=False)
+    elif nom:
+        masque = noms.str.startswith(nom)
+    elif prenom:
+        masque = pd.Series(True, index=cles.index)
+    else:
+        return []
+    if prenom:
+        masque &= prenoms.str.startswith(prenom)
+    return np.flatnonzero(masque.to_numpy()).tolist()
+
+
+REQUETES = [
+    ("martin", "", False), ("MARTIN", "jean", False), ("mart", "jean", False), ("mart", "", False),
+    ("", "jean", False), ("", "marie thérèse", False), ("dupont", "jeanne", False),
+    ("de la rochefoucauld", "", False),                     # 19 caractères : au-delà du préfixe indexé
+    ("de la rochefoucauld liancourt", "marie", False),
+    ("de la rochefoucauld liancourt", "marie therese josephine", False),
+    ("de la rochefoucaulx", "", False),                     # même préfixe de 16 caractères, 19e différent
+    ("montmorency laval", "", False), ("montmorency laval bouteville", "anne", False),
+    ("d'artagnan", "", False), ("loeuvre", "", False), ("elodie", "anne", False),
+    ("sansprenom", "", False), ("o neil dupont", "", False),
+    ("tin", "", True), ("TIN", "jean", True), ("rochefoucauld", "", True), ("rochefoucauld liancourt", "marie", True),
+    ("artagnan", "", True), ("ma", "", True), ("ontmorency laval bou", "", True), ("xyz", "", True),
+    ("roymari", "", True), ("", "", False), ("", "", True),
+]
+
+
+@pytest.mark.parametrize("nom, prenom, contient", REQUETES)
+def test_rangs_comme_reference(segment, nom, prenom, contient):
+    nom, prenom = normaliser_requete(nom), normaliser_requete(prenom)
+    cles = segment.table.column("cle").to_pandas()
+    assert segment.rangs(nom, prenom, contient).tolist() == _reference(cles, nom, prenom, contient)
+
+
+def test_recherche_aleatoire_comme_reference(segment):
+    cles = segment.table.column("cle").to_pandas()
+    rng = np.random.default_rng(1)
+    for cle in rng.choice(cles.to_numpy(), 100):
+        nom, _, prenom = cle.partition("*")
+        debut = int(rng.integers(0, max(len(nom) - 3, 1)))
+        requete_nom = nom[debut:debut + int(rng.integers(3, LONGUEUR_PREFIXE + 6))]
+        requete_prenom = prenom[:int(rng.integers(0, len(prenom) + 1))]
+        for contient in (False, True):
+            texte = requete_nom if contient else nom[:len(requete_nom)]
+            assert segment.rangs(texte, requete_prenom, contient).tolist() == _reference(cles, texte, requete_prenom, contient)
+
+
+def test_normalisation():
+    assert normaliser_noms(pa.array(["D'Artagnan-Lœuvre * Éléonore  Marie/", None])).to_pylist() == [
+        "D ARTAGNAN LOEUVRE*ELEONORE MARIE",
+        "",
+    ]
@@ -0,0 +1,36 @@
+import copy
+
+from utils.registre import jeu
+
+# Base départementale SSMSI : millésime récent (années sur 4 chiffres, nombres secrétisés `NA`)…
+RECENT = """Code_departement;Code_region;annee;indicateur;unite_de_compte;nombre;taux_pour_mille;est_diffuse;insee_pop
+01;84;2023;Violences sexuelles;Victime;412;0,60;diffuse;672440
+2A;94;2023;Violences sexuelles;Victime;NA;NA;ndiff;162421
+01;84;2023;Vols sans violence contre des personnes;Infraction;1200;1,78;diffuse;672440
+"""
+
+# … et ancien fichier (noms à points, années sur 2 chiffres)
+ANCIEN = """classe;annee;Code.département;Code.région;unité.de.compte;millPOP;faits;POP;tauxpourmille
+Violences sexuelles;16;01;84;victime;16;301;631877;0,476
+Violences sexuelles;16;75;11;victime;16;2900;2190327;1,324
+"""
+
+
+def test_ingestion_des_deux_formats(tmp_path):
+    (tmp_path / "ancien.csv").write_text(ANCIEN, encoding="utf-8")
+    (tmp_path / "recent.csv").write_text(RECENT, encoding="utf-8")
+    violences = copy.copy(jeu("violences"))
+    violences.dossier = violences.dossier_source = tmp_path
+
+    assert violences.convertir() == 5
+    assert violences.annees() == [2016, 2023]
+    df = violences.charger(
+        ["annee", "code_departement", "nombre", "taux_pour_mille", "population"],
+        valeurs={"indicateur": ["Violences sexuelles"]},
+    ).sort_values(["annee", "code_departement"], ignore_index=True)
+    assert df["annee"].tolist() == [2016, 2016, 2023, 2023]
+    assert df["code_departement"].astype(str).tolist() == ["01", "75", "01", "2A"]
+    assert df["nombre"].tolist()[:3] == [301, 2900, 412] and df["nombre"].isna().tolist()[3]
+    assert df["taux_pour_mille"].round(3).tolist()[:3] == [0.476, 1.324, 0.6]
+    assert df["population"].tolist()[0] == 631877
+    assert violences.compter(["indicateur"])["nombre"].tolist() == [4, 1]
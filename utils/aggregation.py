@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+#######################################################################
+#                       STATISTIQUES (NumPy)
+#######################################################################
+def _preparer(valeurs, poids=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit valeurs / poids en tableaux float64 en retirant les valeurs manquantes.
+    Sans poids, chaque valeur compte pour 1 ; avec poids, `valeurs` peut être un cube (valeur, effectif).
+    """
+    v = pd.to_numeric(pd.Series(valeurs), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    p = np.ones_like(v) if poids is None else np.asarray(poids, dtype="float64")
+    garde = ~np.isnan(v)
+    return v[garde], p[garde]
+
+
+# ---------------------------------------------------------------------
+def histogramme(valeurs, poids=None, nb_classes: int = 80, bornes: tuple | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Histogramme (pondéré si `poids`) calculé côté serveur.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: effectifs (nb_classes), bords des classes (nb_classes + 1)
+    """
+    v, p = _preparer(valeurs, poids)
+    if bornes is None:
+        bornes = (v.min(), v.max()) if v.size else (0.0, 1.0)
+    return np.histogram(v, bins=nb_classes, range=bornes, weights=p)
+
+
+# ---------------------------------------------------------------------
+def quantiles(valeurs, q, poids=None) -> np.ndarray:
+    """
+    Quantiles (pondérés si `poids`) par la méthode de l’inverse de la fonction de répartition.
+    """
+    v, p = _preparer(valeurs, poids)
+    q = np.atleast_1d(np.asarray(q, dtype="float64"))
+    if not v.size:
+        return np.full(q.shape, np.nan)
+    ordre = np.argsort(v, kind="stable")
+    v, cumul = v[ordre], np.cumsum(p[ordre])
+    rangs = np.searchsorted(cumul, q * cumul[-1], side="left")
+    return v[np.minimum(rangs, v.size - 1)]
+
+
+def stats_boite(valeurs, poids=None) -> dict:
+    """
+    Statistiques d’une boîte à moustaches (quartiles, moustaches de Tukey à 1,5 × IQR, moyenne).
+    """
+    v, p = _preparer(valeurs, poids)
+    if not v.size or p.sum() == 0:
+        return {}
+    q1, mediane, q3 = quantiles(v, [0.25, 0.5, 0.75], p)
+    iqr = q3 - q1
+    dans_moustaches = v[(v >= q1 - 1.5 * iqr) & (v <= q3 + 1.5 * iqr)]
+    return {
+        "q1": float(q1),
+        "median": float(mediane),
+        "q3": float(q3),
+        "lowerfence": float(dans_moustaches.min()),
+        "upperfence": float(dans_moustaches.max()),
+        "mean": float(np.average(v, weights=p)),
+    }
+
+
+#######################################################################
+#                       TRACES PLOTLY
+#######################################################################
+def traces_histogramme(
+    df: pd.DataFrame,
+    colonne: str,
+    groupe: str,
+    poids: str | None = None,
+    nb_classes: int = 80,
+    couleurs: dict | None = None,
+) -> list[go.Bar]:
+    """
+    Une trace `go.Bar` par groupe, avec des classes communes à tous les groupes :
+    la taille du graphique dépend du nombre de classes, pas du nombre de lignes.
+    """
+    v_tous, _ = _preparer(df[colonne])
+    bornes = (v_tous.min(), v_tous.max()) if v_tous.size else (0.0, 1.0)
+
+    traces = []
+    for nom, sous_df in df.groupby(groupe, observed=True):
+        comptes, bords = histogramme(
+            sous_df[colonne], None if poids is None else sous_df[poids], nb_classes, bornes
+        )
+        traces.append(go.Bar(
+            x=(bords[:-1] + bords[1:]) / 2,
+            y=comptes,
+            width=np.diff(bords),
+            name=str(nom),
+            marker_color=(couleurs or {}).get(str(nom)),
+            opacity=0.75,
+        ))
+    return traces
+
+
+def traces_boite(
+    df: pd.DataFrame,
+    colonne: str,
+    groupe: str,
+    poids: str | None = None,
+    couleurs: dict | None = None,
+) -> list[go.Box]:
+    """
+    Une trace `go.Box` par groupe, à partir de statistiques précalculées (aucune donnée brute envoyée).
+    """
+    traces = []
+    for nom, sous_df in df.groupby(groupe, observed=True):
+        stats = stats_boite(sous_df[colonne], None if poids is None else sous_df[poids])
+        if not stats:
+            continue
+        traces.append(go.Box(
+            x=[str(nom)],
+            name=str(nom),
+            marker_color=(couleurs or {}).get(str(nom)),
+            **{cle: [valeur] for cle, valeur in stats.items()},
+        ))
+    return traces
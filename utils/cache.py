@@ -0,0 +1,209 @@
+import os
+import shutil
+import hashlib
+import threading
+import numpy as np
+import pyarrow as pa
+from pathlib import Path
+from collections import OrderedDict
+from utils.filtres import COLONNE_TRI, COLONNES_BITMAP, MoteurFiltres, trier_par_age
+from utils.logger import Logger, Span
+
+LOG = Logger()
+
+# Dossier du cache dans le dossier du jeu (préfixe `_` : hors des motifs de découverte des fichiers du jeu)
+DOSSIER_CACHE = "_cache"
+
+# Format des fichiers du cache (incrémenté quand leur contenu change : les anciens sont alors réécrits)
+FORMAT_CACHE = 4
+
+# Budget mémoire par défaut (Mo), surchargeable par la variable d’environnement DASHBOARD_CACHE_BUDGET_MO
+BUDGET_MO_DEFAUT = 2048
+
+
+def version_jeu(base_dir: Path) -> str:
+    """
+    Version du jeu partitionné : empreinte du manifeste de conversion (change à chaque conversion / ingestion).
+    """
+    chemin = base_dir / "_manifest.json"
+    contenu = chemin.read_bytes() if chemin.exists() else b""
+    return hashlib.sha1(contenu).hexdigest()[:12]
+
+
+class CacheAnnees:
+    """
+    Cache par année d’un jeu du registre (`utils.registre.JeuDonnees` ayant une `cle_annee`), sous forme
+    de fichiers Arrow IPC projetés en mémoire (`mmap`).
+
+    - Chaque année n’est stockée qu’une fois : une sélection multi-années est assemblée
+      sans copie (`pa.concat_tables` ne fait que juxtaposer les blocs).
+    - L’année, constante dans un fichier, n’y est pas stockée : elle vient des métadonnées
+      et n’est matérialisée que pour les lignes retenues par la sélection.
+    - Les fichiers IPC sont partagés sur disque : plusieurs processus Streamlit projettent
+      les mêmes pages au lieu d’en garder chacun une copie privée.
+    - Jeu décès : chaque fichier est trié par âge et un `MoteurFiltres` par année (bornes d’âge + bitmaps
+      sexe / mois) résout les filtres des widgets sans repasser sur les lignes ; les autres critères
+      (et les autres jeux) sont évalués par Arrow sur la table projetée.
+    - Les années ouvertes sont évincées (LRU) au-delà de `budget_octets`.
+    """
+
+    def __init__(self, jeu, budget_octets: int | None = None):
+        if not jeu.cle_annee:
+            raise ValueError(f"Le jeu {jeu.nom} n’a pas de clé d’année : pas de cache par année")
+        if budget_octets is None:
+            budget_octets = int(os.environ.get("DASHBOARD_CACHE_BUDGET_MO", BUDGET_MO_DEFAUT)) * 1024 * 1024
+        self.jeu = jeu
+        self.budget_octets = budget_octets
+        self.indexe = COLONNE_TRI in jeu.schema.names and all(nom in jeu.schema.names for nom in COLONNES_BITMAP)
+        self._tables = OrderedDict()
+        self._moteurs = {}
+        self._verrou = threading.Lock()
+        self.succes = 0
+        self.echecs = 0
+        self._ouvrir_version()
+
+    # -----------------------------------------------------------------
+    def _ouvrir_version(self):
+        self.version = self.jeu.version()
+        racine = self.jeu.dossier / DOSSIER_CACHE
+        self.dossier = racine / f"{self.version}.{FORMAT_CACHE}"
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        self._tables.clear()
+        self._moteurs.clear()
+
+        # Les versions précédentes du jeu (ou du format) ne servent plus
+        for ancien in racine.iterdir():
+            if ancien.is_dir() and ancien != self.dossier:
+                shutil.rmtree(ancien, ignore_errors=True)
+
+    def _materialiser(self, annee: int) -> Path:
+        """
+        Écrit (une seule fois) le fichier IPC d’une année, de manière atomique.
+        """
+        chemin = self.dossier / f"{self.jeu.nom}_{annee}.arrow"
+        if chemin.exists():
+            return chemin
+
+        with Span("cache.materialiser", jeu=self.jeu.nom, annee=annee) as span:
+            # Un fichier IPC n’admet qu’un dictionnaire par colonne ; l’année part dans les métadonnées
+            colonnes = [nom for nom in self.jeu.schema.names if nom != self.jeu.cle_annee]
+            table = self.jeu.table(colonnes, valeurs={self.jeu.cle_annee: [annee]}).unify_dictionaries()
+            if self.indexe:
+                table = trier_par_age(table)
+            table = table.replace_schema_metadata({self.jeu.cle_annee: str(annee)})
+            tmp = chemin.with_name(f".{chemin.name}.{os.getpid()}.tmp")
+            with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp, chemin)
+            span.lignes_sortie = table.num_rows
+        LOG.info(
+            f"Cache : {self.jeu.nom} {annee} matérialisé ({table.num_rows:_} lignes, "
+            f"{chemin.stat().st_size / 1024 / 1024:.1f} Mo)"
+        )
+        return chemin
+
+    # -----------------------------------------------------------------
+    @property
+    def taille_octets(self) -> int:
+        return sum(table.nbytes for table in self._tables.values()) + sum(m.nbytes for m in self._moteurs.values())
+
+    def table(self, annee: int) -> pa.Table:
+        """
+        Table Arrow (projetée en mémoire) d’une année, sans la colonne d’année (voir `selection`).
+        """
+        annee = int(annee)
+        with self._verrou:
+            if self.jeu.version() != self.version:
+                LOG.info(f"Cache : le jeu {self.jeu.nom} a changé, invalidation.")
+                self._ouvrir_version()
+
+            if annee in self._tables:
+                self.succes += 1
+                self._tables.move_to_end(annee)
+                return self._tables[annee]
+
+            self.echecs += 1
+            source = pa.memory_map(str(self._materialiser(annee)), "r")
+            table = pa.ipc.open_file(source).read_all()
+            self._tables[annee] = table
+
+            # Éviction LRU (on garde toujours l’année demandée)
+            while self.taille_octets > self.budget_octets and len(self._tables) > 1:
+                evincee, _ = self._tables.popitem(last=False)
+                self._moteurs.pop(evincee, None)
+                LOG.info(f"Cache : {self.jeu.nom} {evincee} évincé (budget {self.budget_octets / 1024 / 1024:.0f} Mo)")
+            return table
+
+    def moteur(self, annee: int) -> MoteurFiltres:
+        """
+        Moteur de filtres d’une année (jeu décès), construit une fois à l’ouverture de la table (évincé avec elle).
+        """
+        annee = int(annee)
+        table = self.table(annee)
+        with self._verrou:
+            moteur = self._moteurs.get(annee)
+            if moteur is None:
+                with Span("cache.indexer", lignes_entree=table.num_rows, annee=annee):
+                    moteur = self._moteurs[annee] = MoteurFiltres(table)
+            return moteur
+
+    def _par_moteur(self, valeurs: dict, bornes: dict) -> bool:
+        return self.indexe and set(valeurs) <= set(COLONNES_BITMAP) and set(bornes) <= {COLONNE_TRI}
+
+    def selection(
+        self,
+        annees: list[int] | None = None,
+        valeurs: dict | None = None,
+        bornes: dict | None = None,
+        colonnes: list[str] | None = None,
+        limite: int | None = None,
+    ) -> pa.Table:
+        """
+        Assemble plusieurs années (toutes si None) en une seule table fragmentée (un morceau par année),
+        sans concaténation (les lignes sans année n’appartiennent à aucune).
+        `valeurs` / `bornes` ont le sens de `JeuDonnees.filtre` (bornes incluses) ;
+        ils sont résolus année par année — par le moteur de filtres quand ils portent sur l’âge, le sexe et
+        le mois des décès (lignes rendues par âge croissant), sinon par Arrow. Seules les lignes retenues
+        sont copiées (`take`), les colonnes non demandées ne sont jamais lues dans les fichiers projetés.
+        """
+        cle = self.jeu.cle_annee
+        valeurs, bornes = dict(valeurs or {}), dict(bornes or {})
+        if cle in valeurs:
+            retenues = valeurs.pop(cle)
+            annees = retenues if annees is None else sorted(set(int(a) for a in annees) & set(int(a) for a in retenues))
+        if annees is None:
+            annees = self.jeu.annees()
+        if cle in bornes:
+            minimum, maximum = bornes.pop(cle)
+            annees = [a for a in annees if (minimum is None or a >= minimum) and (maximum is None or a <= maximum)]
+        colonnes = list(colonnes) if colonnes is not None else self.jeu.schema.names
+        minimum, maximum = bornes.get(COLONNE_TRI, (None, None))
+        filtre = None if self._par_moteur(valeurs, bornes) else self.jeu.filtre(valeurs, bornes)
+
+        morceaux = []
+        for annee in sorted(set(int(a) for a in annees)):
+            if limite is not None and limite <= 0:
+                break
+            table = self.table(annee)
+            if filtre is not None:
+                table = table.filter(filtre)
+            elif valeurs or bornes:
+                indices = self.moteur(annee).selection(minimum, maximum, **valeurs)
+                table = table.take(indices[:limite])
+            if limite is not None:
+                table = table.slice(0, limite)
+                limite -= table.num_rows
+            morceaux.append(self._projeter(table, annee, colonnes))
+        if not morceaux:
+            return pa.schema([self.jeu.schema.field(nom) for nom in colonnes]).empty_table()
+        return pa.concat_tables(morceaux)
+
+    def _projeter(self, table: pa.Table, annee: int, colonnes: list[str]) -> pa.Table:
+        # Colonnes existantes partagées telles quelles ; l’année n’est construite que pour les lignes retenues
+        cle = self.jeu.schema.field(self.jeu.cle_annee)
+        tableaux = [
+            pa.array(np.full(table.num_rows, annee), type=cle.type) if nom == cle.name else table.column(nom)
+            for nom in colonnes
+        ]
+        champs = [cle if nom == cle.name else table.schema.field(nom) for nom in colonnes]
+        return pa.Table.from_arrays(tableaux, schema=pa.schema(champs))
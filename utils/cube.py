@@ -0,0 +1,127 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import Iterable, Iterator
+from utils.filtres import MoteurFiltres, trier_par_age
+from utils.geo import ReferentielCOG, referentiel_cog
+from utils.logger import Logger, profiler
+from utils.schema import table_vers_pandas
+
+LOG = Logger()
+
+# Dossier du cube (préfixe `_` : ignoré lors de la découverte du jeu partitionné)
+DOSSIER_CUBE = "_cube"
+
+# Dimensions du cube d’agrégats décès
+DIMENSIONS_CUBE = ["annee_deces", "mois_deces", "sexe", "age_deces", "departement_deces"]
+
+SCHEMA_CUBE = pa.schema([
+    ("annee_deces", pa.int16()),
+    ("mois_deces", pa.int8()),
+    ("sexe", pa.string()),
+    ("age_deces", pa.int16()),
+    ("departement_deces", pa.string()),
+    ("nb_deces", pa.int64()),
+])
+
+
+#######################################################################
+#                       CONSTRUCTION
+#######################################################################
+def agreger_lot(lot: pa.RecordBatch | pa.Table, referentiel: ReferentielCOG | None = None) -> pa.Table:
+    """
+    Compte les décès d’un lot (au format `SCHEMA_DECES`) selon `DIMENSIONS_CUBE`. Le département du lieu
+    de décès suit le référentiel COG (`referentiel_cog()` par défaut) : une commune fusionnée ou renommée
+    est comptée dans le département de la commune qui l’a absorbée.
+    """
+    referentiel = referentiel or referentiel_cog()
+    table = pa.table({
+        "annee_deces": lot.column("annee_deces"),
+        "mois_deces": lot.column("mois_deces"),
+        "sexe": lot.column("sexe"),
+        "age_deces": lot.column("age_deces"),
+        "departement_deces": referentiel.rattacher(lot.column("code_lieu_deces"))["departement"],
+    })
+    comptes = table.group_by(DIMENSIONS_CUBE).aggregate([([], "count_all")])
+    return comptes.rename_columns(DIMENSIONS_CUBE + ["nb_deces"]).select(SCHEMA_CUBE.names).cast(SCHEMA_CUBE)
+
+
+def fusionner(cubes: Iterable[pa.Table]) -> pa.Table:
+    """
+    Additionne plusieurs cubes partiels (mêmes dimensions).
+    """
+    cubes = list(cubes)
+    if not cubes:
+        return SCHEMA_CUBE.empty_table()
+    total = pa.concat_tables(cubes).group_by(DIMENSIONS_CUBE).aggregate([("nb_deces", "sum")])
+    return total.rename_columns(DIMENSIONS_CUBE + ["nb_deces"]).select(SCHEMA_CUBE.names).cast(SCHEMA_CUBE)
+
+
+# ---------------------------------------------------------------------
+def cumuler_cube(lots: Iterator[pa.RecordBatch], cubes: list) -> Iterator[pa.RecordBatch]:
+    """
+    Laisse passer les lots tels quels en ajoutant leurs comptes à `cubes` :
+    le cube est construit pendant l’écriture du jeu partitionné, sans relire les données.
+    """
+    for lot in lots:
+        cubes.append(agreger_lot(lot))
+        yield lot
+
+
+#######################################################################
+#                           LECTURE
+#######################################################################
+class CubeIndexe:
+    """
+    Cube d’agrégats du jeu décès (toutes sources additionnées), lu et fusionné une seule fois,
+    trié par âge et indexé par un `MoteurFiltres` (bitmaps année / sexe / mois) :
+    un changement de widget ne coûte plus qu’une sélection d’indices et un `take`.
+    """
+
+    def __init__(self, base_dir: Path):
+        fichiers = sorted((base_dir / DOSSIER_CUBE).glob("*.parquet"))
+        if not fichiers:
+            LOG.warning(f"Aucun cube d’agrégats trouvé dans {base_dir / DOSSIER_CUBE}")
+            self.table = SCHEMA_CUBE.empty_table()
+        else:
+            self.table = trier_par_age(fusionner(pq.read_table(f, schema=SCHEMA_CUBE) for f in fichiers))
+        self.moteur = MoteurFiltres(self.table, colonnes_bitmap=("annee_deces", "sexe", "mois_deces"))
+
+    def filtrer(
+        self,
+        annees: list[int] | None = None,
+        sexes: list[str] | None = None,
+        age_min: int | None = None,
+        age_max: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Lignes du cube retenues. Les bornes d’âge sont incluses ; un filtre d’âge exclut les âges inconnus,
+        comme pour les données brutes.
+        """
+        indices = self.moteur.selection(age_min, age_max, annee_deces=annees, sexe=sexes)
+        return table_vers_pandas(self.table.take(indices))
+
+
+@profiler()
+def charger_cube(
+    base_dir: Path,
+    annees: list[int] | None = None,
+    sexes: list[str] | None = None,
+    age_min: int | None = None,
+    age_max: int | None = None,
+) -> pd.DataFrame:
+    """
+    Charge le cube d’agrégats du jeu décès (toutes sources additionnées), filtré.
+    Pour des filtres successifs sur le même jeu, garder un `CubeIndexe` (lecture et index construits une fois).
+    """
+    return CubeIndexe(base_dir).filtrer(annees=annees, sexes=sexes, age_min=age_min, age_max=age_max)
+
+
+# ---------------------------------------------------------------------
+def compter(cube: pd.DataFrame, dimensions: list[str]) -> pd.DataFrame:
+    """
+    Somme les décès du cube selon les dimensions demandées (colonne `nb_deces`).
+    """
+    return cube.groupby(dimensions, as_index=False, observed=True)["nb_deces"].sum()
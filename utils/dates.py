@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Précision d’une date INSEE AAAAMMJJ (les fichiers contiennent des dates partielles : JJ=00, MM=00, AAAA=0000)
+PRECISION_JOUR = 0       # date complète
+PRECISION_MOIS = 1       # jour inconnu (ou invalide pour ce mois)
+PRECISION_ANNEE = 2      # mois inconnu (ou invalide)
+PRECISION_INCONNUE = 3   # année inconnue, champ vide ou non numérique
+
+# Bornes retenues pour l’âge au décès (au-delà : valeur aberrante → manquante)
+AGE_MAX = 140
+
+_VIDE = b" " * 8
+
+
+def _octets_aaaammjj(valeurs) -> np.ndarray:
+    """
+    Matrice d’octets (n, 8) des dates AAAAMMJJ, sans passer par des objets Python.
+    Les valeurs manquantes ou d’une autre longueur que 8 octets sont remplacées par des espaces (non numériques).
+    """
+    texte = pa.array(valeurs, from_pandas=True)
+    if isinstance(texte, pa.ChunkedArray):
+        texte = texte.combine_chunks()
+    binaire = texte.cast(pa.binary())
+    binaire = pc.if_else(pc.equal(pc.binary_length(binaire), 8), binaire, _VIDE).fill_null(_VIDE)
+    fixe = binaire.cast(pa.binary(8))
+    octets = np.frombuffer(fixe.buffers()[1], dtype=np.uint8)
+    return octets[fixe.offset * 8:(fixe.offset + len(fixe)) * 8].reshape(len(fixe), 8)
+
+
+# Masques SWAR sur 8 octets (un mot de 64 bits par date)
+_OCTETS_30 = np.uint64(0x3030303030303030)
+_OCTETS_F0 = np.uint64(0xF0F0F0F0F0F0F0F0)
+_OCTETS_0F = np.uint64(0x0F0F0F0F0F0F0F0F)
+_OCTETS_06 = np.uint64(0x0606060606060606)
+_PAIRES = np.uint64(0x00FF00FF00FF00FF)
+
+# Nombre de jours de chaque mois (index 1..12) d’une année non bissextile
+_JOURS_MOIS = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int8)
+
+
+def decoder_aaaammjj(valeurs) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Découpe des dates AAAAMMJJ en tableaux entiers année / mois / jour, en une passe vectorisée :
+    chaque date (8 octets) est lue comme un entier 64 bits, chiffres validés et combinés par opérations de bits.
+    Les composantes inconnues valent 0 ; `precision` indique la partie fiable (voir `PRECISION_*`).
+
+    Returns:
+        tuple: annee (int16), mois (int8), jour (int8), precision (int8)
+    """
+    mots = np.ascontiguousarray(_octets_aaaammjj(valeurs)).view("<u8").ravel()
+
+    # Huit chiffres ASCII : quartet haut à 3 et quartet bas <= 9 (+6 ne déborde pas)
+    numeriques = ((mots & _OCTETS_F0) == _OCTETS_30) & (((mots + _OCTETS_06) & _OCTETS_F0) == _OCTETS_30)
+    chiffres = np.where(numeriques, mots & _OCTETS_0F, np.uint64(0))
+
+    # Paires de chiffres (premier caractère = octet de poids faible) : SS, AA, MM, JJ
+    paires = (chiffres * np.uint64(10) + (chiffres >> np.uint64(8))) & _PAIRES
+    siecle = (paires & np.uint64(0xFF)).astype(np.int16)
+    annee = siecle * 100 + ((paires >> np.uint64(16)) & np.uint64(0xFF)).astype(np.int16)
+    mois = ((paires >> np.uint64(32)) & np.uint64(0xFF)).astype(np.int8)
+    jour = (paires >> np.uint64(48)).astype(np.int8)
+
+    mois_valide = (mois >= 1) & (mois <= 12)
+    bissextile = (annee % 4 == 0) & ((annee % 100 != 0) | (annee % 400 == 0))
+    jours_du_mois = _JOURS_MOIS[np.where(mois_valide, mois, 0)] + ((mois == 2) & bissextile)
+    jour_valide = mois_valide & (jour >= 1) & (jour <= jours_du_mois)
+
+    precision = np.full(len(annee), PRECISION_JOUR, dtype=np.int8)
+    precision[~jour_valide] = PRECISION_MOIS
+    precision[~mois_valide] = PRECISION_ANNEE
+    precision[~numeriques | (annee == 0)] = PRECISION_INCONNUE
+
+    mois = np.where(precision <= PRECISION_MOIS, mois, 0).astype(np.int8)
+    jour = np.where(precision == PRECISION_JOUR, jour, 0).astype(np.int8)
+    annee = np.where(precision <= PRECISION_ANNEE, annee, 0).astype(np.int16)
+    return annee, mois, jour, precision
+
+
+# ---------------------------------------------------------------------
+def jours_depuis_epoch(annee: np.ndarray, mois: np.ndarray, jour: np.ndarray) -> np.ndarray:
+    """
+    Nombre de jours depuis le 1970-01-01 (calendrier grégorien proleptique), en arithmétique entière.
+    """
+    a = annee.astype(np.int32) - (mois <= 2)
+    ere = np.floor_divide(a, 400)
+    annee_ere = a - ere * 400
+    m = mois.astype(np.int32)
+    jour_annee = (153 * np.where(m > 2, m - 3, m + 9) + 2) // 5 + jour.astype(np.int32) - 1
+    jour_ere = annee_ere * 365 + annee_ere // 4 - annee_ere // 100 + jour_annee
+    return ere * 146097 + jour_ere - 719468
+
+
+def dates_completes(annee: np.ndarray, mois: np.ndarray, jour: np.ndarray, precision: np.ndarray) -> pd.Series:
+    """
+    Dates `date32[pyarrow]` ; les dates partielles sont manquantes (année / mois restent dans les tableaux entiers).
+    """
+    jours = jours_depuis_epoch(annee, mois, jour)
+    tableau = pa.array(jours, type=pa.int32(), mask=precision != PRECISION_JOUR).cast(pa.date32())
+    return pd.Series(pd.arrays.ArrowExtensionArray(tableau))
+
+
+def age_revolu(naissance: tuple, deces: tuple) -> pd.Series:
+    """
+    Âge au décès en années révolues, en arithmétique entière sur les tuples (annee, mois, jour, precision).
+
+    Les dates partielles gardent un âge : seules les composantes connues des deux dates départagent
+    l’anniversaire (à défaut, il est réputé passé) — l’écart est d’au plus un an, signalé par la précision.
+    Année inconnue ou âge hors de [0, AGE_MAX] : valeur manquante.
+    """
+    an_n, mois_n, jour_n, prec_n = naissance
+    an_d, mois_d, jour_d, prec_d = deces
+    an_n, an_d = an_n.astype(np.int16), an_d.astype(np.int16)
+
+    mois_connus = (prec_n <= PRECISION_MOIS) & (prec_d <= PRECISION_MOIS)
+    jours_connus = (prec_n == PRECISION_JOUR) & (prec_d == PRECISION_JOUR)
+    avant_anniversaire = np.where(
+        jours_connus,
+        (mois_d.astype(np.int16) * 100 + jour_d) < (mois_n.astype(np.int16) * 100 + jour_n),
+        mois_connus & (mois_d < mois_n),
+    )
+    age = an_d - an_n - avant_anniversaire
+    manquant = (prec_n == PRECISION_INCONNUE) | (prec_d == PRECISION_INCONNUE) | (age < 0) | (age > AGE_MAX)
+    return pd.Series(pd.arrays.IntegerArray(age.astype(np.int16), manquant))
@@ -0,0 +1,158 @@
+import threading
+import duckdb
+import pandas as pd
+from collections import OrderedDict
+from utils.logger import Logger, Span
+from utils.sql import requete
+
+LOG = Logger()
+
+# Colonnes affichées (et triables) par l’explorateur
+COLONNES_EXPLORATEUR = [
+    "nom_prenom",
+    "sexe",
+    "date_naissance",
+    "commune_naissance",
+    "pays_naissance",
+    "date_deces",
+    "age_deces",
+    "code_lieu_deces",
+    "numero_acte",
+]
+
+# Pages lues par requête : la page demandée et les suivantes (pré-chargement), gardées en cache
+PAGES_PAR_BLOC = 5
+BLOCS_EN_CACHE = 64
+
+
+class Explorateur:
+    """
+    Navigation paginée dans le jeu décès sur disque (vue SQL `deces_lignes`) : filtres, tri et page sont
+    exécutés par DuckDB au plus près des fichiers (partitions et statistiques Parquet), seules les lignes
+    d’un bloc (page + pré-chargement) sont matérialisées. Les blocs récents sont gardés (LRU) :
+    feuilleter les pages voisines ne relance pas de requête.
+
+    Le tri est complété par la position de chaque ligne (fichier, ligne) : l’ordre est total,
+    deux pages consécutives ne se recouvrent jamais.
+    """
+
+    def __init__(self, con: duckdb.DuckDBPyConnection):
+        self.con = con
+        self._blocs = OrderedDict()
+        self._totaux = OrderedDict()
+        self._verrou = threading.Lock()
+
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _conditions(
+        annees: list[int] | None = None,
+        sexes: list[str] | None = None,
+        age_min: int | None = None,
+        age_max: int | None = None,
+        colonne_texte: str | None = None,
+        texte: str | None = None,
+    ) -> tuple[str, dict]:
+        conditions, parametres = ["TRUE"], {}
+        if annees is not None:
+            conditions.append("list_contains($annees, annee_deces)")
+            parametres["annees"] = [int(a) for a in annees]
+        if sexes is not None:
+            conditions.append("list_contains($sexes, sexe)")
+            parametres["sexes"] = [str(s) for s in sexes]
+        if age_min is not None:
+            conditions.append("age_deces >= $age_min")
+            parametres["age_min"] = int(age_min)
+        if age_max is not None:
+            conditions.append("age_deces <= $age_max")
+            parametres["age_max"] = int(age_max)
+        if texte:
+            if colonne_texte not in COLONNES_EXPLORATEUR:
+                raise ValueError(f"Colonne inconnue : {colonne_texte}")
+            conditions.append(f"contains(upper(CAST({colonne_texte} AS VARCHAR)), upper($texte))")
+            parametres["texte"] = texte
+        return " AND ".join(conditions), parametres
+
+    @staticmethod
+    def _cle(criteres: dict) -> tuple:
+        return tuple(sorted((nom, tuple(v) if isinstance(v, list) else v) for nom, v in criteres.items()))
+
+    def _garder(self, cache: OrderedDict, cle, valeur):
+        with self._verrou:
+            cache[cle] = valeur
+            cache.move_to_end(cle)
+            while len(cache) > BLOCS_EN_CACHE:
+                cache.popitem(last=False)
+
+    def _lire(self, cache: OrderedDict, cle):
+        with self._verrou:
+            if cle in cache:
+                cache.move_to_end(cle)
+                return cache[cle]
+        return None
+
+    # -----------------------------------------------------------------
+    def compter(self, **criteres) -> int:
+        """
+        Nombre de lignes retenues par les critères (voir `_conditions`).
+        """
+        cle = self._cle(criteres)
+        total = self._lire(self._totaux, cle)
+        if total is None:
+            where, parametres = self._conditions(**criteres)
+            total = int(self.con.cursor().execute(f"SELECT count(*) FROM deces WHERE {where}", parametres).fetchone()[0])
+            self._garder(self._totaux, cle, total)
+        return total
+
+    @staticmethod
+    def _apres(tri: str, decroissant: bool, derniere: pd.Series) -> tuple[str, dict]:
+        """
+        Condition « strictement après `derniere` » dans l’ordre (tri, fichier, ligne), valeurs nulles en dernier.
+        """
+        parametres = {"apres_fichier": derniere["_fichier"], "apres_ligne": int(derniere["_ligne"])}
+        position = "(filename > $apres_fichier OR (filename = $apres_fichier AND file_row_number > $apres_ligne))"
+        if pd.isna(derniere["_cle"]):
+            return f"{tri} IS NULL AND {position}", parametres
+        parametres["apres_cle"] = derniere["_cle"]
+        comparaison = "<" if decroissant else ">"
+        return f"({tri} {comparaison} $apres_cle OR {tri} IS NULL OR ({tri} = $apres_cle AND {position}))", parametres
+
+    def page(self, numero: int, taille: int = 100, tri: str = "date_deces", decroissant: bool = False, **criteres) -> pd.DataFrame:
+        """
+        Lignes de la page `numero` (à partir de 0) pour le tri et les critères donnés.
+
+        Si le bloc précédent est en cache (page suivante), la lecture reprend après sa dernière ligne
+        (pagination par clé) : DuckDB ne garde alors que `taille × PAGES_PAR_BLOC` lignes, quelle que soit
+        la profondeur. Sinon (saut direct), le bloc est lu par `OFFSET`.
+        Chaque appel est mesuré (span `explorateur.page`, attribut `origine` : cache ou requete).
+        """
+        if tri not in COLONNES_EXPLORATEUR:
+            raise ValueError(f"Colonne de tri inconnue : {tri}")
+        taille_bloc = taille * PAGES_PAR_BLOC
+        debut_bloc = (numero * taille) // taille_bloc * taille_bloc
+        cle = (self._cle(criteres), tri, decroissant, taille_bloc)
+
+        with Span("explorateur.page", tri=tri) as span_page:
+            bloc = self._lire(self._blocs, cle + (debut_bloc,))
+            span_page.attributs["origine"] = "cache" if bloc is not None else "requete"
+            if bloc is None:
+                where, parametres = self._conditions(**criteres)
+                precedent = self._lire(self._blocs, cle + (debut_bloc - taille_bloc,)) if debut_bloc else None
+                if precedent is not None and len(precedent) == taille_bloc:
+                    apres, parametres_apres = self._apres(tri, decroissant, precedent.iloc[-1])
+                    where, parametres, decalage = f"{where} AND {apres}", parametres | parametres_apres, 0
+                else:
+                    decalage = debut_bloc
+                sens = "DESC" if decroissant else "ASC"
+                sql = f"""
+                    SELECT {', '.join(COLONNES_EXPLORATEUR)}, {tri} AS _cle, filename AS _fichier, file_row_number AS _ligne
+                    FROM deces_lignes
+                    WHERE {where}
+                    ORDER BY {tri} {sens} NULLS LAST, filename, file_row_number
+                    LIMIT {taille_bloc} OFFSET {decalage}
+                """
+                with Span("explorateur.bloc", tri=tri, debut=debut_bloc, par_cle=decalage != debut_bloc):
+                    bloc = requete(self.con.cursor(), sql, parametres)
+                self._garder(self._blocs, cle + (debut_bloc,), bloc)
+
+        debut = numero * taille - debut_bloc
+        return bloc.iloc[debut:debut + taille, :len(COLONNES_EXPLORATEUR)].reset_index(drop=True)
@@ -0,0 +1,142 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Callable
+from collections import OrderedDict
+from plotly.utils import PlotlyJSONEncoder
+from utils.logger import Logger, Span
+
+LOG = Logger()
+
+# Dossier des figures sérialisées (préfixe `_` : ignoré lors de la découverte du jeu partitionné)
+DOSSIER_FIGURES = "_figures"
+
+# Taille maximale sur disque (Mo), surchargeable par DASHBOARD_FIGURES_BUDGET_MO ; au-delà, éviction LRU
+BUDGET_MO_DEFAUT = 256
+
+# Entrées gardées en mémoire par processus (texte JSON : chaque lecture décode sa propre copie,
+# Plotly modifiant transitoirement les dictionnaires qu’il valide, qui ne peuvent être partagés entre sessions)
+ENTREES_EN_MEMOIRE = 64
+
+
+def cle_figures(section: str, version: str, filtres: dict) -> str:
+    """
+    Clé de contenu d’un état de filtres : `{version}-{empreinte}` (la version en clair permet de purger
+    les entrées des versions précédentes du jeu). `filtres` doit être canonique (listes triées…).
+    """
+    empreinte = hashlib.sha256(json.dumps([section, filtres], sort_keys=True).encode("utf-8")).hexdigest()[:32]
+    return f"{version}-{empreinte}"
+
+
+class CacheFigures:
+    """
+    Cache adressé par contenu des figures Plotly d’une section : une entrée (JSON : figures sérialisées
+    et valeurs associées) par (section, version du jeu, valeurs des filtres), partagée par toutes les
+    sessions et tous les processus (`_figures/` sur disque), les dernières entrées restant en mémoire.
+
+    La taille sur disque est bornée par `budget_octets` : les entrées les moins récemment lues
+    (date de modification rafraîchie à chaque lecture) sont supprimées.
+    """
+
+    def __init__(self, base_dir: Path, budget_octets: int | None = None):
+        if budget_octets is None:
+            budget_octets = int(os.environ.get("DASHBOARD_FIGURES_BUDGET_MO", BUDGET_MO_DEFAUT)) * 1024 * 1024
+        self.dossier = base_dir / DOSSIER_FIGURES
+        self.budget_octets = budget_octets
+        self._memoire = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def _chemin(self, cle: str) -> Path:
+        return self.dossier / f"{cle}.json"
+
+    # -----------------------------------------------------------------
+    def lire(self, cle: str) -> dict | None:
+        return self._lire(cle)[0]
+
+    def _lire(self, cle: str) -> tuple[dict | None, str | None]:
+        """
+        Entrée `cle` et son origine (« memoire » ou « disque »), `(None, None)` si absente.
+        """
+        with self._verrou:
+            texte = self._memoire.get(cle)
+            if texte is not None:
+                self._memoire.move_to_end(cle)
+        if texte is not None:
+            return json.loads(texte), "memoire"
+        chemin = self._chemin(cle)
+        try:
+            texte = chemin.read_text(encoding="utf-8")
+            contenu = json.loads(texte)
+            os.utime(chemin)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None, None
+        self._garder(cle, texte)
+        return contenu, "disque"
+
+    def ecrire(self, cle: str, contenu: dict) -> dict:
+        """
+        Sérialise `contenu` (figures Plotly, tableaux numpy acceptés) et renvoie sa forme décodée,
+        identique à celle d’une lecture ultérieure.
+        """
+        texte = json.dumps(contenu, cls=PlotlyJSONEncoder)
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        tmp = self.dossier / f".{cle}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_text(texte, encoding="utf-8")
+        os.replace(tmp, self._chemin(cle))
+        self._evincer()
+        self._garder(cle, texte)
+        return json.loads(texte)
+
+    def obtenir(self, section: str, version: str, filtres: dict, construire: Callable[[], dict]) -> dict:
+        """
+        Entrée des filtres donnés, lue dans le cache ou construite par `construire()` puis gardée.
+        Chaque appel est mesuré (span `figures.obtenir`, attribut `origine` : memoire, disque ou construite).
+        """
+        cle = cle_figures(section, version, filtres)
+        with Span("figures.obtenir", section=section) as span:
+            contenu, origine = self._lire(cle)
+            if contenu is None:
+                with Span("figures.construire", section=section):
+                    contenu, origine = self.ecrire(cle, construire()), "construite"
+            span.attributs["origine"] = origine
+        return contenu
+
+    # -----------------------------------------------------------------
+    def _garder(self, cle: str, texte: str):
+        with self._verrou:
+            self._memoire[cle] = texte
+            self._memoire.move_to_end(cle)
+            while len(self._memoire) > ENTREES_EN_MEMOIRE:
+                self._memoire.popitem(last=False)
+
+    def _entrees(self) -> list[tuple[float, int, Path]]:
+        entrees = []
+        for chemin in self.dossier.glob("*.json"):
+            try:
+                etat = chemin.stat()
+            except FileNotFoundError:
+                continue
+            entrees.append((etat.st_mtime, etat.st_size, chemin))
+        return sorted(entrees)
+
+    def _evincer(self):
+        entrees = self._entrees()
+        total = sum(taille for _, taille, _ in entrees)
+        for _, taille, chemin in entrees:
+            if total <= self.budget_octets:
+                break
+            chemin.unlink(missing_ok=True)
+            total -= taille
+
+    def purger(self, version: str) -> int:
+        """
+        Supprime les entrées des autres versions du jeu ; renvoie le nombre de fichiers supprimés.
+        """
+        anciennes = [chemin for _, _, chemin in self._entrees() if not chemin.name.startswith(f"{version}-")]
+        for chemin in anciennes:
+            chemin.unlink(missing_ok=True)
+        with self._verrou:
+            self._memoire.clear()
+        return len(anciennes)
@@ -0,0 +1,98 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.dates import AGE_MAX
+
+# Colonne de tri des tables indexées et colonnes couvertes par défaut par un bitmap
+COLONNE_TRI = "age_deces"
+COLONNES_BITMAP = ("sexe", "mois_deces")
+
+# Âge fictif des lignes sans âge (triées en dernier, hors de toute tranche d’âge)
+_AGE_MANQUANT = AGE_MAX + 1
+
+
+def trier_par_age(table: pa.Table) -> pa.Table:
+    """
+    Trie une table par âge au décès (âges manquants en dernier) : ordre attendu par `MoteurFiltres`.
+    """
+    return table.sort_by([(COLONNE_TRI, "ascending")])
+
+
+class MoteurFiltres:
+    """
+    Index d’une table triée par âge, construit une fois :
+    - `bornes` : première ligne de chaque âge → une tranche d’âge est un intervalle de lignes (O(1) / O(log n)) ;
+    - un bitmap compact (`np.packbits`, 1 bit par ligne) par valeur de chaque colonne de `colonnes_bitmap`.
+
+    Une sélection (valeurs retenues par colonne, tranche d’âge) se réduit à des OU / ET d’octets
+    sur l’intervalle d’âge, sans repasser sur les colonnes de la table.
+    Les valeurs sont indexées sous forme de chaînes (`"1"` pour le sexe comme pour janvier).
+    """
+
+    def __init__(self, table: pa.Table, colonnes_bitmap: tuple[str, ...] = COLONNES_BITMAP):
+        self.nb_lignes = table.num_rows
+        ages = pc.fill_null(table.column(COLONNE_TRI), _AGE_MANQUANT).to_numpy().astype(np.int16)
+        if np.any(ages[1:] < ages[:-1]):
+            raise ValueError("Table non triée par âge : utiliser `trier_par_age`.")
+        self.bornes = np.searchsorted(ages, np.arange(_AGE_MANQUANT + 2), side="left")
+
+        self.bitmaps = {}
+        for nom in colonnes_bitmap:
+            colonne = table.column(nom)
+            if pa.types.is_dictionary(colonne.type):
+                colonne = colonne.cast(colonne.type.value_type)
+            codes = pc.dictionary_encode(colonne).combine_chunks()
+            indices = pc.fill_null(codes.indices, -1).to_numpy()
+            self.bitmaps[nom] = {
+                str(valeur.as_py()): np.packbits(indices == i)
+                for i, valeur in enumerate(codes.dictionary)
+            }
+
+    @property
+    def nbytes(self) -> int:
+        return self.bornes.nbytes + sum(b.nbytes for valeurs in self.bitmaps.values() for b in valeurs.values())
+
+    def valeurs(self, nom: str) -> list[str]:
+        return sorted(self.bitmaps[nom])
+
+    # -----------------------------------------------------------------
+    def intervalle_age(self, age_min: int | None = None, age_max: int | None = None) -> tuple[int, int]:
+        """
+        Lignes [debut, fin) de la tranche d’âge (bornes incluses) ; sans borne, toute la table (âges manquants compris).
+        """
+        if age_min is None and age_max is None:
+            return 0, self.nb_lignes
+        bas = 0 if age_min is None else int(np.clip(np.ceil(age_min), 0, _AGE_MANQUANT))
+        haut = AGE_MAX if age_max is None else int(np.clip(np.floor(age_max), -1, AGE_MAX))
+        if haut < bas:
+            return 0, 0
+        return int(self.bornes[bas]), int(self.bornes[haut + 1])
+
+    def selection(self, age_min: int | None = None, age_max: int | None = None, **valeurs) -> np.ndarray:
+        """
+        Indices (triés) des lignes retenues, par ex. `selection(0, 60, sexe=["2"], mois_deces=[1, 2])`.
+        Les critères à None ne filtrent pas.
+        """
+        debut, fin = self.intervalle_age(age_min, age_max)
+        if debut >= fin:
+            return np.empty(0, dtype=np.int64)
+
+        criteres = [(nom, retenues) for nom, retenues in valeurs.items() if retenues is not None]
+        if not criteres:
+            return np.arange(debut, fin, dtype=np.int64)
+
+        # Octets couvrant [debut, fin) : les ET / OU ne portent que sur l’intervalle d’âge
+        octet_debut, octet_fin = debut // 8, (fin + 7) // 8
+        masque = None
+        for nom, retenues in criteres:
+            union = np.zeros(octet_fin - octet_debut, dtype=np.uint8)
+            for valeur in retenues:
+                bitmap = self.bitmaps[nom].get(str(valeur))
+                if bitmap is not None:
+                    union |= bitmap[octet_debut:octet_fin]
+            masque = union if masque is None else masque & union
+
+        bits = np.unpackbits(masque)[debut - octet_debut * 8:fin - octet_debut * 8]
+        return np.flatnonzero(bits) + debut
+
@@ -0,0 +1,243 @@
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pathlib import Path
+from functools import lru_cache
+from utils.logger import Logger, Span
+
+LOG = Logger()
+
+# Couches géographiques construites hors ligne (`main_geo.py`) et référentiel des codes COG
+DOSSIER_GEO = Path("data_processed/geo")
+FICHIER_COG = "cog.parquet"
+
+# Niveaux de détail : tolérance de simplification (mètres, Lambert-93) et décimales conservées (WGS84)
+ZOOMS = {
+    "fin": (100, 5),
+    "moyen": (1_000, 4),
+    "grossier": (5_000, 3),
+}
+NIVEAUX = ("region", "departement", "commune")
+
+SCHEMA_COG = pa.schema([
+    ("code_commune", pa.string()),
+    ("code_actuel", pa.string()),
+    ("departement", pa.string()),
+    ("region", pa.string()),
+])
+
+# Régions (découpage 2016) et leurs départements ; « 20 » : Corse avant 1976
+REGIONS = {
+    "01": ("Guadeloupe", ["971"]),
+    "02": ("Martinique", ["972"]),
+    "03": ("Guyane", ["973"]),
+    "04": ("La Réunion", ["974"]),
+    "06": ("Mayotte", ["976"]),
+    "11": ("Île-de-France", ["75", "77", "78", "91", "92", "93", "94", "95"]),
+    "24": ("Centre-Val de Loire", ["18", "28", "36", "37", "41", "45"]),
+    "27": ("Bourgogne-Franche-Comté", ["21", "25", "39", "58", "70", "71", "89", "90"]),
+    "28": ("Normandie", ["14", "27", "50", "61", "76"]),
+    "32": ("Hauts-de-France", ["02", "59", "60", "62", "80"]),
+    "44": ("Grand Est", ["08", "10", "51", "52", "54", "55", "57", "67", "68", "88"]),
+    "52": ("Pays de la Loire", ["44", "49", "53", "72", "85"]),
+    "53": ("Bretagne", ["22", "29", "35", "56"]),
+    "75": ("Nouvelle-Aquitaine", ["16", "17", "19", "23", "24", "33", "40", "47", "64", "79", "86", "87"]),
+    "76": ("Occitanie", ["09", "11", "12", "30", "31", "32", "34", "46", "48", "65", "66", "81", "82"]),
+    "84": ("Auvergne-Rhône-Alpes", ["01", "03", "07", "15", "26", "38", "42", "43", "63", "69", "73", "74"]),
+    "93": ("Provence-Alpes-Côte d’Azur", ["04", "05", "06", "13", "83", "84"]),
+    "94": ("Corse", ["2A", "2B", "20"]),
+}
+REGION_DEPARTEMENT = {dep: reg for reg, (_, deps) in REGIONS.items() for dep in deps}
+
+
+#######################################################################
+#                       RÉFÉRENTIEL COG
+#######################################################################
+def departement(codes: pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    """
+    Département d’un code COG à 5 caractères d’après son seul préfixe : 2 premiers caractères (dont 2A / 2B),
+    3 pour l’outre-mer (97x, 98x), `99` pour l’étranger. Repli de `ReferentielCOG` pour les codes inconnus.
+    """
+    if pa.types.is_dictionary(codes.type):
+        codes = codes.cast(pa.string())
+    outre_mer = pc.or_(pc.starts_with(codes, "97"), pc.starts_with(codes, "98"))
+    return pc.if_else(outre_mer, pc.utf8_slice_codeunits(codes, 0, 3), pc.utf8_slice_codeunits(codes, 0, 2))
+
+
+def table_cog(fichier_communes: Path | None = None, fichier_mouvements: Path | None = None) -> pa.Table:
+    """
+    Table code commune → code actuel → département → région, d’après les fichiers COG de l’INSEE :
+    `v_commune_AAAA.csv` (communes, communes déléguées / associées, arrondissements municipaux)
+    et `v_mvt_commune_AAAA.csv` (fusions, changements de code depuis 1943) : un code disparu est
+    rattaché à la commune qui l’a absorbé, en suivant les mouvements successifs.
+    """
+    lignes = []
+    if fichier_communes is not None:
+        communes = pd.read_csv(fichier_communes, dtype=str, usecols=["COM", "DEP", "REG"])
+        lignes.append(communes.rename(columns={"COM": "code_commune", "DEP": "departement", "REG": "region"})
+                      .assign(code_actuel=lambda df: df["code_commune"]))
+    actuelles = pd.concat(lignes).drop_duplicates("code_commune") if lignes else pd.DataFrame(columns=SCHEMA_COG.names)
+
+    if fichier_mouvements is not None:
+        mvt = pd.read_csv(fichier_mouvements, dtype=str, usecols=["DATE_EFF", "COM_AV", "COM_AP"])
+        mvt = mvt[mvt["COM_AV"] != mvt["COM_AP"]].sort_values("DATE_EFF")
+        # Dernier mouvement connu de chaque ancien code, puis chaînage jusqu’au code actuel (boucles écartées)
+        successeur = mvt.drop_duplicates("COM_AV", keep="last").set_index("COM_AV")["COM_AP"]
+        anciens = pd.Series(successeur.index.difference(actuelles["code_commune"]), dtype=object)
+        code = anciens.map(successeur)
+        for _ in range(20):
+            suivant = code.map(successeur).fillna(code)
+            if suivant.equals(code):
+                break
+            code = suivant
+        historiques = pd.DataFrame({"code_commune": anciens, "code_actuel": code})
+        historiques = historiques.merge(actuelles[["code_commune", "departement", "region"]]
+                                        .rename(columns={"code_commune": "code_actuel"}), on="code_actuel", how="left")
+        actuelles = pd.concat([actuelles, historiques], ignore_index=True)
+
+    return pa.Table.from_pandas(actuelles[SCHEMA_COG.names], schema=SCHEMA_COG, preserve_index=False)
+
+
+class ReferentielCOG:
+    """
+    Rattachement vectorisé de codes COG (`code_lieu_deces`, `code_lieu_naissance`…) à leur département
+    et à leur région. Les codes présents dans `cog.parquet` (codes actuels et historiques) suivent le
+    référentiel ; les autres (référentiel absent, code inconnu) sont rattachés par leur préfixe
+    (`departement`), « 99 » pour l’étranger. Le calcul porte sur les codes distincts.
+    """
+
+    def __init__(self, dossier: Path = DOSSIER_GEO):
+        chemin = dossier / FICHIER_COG
+        self.table = pq.read_table(chemin, schema=SCHEMA_COG) if chemin.exists() else SCHEMA_COG.empty_table()
+
+    def rattacher(self, codes: pa.Array | pa.ChunkedArray) -> pa.Table:
+        """
+        Départements et régions de `codes` (même longueur, nuls si le code est nul ou la région inconnue).
+        """
+        if isinstance(codes, pa.ChunkedArray):
+            codes = codes.combine_chunks()
+        if not pa.types.is_dictionary(codes.type):
+            codes = pc.dictionary_encode(codes)
+        distincts = codes.dictionary.cast(pa.string())
+
+        position = pc.index_in(distincts, value_set=self.table["code_commune"])
+        departements = pc.coalesce(pc.take(self.table["departement"], position), departement(distincts))
+        regions = pc.coalesce(pc.take(self.table["region"], position), region(departements))
+
+        return pa.table({
+            "departement": pc.take(departements, codes.indices),
+            "region": pc.take(regions, codes.indices),
+        })
+
+
+@lru_cache(maxsize=4)
+def _referentiel(dossier: Path, mtime_ns: int) -> ReferentielCOG:
+    return ReferentielCOG(dossier)
+
+
+def referentiel_cog(dossier: Path = DOSSIER_GEO) -> ReferentielCOG:
+    """
+    Référentiel COG partagé par le processus (relu quand `cog.parquet` change, voir `main_geo.py`).
+    """
+    chemin = dossier / FICHIER_COG
+    return _referentiel(dossier, chemin.stat().st_mtime_ns if chemin.exists() else 0)
+
+
+def region(departements: pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    """
+    Région (code INSEE) de codes département ; nul hors régions (étranger, collectivités d’outre-mer).
+    """
+    cles = pa.array(list(REGION_DEPARTEMENT))
+    return pc.take(pa.array(list(REGION_DEPARTEMENT.values())), pc.index_in(departements, value_set=cles))
+
+
+#######################################################################
+#                       COUCHES GÉOGRAPHIQUES (hors ligne)
+#######################################################################
+def _simplifier(geometries, tolerance: float):
+    """
+    Simplification par couverture (frontières communes simplifiées une seule fois : ni trou ni recouvrement)
+    si GEOS ≥ 3.12 ; sinon simplification de chaque polygone.
+    """
+    import shapely
+
+    if hasattr(shapely, "coverage_simplify"):
+        return shapely.coverage_simplify(np.asarray(geometries), tolerance)
+    return shapely.simplify(np.asarray(geometries), tolerance, preserve_topology=True)
+
+
+def construire_couches(
+    fichier_communes: Path,
+    dossier: Path = DOSSIER_GEO,
+    colonne_code: str | None = None,
+    avec_communes: bool = False,
+) -> list[Path]:
+    """
+    Construit les couches région / département (et commune si demandé) à chaque niveau de `ZOOMS`,
+    à partir d’un fichier de contours communaux (Admin Express, Etalab… : tout format lu par geopandas) :
+    `{niveau}_{zoom}.parquet` (GeoParquet) et `{niveau}_{zoom}.geojson` (propriétés `code`, `nom`),
+    prêt à être servi tel quel à Plotly.
+    """
+    # Import local : geopandas n’est nécessaire qu’à la construction des couches
+    import shapely
+    import geopandas as gpd
+
+    communes = gpd.read_file(fichier_communes)
+    if colonne_code is None:
+        colonne_code = next(c for c in ("INSEE_COM", "insee", "code", "CODE_INSEE", "codgeo") if c in communes.columns)
+    communes = communes[[colonne_code, "geometry"]].rename(columns={colonne_code: "code"}).to_crs(2154)
+    communes["geometry"] = communes.geometry.make_valid()
+
+    codes = ReferentielCOG(dossier).rattacher(pa.array(communes["code"].astype(str)))
+    communes["departement"] = codes["departement"].to_pandas()
+    communes["region"] = codes["region"].to_pandas()
+
+    couches = {
+        "region": communes.dissolve("region", as_index=False)[["region", "geometry"]].rename(columns={"region": "code"}),
+        "departement": communes.dissolve("departement", as_index=False)[["departement", "geometry"]].rename(columns={"departement": "code"}),
+    }
+    couches["region"]["nom"] = couches["region"]["code"].map(lambda code: REGIONS.get(code, (code,))[0])
+    couches["departement"]["nom"] = couches["departement"]["code"]
+    if avec_communes:
+        couches["commune"] = communes[["code", "geometry"]].assign(nom=communes["code"])
+
+    dossier.mkdir(parents=True, exist_ok=True)
+    ecrits = []
+    for niveau, couche in couches.items():
+        for zoom, (tolerance, decimales) in ZOOMS.items():
+            with Span("geo.couche", niveau=niveau, zoom=zoom) as span:
+                simplifiee = couche.set_geometry(_simplifier(couche.geometry.values, tolerance), crs=couche.crs).to_crs(4326)
+                simplifiee["geometry"] = shapely.set_precision(simplifiee.geometry.values, 10 ** -decimales)
+                simplifiee.to_parquet(dossier / f"{niveau}_{zoom}.parquet", index=False)
+                chemin = dossier / f"{niveau}_{zoom}.geojson"
+                chemin.write_text(simplifiee[["code", "nom", "geometry"]].to_json(drop_id=True), encoding="utf-8")
+                span.lignes_sortie = len(simplifiee)
+            ecrits.append(chemin)
+            LOG.info(f"Couche {niveau} ({zoom}) : {len(simplifiee)} contours, {chemin.stat().st_size / 1024:,.0f} Ko")
+    return ecrits
+
+
+#######################################################################
+#                       LECTURE (tableau de bord)
+#######################################################################
+def chemin_couche(niveau: str, zoom: str = "moyen", dossier: Path = DOSSIER_GEO) -> Path:
+    return dossier / f"{niveau}_{zoom}.geojson"
+
+
+@lru_cache(maxsize=16)
+def _lire_couche(chemin: Path, mtime_ns: int) -> dict:
+    with Span("geo.lire_couche", fichier=chemin.name):
+        return json.loads(chemin.read_text(encoding="utf-8"))
+
+
+def charger_couche(niveau: str, zoom: str = "moyen", dossier: Path = DOSSIER_GEO) -> dict | None:
+    """
+    Couche GeoJSON pré-calculée (gardée en mémoire tant que le fichier ne change pas), `None` si absente.
+    """
+    chemin = chemin_couche(niveau, zoom, dossier)
+    if not chemin.exists():
+        return None
+    return _lire_couche(chemin, chemin.stat().st_mtime_ns)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Dossier de l’index (préfixe `_` : ignoré lors de la découverte du jeu partitionné)
+DOSSIER_INDEX = "_index"
+
+# Champs bruts identifiant un acte de décès
+COLONNES_CLE = ["numero_acte", "code_lieu_deces", "date_deces"]
+
+
+def cles_deces(df: pd.DataFrame) -> np.ndarray:
+    """
+    Clé 64 bits de chaque enregistrement (hachage vectorisé de `COLONNES_CLE`),
+    calculée sur les champs bruts, avant nettoyage : les dates partielles restent distinctes.
+    """
+    return pd.util.hash_pandas_object(df[COLONNES_CLE], index=False).to_numpy(dtype=np.uint64)
+
+
+# ---------------------------------------------------------------------
+def ecrire_segment(dossier: Path, nom_base: str, cles: list[np.ndarray]) -> str:
+    """
+    Écrit le segment d’index d’un fichier source : clés uniques triées (`_index/{nom_base}.npy`).
+
+    Returns:
+        str: chemin du segment relatif à `dossier`
+    """
+    chemin = Path(DOSSIER_INDEX) / f"{nom_base}.npy"
+    (dossier / chemin).parent.mkdir(parents=True, exist_ok=True)
+    segment = np.unique(np.concatenate(cles)) if cles else np.empty(0, dtype=np.uint64)
+    np.save(dossier / chemin, segment)
+    return chemin.as_posix()
+
+
+class IndexDeces:
+    """
+    Index des enregistrements déjà stockés, découpé en un segment trié par fichier source.
+    Les segments sont projetés en mémoire (`mmap`) : une recherche coûte O(log n) par clé et par segment,
+    l’ajout d’un fichier mensuel n’écrit que son propre segment.
+    """
+
+    def __init__(self, base_dir: Path, exclure: str | None = None):
+        # `exclure` : segment du fichier en cours de (ré)ingestion, qui ne doit pas se dédoublonner lui-même
+        self.segments = [
+            np.load(chemin, mmap_mode="r")
+            for chemin in sorted((base_dir / DOSSIER_INDEX).glob("*.npy"))
+            if chemin.stem != exclure
+        ]
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    def contient(self, cles: np.ndarray) -> np.ndarray:
+        """
+        Masque booléen : vrai pour les clés déjà présentes dans un segment.
+        """
+        connues = np.zeros(len(cles), dtype=bool)
+        for segment in self.segments:
+            if not len(segment):
+                continue
+            pos = np.minimum(np.searchsorted(segment, cles), len(segment) - 1)
+            connues |= segment[pos] == cles
+        return connues
@@ -1,8 +1,43 @@
 import os
+import re
+import json
+import shutil
+import hashlib
+from datetime import date
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
 from tqdm import tqdm
 from pathlib import Path
-from utils.logger import Logger
+from typing import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from numpy.lib.stride_tricks import sliding_window_view
+from utils.logger import Logger, Span, initialiser_journal_processus, profiler, queue_journal_processus
+from utils.cube import DOSSIER_CUBE, cumuler_cube, fusionner
+from utils.dates import PRECISION_ANNEE, PRECISION_MOIS, age_revolu, dates_completes, decoder_aaaammjj
+from utils.index_deces import DOSSIER_INDEX, IndexDeces, cles_deces, ecrire_segment
+from utils.recherche import DOSSIER_RECHERCHE, ecrire_segment_recherche
+from utils.schema import (
+    SCHEMA_DECES,
+    SCHEMA_STOCKAGE_DECES,
+    COLONNES_CATEGORIELLES_DECES,
+    COLONNES_NAISSANCES,
+    COLONNES_CATEGORIELLES_NAISSANCES,
+    COLONNES_DICTIONNAIRE_DECES,
+    SCHEMA_NAISSANCES,
+    SCHEMA_STOCKAGE_NAISSANCES,
+    COLONNES_VIOLENCES,
+    COLONNES_CATEGORIELLES_VIOLENCES,
+    SCHEMA_VIOLENCES,
+    SCHEMA_STOCKAGE_VIOLENCES,
+    table_vers_pandas,
+    typer_deces,
+)
 
 LOG = Logger()
 
@@ -10,66 +45,227 @@ LOG = Logger()
 #######################################################################
 #                           DECES
 #######################################################################
-def lire_fichier_deces(fichier: Path) -> pd.DataFrame:
+# Positions (en caractères) des champs du fichier décès INSEE
+COLSPECS_DECES = [
+    (0, 80),        # nom + prénom
+    (80, 81),       # sexe
+    (81, 89),       # date naissance AAAAMMJJ
+    (89, 94),       # code lieu naissance
+    (94, 124),      # commune naissance
+    (124, 154),     # pays naissance
+    (154, 162),     # date décès AAAAMMJJ
+    (162, 167),     # code lieu décès
+    (167, 176)      # numéro d’acte
+]
+NOMS_DECES = [
+    "nom_prenom",
+    "sexe",
+    "date_naissance",
+    "code_lieu_naissance",
+    "commune_naissance",
+    "pays_naissance",
+    "date_deces",
+    "code_lieu_deces",
+    "numero_acte"
+]
+
+# Nombre (approximatif) de lignes décodées par lot lors de la lecture en flux
+LIGNES_PAR_LOT = 250_000
+
+# Découpage Hive du jeu décès : annee_deces=AAAA/mois_deces=M/sexe=S/
+PARTITIONNEMENT_DECES = ds.partitioning(
+    pa.schema([
+        ("annee_deces", pa.int16()),
+        ("mois_deces", pa.int8()),
+        ("sexe", pa.string()),
+    ]),
+    flavor="hive",
+)
+
+# Fichiers de données du jeu décès partitionné : le cube `_cube/`, l’index `_index/`, la recherche `_recherche/`,
+# les temporaires `.*` et les fichiers annexes du dossier (README, manifeste…) sont exclus
+MOTIF_DECES = "annee_deces=*/mois_deces=*/sexe=*/*.parquet"
+
+# Système de fichiers local avec projection mémoire (`mmap`) : les pages Parquet sont lues à la demande
+# par le noyau, sans copie préalable dans un tampon du processus
+FS_MMAP = fs.LocalFileSystem(use_mmap=True)
+
+# Lecture Parquet : les colonnes de codes / noms de lieux sont décodées directement en dictionnaire Arrow
+FORMAT_PARQUET_DECES = ds.ParquetFileFormat(
+    read_options=ds.ParquetReadOptions(dictionary_columns=COLONNES_DICTIONNAIRE_DECES)
+)
+
+# Disposition physique des fichiers du jeu partitionné (voir `EcrivainPartitions`) :
+# lignes triées par date puis lieu de décès → statistiques min / max serrées par row group
+TRI_DECES = [("date_deces", "ascending"), ("code_lieu_deces", "ascending")]
+LIGNES_PAR_ROW_GROUP = 32_768
+
+# Codes (lieux, numéro d’acte) recherchés par valeur exacte : filtres de Bloom pour les moteurs qui les lisent
+COLONNES_BLOOM_DECES = ["code_lieu_naissance", "code_lieu_deces", "numero_acte"]
+
+# Compression zstd : niveau courant pour les années récentes, plus fort pour les archives (rarement réécrites)
+ANNEES_RECENTES = 5
+NIVEAU_ZSTD = 3
+NIVEAU_ZSTD_ARCHIVE = 12
+
+# Longueur d'une ligne INSEE (198 caractères + fin de ligne), utilisée pour dimensionner les lectures
+_OCTETS_PAR_LIGNE = 200
+
+
+def _decouper_lignes(tampon: bytes) -> pd.DataFrame:
     """
-    Lecture du fichier décès INSEE au format FWF (largeur fixe)
+    Découpe un tampon brut (lignes complètes) en colonnes,
+    directement aux positions de `COLSPECS_DECES`, puis décode chaque colonne en un seul lot
+    (les lignes contenant des caractères multi-octets sont redécoupées à part, voir `_redecouper_lignes`).
     """
-    LOG.info(f"Lecture du fichier décès brut : {fichier}")
+    largeur = COLSPECS_DECES[-1][1]
+    octets = np.frombuffer(tampon, dtype=np.uint8)
+
+    # Début / longueur de chaque ligne (sans la fin de ligne '\n' ou '\r\n')
+    fins = np.flatnonzero(octets == 0x0A)
+    debuts = np.empty_like(fins)
+    debuts[0] = 0
+    debuts[1:] = fins[:-1] + 1
+    longueurs = fins - debuts
+    avec_cr = (longueurs > 0) & (octets[np.maximum(fins - 1, 0)] == 0x0D)
+    longueurs = longueurs - avec_cr
+
+    # Lignes vides ignorées (comme `read_fwf`)
+    non_vides = longueurs > 0
+    debuts, longueurs = debuts[non_vides], longueurs[non_vides]
+
+    # Matrice (n_lignes, largeur) : vue glissante sur le tampon complété par des espaces,
+    # les octets au-delà de la fin de chaque ligne sont remplacés par des espaces
+    complete = np.concatenate([octets, np.full(largeur, 0x20, dtype=np.uint8)])
+    matrice = sliding_window_view(complete, largeur)[debuts]
+    matrice[np.arange(largeur) >= longueurs[:, None]] = 0x20
+
+    colonnes = {}
+    for nom, (debut, fin) in zip(NOMS_DECES, COLSPECS_DECES):
+        brut = np.ascontiguousarray(matrice[:, debut:fin])
+        colonnes[nom] = _decoder_colonne(brut)
+
+    # Les positions INSEE comptent des caractères : un caractère multi-octets (ex: `É` dans le nom)
+    # décale tous les champs suivants de la ligne, qui est alors redécoupée caractère par caractère
+    non_ascii = np.flatnonzero((matrice >= 0x80).any(axis=1))
+    if len(non_ascii):
+        colonnes = _redecouper_lignes(tampon, debuts[non_ascii], longueurs[non_ascii], non_ascii, colonnes)
+    return pa.table(colonnes).to_pandas()
+
+
+def _redecouper_lignes(
+    tampon: bytes, debuts: np.ndarray, longueurs: np.ndarray, positions: np.ndarray, colonnes: dict
+) -> dict:
+    """
+    Remplace, dans les colonnes découpées aux positions d’octets, les valeurs des lignes non ASCII (`positions`)
+    par celles du découpage aux positions de caractères (lignes décodées une à une, peu nombreuses).
+    """
+    valeurs = {nom: [] for nom in NOMS_DECES}
+    for debut, longueur in zip(debuts.tolist(), longueurs.tolist()):
+        ligne = tampon[debut:debut + longueur].decode("utf-8", errors="replace")
+        for nom, (debut_champ, fin_champ) in zip(NOMS_DECES, COLSPECS_DECES):
+            valeurs[nom].append(ligne[debut_champ:fin_champ].strip() or None)
+
+    masque = np.zeros(len(colonnes[NOMS_DECES[0]]), dtype=bool)
+    masque[positions] = True
+    LOG.info(f"{len(positions):_} ligne(s) non ASCII redécoupée(s) aux positions de caractères")
+    return {
+        nom: pc.replace_with_mask(colonne, pa.array(masque), pa.array(valeurs[nom], type=pa.string()))
+        for nom, colonne in colonnes.items()
+    }
+
+
+def _decoder_colonne(brut: np.ndarray) -> pa.Array:
+    """
+    Décode une colonne à largeur fixe (matrice d’octets) en chaînes Arrow :
+    validation UTF-8, suppression des espaces et chaînes vides → null, en un seul lot.
+    """
+    n, largeur = brut.shape
+    binaire = pa.Array.from_buffers(pa.binary(largeur), n, [None, pa.py_buffer(brut)])
+    try:
+        texte = binaire.cast(pa.binary()).cast(pa.string())
+    except pa.ArrowInvalid:
+        # Octets non UTF-8 : décodage tolérant (plus lent) sur cette colonne uniquement
+        valeurs = np.char.decode(brut.view(f"S{largeur}").ravel(), "utf-8", errors="replace")
+        texte = pa.array(valeurs, type=pa.string())
+    texte = pc.utf8_trim_whitespace(texte)
+    return pc.if_else(pc.equal(texte, ""), pa.scalar(None, pa.string()), texte)
 
+
+# ---------------------------------------------------------------------
+def iter_fichier_deces(fichier: Path, lignes_par_lot: int = LIGNES_PAR_LOT) -> Iterator[pd.DataFrame]:
+    """
+    Lecture en flux du fichier décès INSEE au format FWF (largeur fixe).
+    Produit des lots d’environ `lignes_par_lot` lignes : la mémoire reste bornée
+    quelle que soit la taille du fichier.
+    """
     if not fichier.exists():
         raise FileNotFoundError(f"Fichier non trouvé : {fichier}")
 
-    colspecs = [
-        (0, 80),        # nom + prénom
-        (80, 81),       # sexe
-        (81, 89),       # date naissance AAAAMMJJ
-        (89, 94),       # code lieu naissance
-        (94, 124),      # commune naissance
-        (124, 154),     # pays naissance
-        (154, 162),     # date décès AAAAMMJJ
-        (162, 167),     # code lieu décès
-        (167, 176)      # numéro d’acte
-    ]
-    names = [
-        "nom_prenom",
-        "sexe",
-        "date_naissance",
-        "code_lieu_naissance",
-        "commune_naissance",
-        "pays_naissance",
-        "date_deces",
-        "code_lieu_deces",
-        "numero_acte"
-    ]
-
-    df = pd.read_fwf(fichier, colspecs=colspecs, names=names, dtype=str, encoding="utf-8")
+    taille_bloc = lignes_par_lot * _OCTETS_PAR_LIGNE
+    reste = b""
+    with open(fichier, "rb") as f:
+        while bloc := f.read(taille_bloc):
+            tampon = reste + bloc
+            fin = tampon.rfind(b"\n") + 1
+            if fin == 0:
+                reste = tampon
+                continue
+            reste = tampon[fin:]
+            yield _decouper_lignes(tampon[:fin])
+
+    # Dernière ligne sans fin de ligne
+    if reste.strip():
+        yield _decouper_lignes(reste + b"\n")
+
+
+# ---------------------------------------------------------------------
+@profiler()
+def lire_fichier_deces(fichier: Path) -> pd.DataFrame:
+    """
+    Lecture du fichier décès INSEE au format FWF (largeur fixe)
+    """
+    LOG.info(f"Lecture du fichier décès brut : {fichier}")
+
+    lots = list(iter_fichier_deces(fichier))
+    if not lots:
+        df = pd.DataFrame(columns=NOMS_DECES, dtype=str)
+    else:
+        df = pd.concat(lots, ignore_index=True)
     LOG.info(f"{len(df):_} lignes lues depuis {fichier}")
     return df
 
 
 # ---------------------------------------------------------------------
+@profiler()
 def nettoyer_deces(df: pd.DataFrame) -> pd.DataFrame:
     """
     Nettoie et enrichit un DataFrame de décès :
-    - Conversion des dates en datetime
-    - Calcul de l’âge au décès
+    - Décodage entier des dates AAAAMMJJ (dates partielles conservées, précision dans `precision_*`)
+    - Calcul de l’âge au décès (en années révolues, arithmétique entière)
     - Filtrage des âges aberrants
+    - Types compacts (voir `utils.schema`)
     """
 
     LOG.info("Nettoyage des données de décès...")
     try:
-        # Conversion des dates
-        df["date_naissance"] = pd.to_datetime(df["date_naissance"], format="%Y%m%d", errors="coerce")
-        df["date_deces"] = pd.to_datetime(df["date_deces"], format="%Y%m%d", errors="coerce")
+        # Décodage des dates : une date partielle (JJ=00, MM=00) garde son année / mois
+        naissance = decoder_aaaammjj(df["date_naissance"])
+        deces = decoder_aaaammjj(df["date_deces"])
+        df["date_naissance"] = dates_completes(*naissance).set_axis(df.index)
+        df["date_deces"] = dates_completes(*deces).set_axis(df.index)
+        df["precision_naissance"] = naissance[3]
+        df["precision_deces"] = deces[3]
 
         # Calcul de l'âge
-        df["age_deces"] = ((df["date_deces"] - df["date_naissance"]).dt.days / 365.25).round(1)
-        df.loc[(df["age_deces"] < 0) | (df["age_deces"] > 140), "age_deces"] = pd.NA
+        df["age_deces"] = age_revolu(naissance, deces).set_axis(df.index)
 
-        # Ajout de colonnes dérivées utiles
-        df["annee_deces"] = df["date_deces"].dt.year
-        df["mois_deces"] = df["date_deces"].dt.month
+        # Ajout de colonnes dérivées utiles (année connue dès que la précision le permet)
+        an_d, mois_d, _, prec_d = deces
+        df["annee_deces"] = pd.Series(pd.arrays.IntegerArray(an_d, prec_d > PRECISION_ANNEE), index=df.index)
+        df["mois_deces"] = pd.Series(pd.arrays.IntegerArray(mois_d, prec_d > PRECISION_MOIS), index=df.index)
 
+        df = typer_deces(df)
         LOG.info("✅ Nettoyage terminé.")
         return df
 
@@ -81,107 +277,805 @@ def nettoyer_deces(df: pd.DataFrame) -> pd.DataFrame:
 #######################################################################
 #                           NAISSANCES
 #######################################################################
-# ---------------------------------------------------------------------
-def lire_fichier_naissances(fichier: str) -> pd.DataFrame:
+# Jeu naissances normalisé : un dossier par année `annee_naissance=AAAA/`, colonnes de `SCHEMA_NAISSANCES`
+PARTITIONNEMENT_NAISSANCES = ds.partitioning(pa.schema([("annee_naissance", pa.int16())]), flavor="hive")
+MOTIF_NAISSANCES = "annee_naissance=*/*.parquet"
+FORMAT_PARQUET_NAISSANCES = ds.ParquetFileFormat(
+    read_options=ds.ParquetReadOptions(dictionary_columns=COLONNES_CATEGORIELLES_NAISSANCES)
+)
+
+
+def _lire_source_brute(fichier: Path) -> pa.Table:
+    """
+    Fichier brut (Parquet, ou CSV `;` / `,` : détail INSEE, base SSMSI) ; en CSV, toutes les colonnes
+    sont lues en texte : les codes à zéro initial (départements, régions) restent intacts.
+    """
+    if fichier.suffix == ".parquet":
+        return pq.read_table(fichier)
+    with open(fichier, encoding="utf-8") as f:
+        entete = f.readline().strip()
+    separateur = ";" if ";" in entete else ","
+    noms = [nom.strip('"') for nom in entete.split(separateur)]
+    return pacsv.read_csv(
+        fichier,
+        parse_options=pacsv.ParseOptions(delimiter=separateur),
+        convert_options=pacsv.ConvertOptions(column_types={nom: pa.string() for nom in noms}),
+    )
+
+
+def _entiers(colonne: pa.ChunkedArray, type_arrow: pa.DataType) -> pa.ChunkedArray:
     """
-    Lecture du fichier des naissances INSEE au format Parquet.
-    Renomme les colonnes selon la documentation officielle.
+    Entiers d’une colonne texte ou numérique ; les valeurs non numériques (`XX`, vides…) deviennent nulles.
     """
+    if pa.types.is_integer(colonne.type):
+        return colonne.cast(type_arrow)
+    texte = pc.utf8_trim_whitespace(colonne.cast(pa.string()))
+    return pc.if_else(pc.match_substring_regex(texte, r"^-?\d+$"), texte, pa.scalar(None, pa.string())).cast(type_arrow)
 
+
+def normaliser_naissances(table: pa.Table, annee: int | None = None) -> pa.Table:
+    """
+    Met une table de naissances INSEE (colonnes d’origine, n’importe quel millésime) au schéma
+    `SCHEMA_STOCKAGE_NAISSANCES` : colonnes renommées (`COLONNES_NAISSANCES`), entiers courts, codes en texte.
+    Les colonnes absentes du millésime sont nulles, les colonnes hors schéma écartées ;
+    `annee` remplace l’année de naissance si le fichier ne la contient pas.
+    """
+    table = table.rename_columns([COLONNES_NAISSANCES.get(nom, nom.lower()) for nom in table.column_names])
+    colonnes = {}
+    for champ in SCHEMA_STOCKAGE_NAISSANCES:
+        if champ.name in table.column_names:
+            colonne = table[champ.name]
+            if pa.types.is_integer(champ.type):
+                colonnes[champ.name] = _entiers(colonne, champ.type)
+            else:
+                colonnes[champ.name] = pc.utf8_trim_whitespace(colonne.cast(pa.string()))
+        else:
+            colonnes[champ.name] = pa.nulls(table.num_rows, champ.type)
+    if annee is not None:
+        colonnes["annee_naissance"] = pc.coalesce(colonnes["annee_naissance"], pa.scalar(annee, pa.int16()))
+
+    ecartees = sorted(set(table.column_names) - set(SCHEMA_STOCKAGE_NAISSANCES.names))
+    if ecartees:
+        LOG.info(f"Naissances : colonnes hors schéma écartées {ecartees}")
+    return pa.table(colonnes, schema=SCHEMA_STOCKAGE_NAISSANCES)
+
+
+# ---------------------------------------------------------------------
+@profiler()
+def lire_fichier_naissances(fichier: str | Path) -> pd.DataFrame:
+    """
+    Lecture d’un fichier des naissances INSEE brut (Parquet ou CSV), normalisé au schéma naissances.
+    Pour lire plusieurs années, préférer le jeu ingéré (`ingerer_naissances`, lu par `utils.registre`).
+    """
+    fichier = Path(fichier)
     LOG.info(f"Lecture du fichier naissance brut : {fichier}")
     try:
-        # Lecture du fichier Parquet
-        df = pd.read_parquet(fichier)
-
-        # Renommage des colonnes
-        mapping_colonnes = {
-            "AGEMERE": "age_mere",
-            "AGEXACTM": "age_exact_mere",
-            "ANAIS": "annee_naissance",
-            "DEPDOMM": "dep_domicile_mere",
-            "DEPNAIS": "dep_naissance_enfant",
-            "GAGEXAPOM": "groupe_age_second_parent_exact",
-            "GAGPOM": "groupe_age_second_parent",
-            "INDLNM": "lieu_naissance_mere",
-            "INDNATM": "nationalite_mere",
-            "MNAIS": "mois_naissance_enfant",
-            "NBENF": "nombre_enfants_accouchement",
-            "REGDOMM": "region_domicile_mere",
-            "REGNAIS": "region_naissance_enfant",
-            "SEXE": "sexe_enfant"
-        }
-
-        df = df.rename(columns=mapping_colonnes).convert_dtypes()
+        table = normaliser_naissances(_lire_source_brute(fichier), _annee_fichier(fichier))
     except Exception as e:
-        LOG.warning(f"Erreur fichier {fichier}: {e}")
+        LOG.error(f"Erreur fichier {fichier}: {e}")
+        raise
+
+    LOG.info(f"{table.num_rows:_} lignes chargées depuis {fichier}")
+    return table_vers_pandas(table, COLONNES_CATEGORIELLES_NAISSANCES, liberer=True)
+
+
+def _annee_fichier(fichier: Path) -> int | None:
+    """Millésime d’un nom de fichier INSEE (ex: `FD_NAIS_2022.csv`, `naissances_2022.parquet`)."""
+    annees = re.findall(r"(?<!\d)(?:19|20)\d{2}(?!\d)", fichier.stem)
+    return int(annees[-1]) if annees else None
+
+
+# ---------------------------------------------------------------------
+def _preparer_naissances(fichier: Path) -> pa.Table:
+    """
+    Lecture et normalisation d’un fichier naissances (étape parallélisable de l’ingestion), triée par année et mois.
+    """
+    brute = normaliser_naissances(_lire_source_brute(fichier), _annee_fichier(fichier))
+    table = brute.filter(pc.is_valid(brute["annee_naissance"]))
+    if table.num_rows < brute.num_rows:
+        LOG.warning(f"{brute.num_rows - table.num_rows:_} naissances sans année écartées ({fichier})")
+    return table.sort_by([("annee_naissance", "ascending"), ("mois_naissance_enfant", "ascending")])
+
+
+def _ingerer_par_annee(
+    fichiers: list[Path],
+    output_dir: Path,
+    preparer: Callable[[Path], pa.Table],
+    format_parquet: ds.ParquetFileFormat,
+    partitionnement: ds.Partitioning,
+    nom: str,
+    workers: int = 1,
+) -> int:
+    """
+    Écrit les tables préparées (`preparer(fichier)`, fonction de module : exécutée dans un processus fils
+    si `workers` > 1) dans `output_dir/{clé}=AAAA/` ; les années présentes dans un fichier remplacent
+    celles déjà ingérées. L’écriture reste faite dans l’ordre des fichiers : une année présente dans deux
+    fichiers est celle du dernier, comme en séquentiel.
+    """
+    cle = partitionnement.schema.names[0]
+    workers = max(1, min(workers, len(fichiers)))
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialiser_journal_processus,
+            initargs=(queue_journal_processus(),),
+        )
+        tables = pool.map(preparer, fichiers)
+    else:
+        tables = map(preparer, fichiers)
+
+    nb_lignes = 0
+    try:
+        for fichier, table in zip(fichiers, tables):
+            ds.write_dataset(
+                table,
+                base_dir=output_dir,
+                format=format_parquet,
+                file_options=format_parquet.make_write_options(compression="zstd"),
+                partitioning=partitionnement,
+                basename_template=f"{nom}-{{i}}.parquet",
+                existing_data_behavior="delete_matching",
+            )
+            nb_lignes += table.num_rows
+            annees = sorted(set(pc.unique(table[cle]).to_pylist()))
+            LOG.info(f"{table.num_rows:_} lignes {nom} ingérées depuis {fichier} (années {annees})")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return nb_lignes
+
+
+@profiler()
+def ingerer_naissances(fichiers: list[Path], output_dir: Path, workers: int = 1) -> int:
+    """
+    Normalise des fichiers naissances INSEE (un ou plusieurs millésimes chacun) dans le jeu
+    `output_dir/annee_naissance=AAAA/`. Les années présentes dans un fichier remplacent celles déjà ingérées ;
+    les autres années du jeu sont conservées.
+
+    Avec `workers` > 1, les fichiers sont lus et normalisés en parallèle (processus).
+
+    Returns:
+        int: nombre de lignes écrites
+    """
+    return _ingerer_par_annee(
+        fichiers, output_dir, _preparer_naissances, FORMAT_PARQUET_NAISSANCES, PARTITIONNEMENT_NAISSANCES,
+        "naissances", workers,
+    )
+
+
+def fichiers_naissances(base_dir: Path) -> list[Path]:
+    """
+    Fichiers de données du jeu naissances normalisé (`MOTIF_NAISSANCES`), triés.
+    """
+    return sorted(base_dir.glob(MOTIF_NAISSANCES))
+
+
+def dataset_naissances(base_dir: Path) -> ds.Dataset:
+    """
+    Ouvre le jeu naissances normalisé à partir de la liste explicite de ses fichiers (`fichiers_naissances`) :
+    les fichiers bruts ou annexes posés à la racine du dossier (README, fichier INSEE d’origine) ne sont pas lus.
+    """
+    return ds.dataset(
+        [f.as_posix() for f in fichiers_naissances(base_dir)],
+        schema=SCHEMA_NAISSANCES,
+        format=FORMAT_PARQUET_NAISSANCES,
+        partitioning=PARTITIONNEMENT_NAISSANCES,
+        partition_base_dir=base_dir.as_posix(),
+        filesystem=FS_MMAP,
+    )
+
+
+#######################################################################
+#                           VIOLENCES
+#######################################################################
+# Base départementale de la délinquance enregistrée (SSMSI) normalisée : un dossier par année `annee=AAAA/`
+PARTITIONNEMENT_VIOLENCES = ds.partitioning(pa.schema([("annee", pa.int16())]), flavor="hive")
+MOTIF_VIOLENCES = "annee=*/*.parquet"
+FORMAT_PARQUET_VIOLENCES = ds.ParquetFileFormat(
+    read_options=ds.ParquetReadOptions(dictionary_columns=COLONNES_CATEGORIELLES_VIOLENCES)
+)
+
+
+def normaliser_violences(table: pa.Table) -> pa.Table:
+    """
+    Met une table de la base SSMSI (colonnes d’origine, n’importe quel millésime) au schéma
+    `SCHEMA_STOCKAGE_VIOLENCES` : colonnes renommées (`COLONNES_VIOLENCES`), années sur 4 chiffres
+    (les anciens fichiers donnent `16` pour 2016), taux à virgule décimale, nombres secrétisés (`NA`) nuls.
+    """
+    table = table.rename_columns([COLONNES_VIOLENCES.get(nom, nom.lower()) for nom in table.column_names])
+    colonnes = {}
+    for champ in SCHEMA_STOCKAGE_VIOLENCES:
+        if champ.name not in table.column_names:
+            colonnes[champ.name] = pa.nulls(table.num_rows, champ.type)
+            continue
+        colonne = table[champ.name]
+        if pa.types.is_integer(champ.type):
+            colonnes[champ.name] = _entiers(colonne, champ.type)
+        elif pa.types.is_floating(champ.type):
+            texte = pc.replace_substring(pc.utf8_trim_whitespace(colonne.cast(pa.string())), ",", ".")
+            nombre = pc.match_substring_regex(texte, r"^-?\d+(\.\d*)?$")
+            colonnes[champ.name] = pc.if_else(nombre, texte, pa.scalar(None, pa.string())).cast(champ.type)
+        else:
+            colonnes[champ.name] = pc.utf8_trim_whitespace(colonne.cast(pa.string()))
+    annee = colonnes["annee"]
+    colonnes["annee"] = pc.if_else(pc.less(annee, 100), pc.add(annee, pa.scalar(2000, pa.int16())), annee)
+
+    ecartees = sorted(set(table.column_names) - set(SCHEMA_STOCKAGE_VIOLENCES.names))
+    if ecartees:
+        LOG.info(f"Violences : colonnes hors schéma écartées {ecartees}")
+    return pa.table(colonnes, schema=SCHEMA_STOCKAGE_VIOLENCES)
+
+
+def _preparer_violences(fichier: Path) -> pa.Table:
+    """
+    Lecture et normalisation d’un fichier SSMSI (étape parallélisable de l’ingestion), triée par indicateur
+    puis département (statistiques serrées pour les filtres sur l’indicateur).
+    """
+    brute = normaliser_violences(_lire_source_brute(fichier))
+    table = brute.filter(pc.is_valid(brute["annee"]))
+    if table.num_rows < brute.num_rows:
+        LOG.warning(f"{brute.num_rows - table.num_rows:_} lignes violences sans année écartées ({fichier})")
+    return table.sort_by([("annee", "ascending"), ("indicateur", "ascending"), ("code_departement", "ascending")])
+
+
+@profiler()
+def ingerer_violences(fichiers: list[Path], output_dir: Path, workers: int = 1) -> int:
+    """
+    Normalise des fichiers de la base départementale SSMSI (CSV, un ou plusieurs millésimes chacun) dans
+    le jeu `output_dir/annee=AAAA/`. Les années présentes dans un fichier remplacent celles déjà ingérées.
+
+    Returns:
+        int: nombre de lignes écrites
+    """
+    return _ingerer_par_annee(
+        fichiers, output_dir, _preparer_violences, FORMAT_PARQUET_VIOLENCES, PARTITIONNEMENT_VIOLENCES,
+        "violences", workers,
+    )
+
+
+def fichiers_violences(base_dir: Path) -> list[Path]:
+    """
+    Fichiers de données du jeu violences normalisé (`MOTIF_VIOLENCES`), triés.
+    """
+    return sorted(base_dir.glob(MOTIF_VIOLENCES))
 
-    LOG.info(f"{len(df):_} lignes chargées depuis {fichier}")
-    return df
+
+def dataset_violences(base_dir: Path) -> ds.Dataset:
+    """
+    Ouvre le jeu violences normalisé à partir de la liste explicite de ses fichiers (`fichiers_violences`).
+    """
+    return ds.dataset(
+        [f.as_posix() for f in fichiers_violences(base_dir)],
+        schema=SCHEMA_VIOLENCES,
+        format=FORMAT_PARQUET_VIOLENCES,
+        partitioning=PARTITIONNEMENT_VIOLENCES,
+        partition_base_dir=base_dir.as_posix(),
+        filesystem=FS_MMAP,
+    )
 
 
 #######################################################################
 #                     CONVERSION EN .parquet
 #######################################################################
+def options_ecriture_deces(annee: int | None = None) -> dict:
+    """
+    Options `pq.ParquetWriter` des fichiers décès, colonne par colonne :
+    dictionnaire pour les codes et noms de lieux, delta pour la date de décès (triée),
+    zstd (plus fort pour les années d’archive), statistiques, index de pages et filtres de Bloom
+    (dimensionnés pour un row group : au plus une valeur distincte par ligne).
+    """
+    archive = annee is not None and annee < date.today().year - ANNEES_RECENTES
+    return {
+        "use_dictionary": COLONNES_DICTIONNAIRE_DECES,
+        "column_encoding": {"date_deces": "DELTA_BINARY_PACKED"},
+        "compression": "zstd",
+        "compression_level": NIVEAU_ZSTD_ARCHIVE if archive else NIVEAU_ZSTD,
+        "write_statistics": True,
+        "write_page_index": True,
+        "bloom_filter_options": {
+            nom: {"ndv": LIGNES_PAR_ROW_GROUP, "fpp": 0.05} for nom in COLONNES_BLOOM_DECES
+        },
+    }
+
+
+def _annee_partition(chemin: str) -> int | None:
+    # `annee_deces=AAAA/...` → AAAA (None pour la partition des années inconnues)
+    valeur = Path(chemin).parts[0].split("=", 1)[-1]
+    return int(valeur) if valeur.isdigit() else None
+
+
+# Colonnes d’un fichier de partition : les clés de partition ne sont que dans le chemin
+CLES_PARTITION_DECES = PARTITIONNEMENT_DECES.schema.names
+SCHEMA_FICHIER_DECES = pa.schema([champ for champ in SCHEMA_STOCKAGE_DECES if champ.name not in CLES_PARTITION_DECES])
+
+# Dossier Hive d’une clé de partition nulle (même convention que `ds.write_dataset`)
+PARTITION_NULLE = "__HIVE_DEFAULT_PARTITION__"
+
+
+class EcrivainPartitions:
+    """
+    Écrit des lots décès dans le jeu partitionné, en une seule passe et directement à la disposition finale
+    (un fichier `{nom_base}-0.parquet` par partition) :
+
+    - chaque lot est réparti par partition (année / mois / sexe) ;
+    - les lignes d’une partition attendent dans un tampon jusqu’à former un row group complet
+      (`LIGNES_PAR_ROW_GROUP`), qui est trié selon `TRI_DECES` puis écrit avec les options de
+      `options_ecriture_deces` (ordre de tri déclaré dans les métadonnées de chaque row group) ;
+    - à la fermeture, les restes sont triés et écrits en un dernier row group.
+
+    La mémoire reste bornée par un row group par partition ouverte, quelle que soit la taille du fichier source.
+    """
+
+    def __init__(self, dossier: Path, nom_base: str):
+        self.dossier = dossier
+        self.nom_base = nom_base
+        self.fichiers = []
+        self._tampons = {}
+        self._writers = {}
+        self._tri = pq.SortingColumn.from_ordering(SCHEMA_FICHIER_DECES, TRI_DECES)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                for partition in list(self._tampons):
+                    self._vider(partition, final=True)
+        finally:
+            for writer in self._writers.values():
+                writer.close()
+        return False
+
+    # -----------------------------------------------------------------
+    def ajouter(self, lot: pa.RecordBatch):
+        table = pa.Table.from_batches([lot])
+        # Clé numérique de partition par ligne (nulle → -1), puis une tranche contiguë par partition
+        codes = [
+            pc.fill_null(pc.dictionary_encode(table[nom]).combine_chunks().indices, -1).to_numpy().astype(np.int64) + 1
+            if pa.types.is_string(table.schema.field(nom).type)
+            else pc.fill_null(table[nom], -1).to_numpy().astype(np.int64) + 1
+            for nom in CLES_PARTITION_DECES
+        ]
+        cle = np.zeros(table.num_rows, dtype=np.int64)
+        for code in codes:
+            cle = cle * (int(code.max(initial=0)) + 1) + code
+        ordre = np.argsort(cle, kind="stable")
+        table, cle = table.take(ordre), cle[ordre]
+        debuts = np.flatnonzero(np.r_[True, cle[1:] != cle[:-1]])
+        fins = np.r_[debuts[1:], table.num_rows]
+
+        for debut, fin in zip(debuts.tolist(), fins.tolist()):
+            morceau = table.slice(debut, fin - debut)
+            partition = "/".join(
+                f"{nom}={PARTITION_NULLE if (valeur := morceau[nom][0].as_py()) is None else valeur}"
+                for nom in CLES_PARTITION_DECES
+            )
+            tampon = self._tampons.setdefault(partition, [])
+            tampon.append(morceau.drop_columns(CLES_PARTITION_DECES))
+            if sum(t.num_rows for t in tampon) >= LIGNES_PAR_ROW_GROUP:
+                self._vider(partition)
+
+    def _vider(self, partition: str, final: bool = False):
+        """Écrit les row groups complets du tampon (tout le tampon si `final`), triés."""
+        table = pa.concat_tables(self._tampons.pop(partition)).sort_by(TRI_DECES)
+        nb = table.num_rows if final else table.num_rows - table.num_rows % LIGNES_PAR_ROW_GROUP
+        self._writer(partition).write_table(table.slice(0, nb), row_group_size=LIGNES_PAR_ROW_GROUP)
+        if nb < table.num_rows:
+            self._tampons[partition] = [table.slice(nb)]
+
+    def _writer(self, partition: str) -> pq.ParquetWriter:
+        if partition not in self._writers:
+            relatif = f"{partition}/{self.nom_base}-0.parquet"
+            (self.dossier / relatif).parent.mkdir(parents=True, exist_ok=True)
+            self._writers[partition] = pq.ParquetWriter(
+                self.dossier / relatif,
+                SCHEMA_FICHIER_DECES,
+                sorting_columns=self._tri,
+                **options_ecriture_deces(_annee_partition(relatif)),
+            )
+            self.fichiers.append(relatif)
+        return self._writers[partition]
+
+
+def _lots_deces_arrow(
+    fichier: Path,
+    lignes_par_lot: int = LIGNES_PAR_LOT,
+    selection: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Lit et nettoie un fichier décès lot par lot, au format d’écriture `SCHEMA_STOCKAGE_DECES`.
+    `selection` reçoit chaque lot brut (avant nettoyage) et renvoie les lignes à conserver.
+    """
+    for lot in iter_fichier_deces(fichier, lignes_par_lot):
+        if selection is not None:
+            lot = selection(lot)
+            if lot.empty:
+                continue
+        table = pa.Table.from_pandas(nettoyer_deces(lot), schema=SCHEMA_STOCKAGE_DECES, preserve_index=False)
+        yield from table.to_batches()
+
+
+# ---------------------------------------------------------------------
+def ecrire_deces_partitionne(
+    fichier: Path,
+    dossier: Path,
+    nom_base: str,
+    lignes_par_lot: int = LIGNES_PAR_LOT,
+    cube: bool = True,
+    selection: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    optimiser: bool = True,
+) -> tuple[int, list[str]]:
+    """
+    Lit, nettoie et écrit un fichier décès en flux dans le jeu partitionné
+    `dossier/annee_deces=AAAA/mois_deces=M/sexe=S/{nom_base}-{i}.parquet`.
+    Si `cube`, le cube d’agrégats de ce fichier est écrit en même temps dans `dossier/_cube/{nom_base}.parquet`.
+    `selection` filtre les lots bruts avant nettoyage (voir `_lots_deces_arrow`).
+    Si `optimiser`, les fichiers sont écrits une seule fois, triés et aux options finales
+    (row groups, encodages, compression : voir `EcrivainPartitions`) ; sinon, options Parquet par défaut.
+
+    Returns:
+        tuple[int, list[str]]: nombre de lignes écrites, fichiers produits (chemins relatifs à `dossier`)
+    """
+    LOG.info(f"Conversion en flux : {fichier} → {dossier} (partitionné)")
+
+    nb_lignes = 0
+
+    def compter(lots):
+        nonlocal nb_lignes
+        for lot in lots:
+            nb_lignes += lot.num_rows
+            yield lot
+
+    lots = compter(_lots_deces_arrow(fichier, lignes_par_lot, selection))
+    cubes = []
+    if cube:
+        lots = cumuler_cube(lots, cubes)
+
+    if optimiser:
+        with EcrivainPartitions(dossier, nom_base) as ecrivain:
+            for lot in lots:
+                ecrivain.ajouter(lot)
+        fichiers = ecrivain.fichiers
+    else:
+        fichiers = []
+        ds.write_dataset(
+            lots,
+            base_dir=dossier,
+            schema=SCHEMA_STOCKAGE_DECES,
+            format=FORMAT_PARQUET_DECES,
+            partitioning=PARTITIONNEMENT_DECES,
+            basename_template=f"{nom_base}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            max_partitions=10_000,
+            file_visitor=lambda written: fichiers.append(Path(written.path).relative_to(dossier).as_posix()),
+        )
+
+    if cube:
+        chemin_cube = Path(DOSSIER_CUBE) / f"{nom_base}.parquet"
+        (dossier / chemin_cube).parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(fusionner(cubes), dossier / chemin_cube)
+        fichiers.append(chemin_cube.as_posix())
+
+    LOG.info(f"{nb_lignes:_} lignes écrites dans {len(fichiers)} fichiers")
+    return nb_lignes, fichiers
+
+
+# ---------------------------------------------------------------------
+# Manifeste des conversions déjà effectuées (dans le dossier de sortie)
+MANIFESTE = "_manifest.json"
+
+
+def empreinte_fichier(fichier: Path, taille_bloc: int = 1 << 20) -> str:
+    """
+    Calcule l’empreinte SHA-256 d’un fichier, lu par blocs.
+    """
+    h = hashlib.sha256()
+    with open(fichier, "rb") as f:
+        while bloc := f.read(taille_bloc):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------
+def lire_manifeste(output_dir: Path) -> dict:
+    """
+    Lit le manifeste de conversion (`{nom_source: {taille, mtime, sha256, sorties}}`).
+    """
+    chemin = output_dir / MANIFESTE
+    if not chemin.exists():
+        return {}
+    try:
+        return json.loads(chemin.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        LOG.warning(f"Manifeste illisible, reconversion complète : {chemin} ({e})")
+        return {}
+
+
+def ecrire_manifeste(output_dir: Path, manifeste: dict):
+    """
+    Écrit le manifeste de manière atomique (fichier temporaire puis renommage).
+    """
+    chemin = output_dir / MANIFESTE
+    tmp = chemin.with_name(chemin.name + ".tmp")
+    tmp.write_text(json.dumps(manifeste, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, chemin)
+
+
+def _deja_converti(f: Path, entree: dict | None, output_dir: Path) -> bool:
+    """
+    Vrai si `f` correspond à l’entrée du manifeste et que la sortie existe encore.
+    Taille + mtime suffisent ; sinon l’empreinte tranche (fichier simplement « touché »).
+    """
+    if not entree or not all((output_dir / sortie).exists() for sortie in entree["sorties"]):
+        return False
+    nom_base = f.stem.replace("-", "_")
+    annexes = (
+        Path(DOSSIER_CUBE) / f"{nom_base}.parquet",
+        Path(DOSSIER_INDEX) / f"{nom_base}.npy",
+        Path(DOSSIER_RECHERCHE) / nom_base / "table.arrow",
+    )
+    if not all((output_dir / annexe).exists() for annexe in annexes):
+        return False
+    stat = f.stat()
+    if stat.st_size != entree["taille"]:
+        return False
+    if stat.st_mtime == entree["mtime"]:
+        return True
+    return empreinte_fichier(f) == entree["sha256"]
+
+
+# ---------------------------------------------------------------------
+def _convertir_fichier(f: Path, output_dir: Path, dedupliquer: bool = False) -> dict:
+    """
+    Convertit un fichier `.txt` dans le jeu partitionné (exécuté dans un processus du pool si `workers > 1`).
+    Les partitions sont écrites dans un dossier temporaire puis renommées une à une : un échec en cours
+    de route ne laisse jamais de Parquet partiel à la place de l’ancien.
+
+    Les clés des enregistrements écrits forment le segment d’index du fichier (`_index/`) ;
+    leurs noms normalisés, le segment de l’index de recherche de personnes (`_recherche/`).
+    Si `dedupliquer`, seuls les enregistrements absents de l’index (et non répétés dans le fichier) sont écrits.
+
+    Returns:
+        dict: entrée du manifeste pour ce fichier
+    """
+    nom_base = f.stem.replace("-", "_")
+    tmp_dir = output_dir / f".tmp-{nom_base}"
+    stat = f.stat()
+
+    cles = []
+    lignes_lues = 0
+    index = IndexDeces(output_dir, exclure=nom_base) if dedupliquer else None
+
+    def selectionner(lot: pd.DataFrame) -> pd.DataFrame:
+        nonlocal lignes_lues
+        lignes_lues += len(lot)
+        cles_lot = cles_deces(lot)
+        if index is not None:
+            _, premieres = np.unique(cles_lot, return_index=True)
+            garde = np.zeros(len(cles_lot), dtype=bool)
+            garde[premieres] = True
+            garde &= ~index.contient(cles_lot)
+            if cles:
+                garde &= ~np.isin(cles_lot, np.concatenate(cles))
+            lot, cles_lot = lot[garde], cles_lot[garde]
+        cles.append(cles_lot)
+        return lot
+
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        with Span("convertir_fichier", fichier=f.name) as span:
+            nb_lignes, sorties = ecrire_deces_partitionne(f, tmp_dir, nom_base, selection=selectionner)
+            span.lignes_entree, span.lignes_sortie = lignes_lues, nb_lignes
+        with Span("ecrire_index", lignes_entree=nb_lignes, fichier=f.name):
+            sorties.append(ecrire_segment(tmp_dir, nom_base, cles))
+        with Span("ecrire_index_recherche", lignes_entree=nb_lignes, fichier=f.name):
+            partitions = [s for s in sorties if not s.startswith(("_", "."))]
+            sorties += ecrire_segment_recherche(tmp_dir, nom_base, partitions)
+
+        # Anciennes partitions de ce fichier source (une partition peut avoir disparu)
+        anciennes = {
+            p.relative_to(output_dir).as_posix()
+            for p in output_dir.glob(MOTIF_DECES.replace("*.parquet", f"{nom_base}-*.parquet"))
+        }
+        for sortie in sorties:
+            (output_dir / sortie).parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_dir / sortie, output_dir / sortie)
+        for ancienne in anciennes - set(sorties):
+            (output_dir / ancienne).unlink()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    size_in = stat.st_size / 1024 / 1024
+    size_out = sum((output_dir / sortie).stat().st_size for sortie in sorties) / 1024 / 1024
+    LOG.info(f"{f.name}: {size_in:.1f} Mo → {nom_base}-*.parquet ({len(sorties)} fichiers): {size_out:.1f} Mo")
+
+    return {
+        "taille": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha256": empreinte_fichier(f),
+        "sorties": sorted(sorties),
+        "lignes": nb_lignes,
+    }
+
+
+# ---------------------------------------------------------------------
+@profiler()
 def convert_to_parquet(
     source_dir: Path,
-    output_dir: None,
+    output_dir: Path | None = None,
     delete_original: bool = False,
+    workers: int = 1,
 ):
     """
-    Convertit tous les fichiers `.txt` d’un dossier en `.parquet` optimisés.
+    Convertit tous les fichiers `.txt` d’un dossier en un jeu `.parquet` partitionné
+    par année / mois / sexe de décès (voir `PARTITIONNEMENT_DECES`).
+
+    Les fichiers déjà convertis (même taille/mtime ou même empreinte dans le manifeste)
+    sont ignorés : une conversion interrompue reprend là où elle s’est arrêtée.
 
     Args:
         source_dir (Path): dossier contenant les fichiers texte
         output_dir (Path | None): dossier de sortie (par défaut = source_dir)
         delete_original (bool): supprime le fichier source après conversion si True
+        workers (int): nombre de processus de conversion en parallèle (1 = séquentiel)
     """
 
     output_dir = output_dir or source_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    fichiers_txt = list(source_dir.glob("*.txt"))
+    fichiers_txt = sorted(source_dir.glob("*.txt"))
     if not fichiers_txt:
         LOG.warning(f"Aucun fichier .txt trouvé dans {source_dir}")
         return
 
-    LOG.info(f"Conversion de {len(fichiers_txt)} fichiers TXT → Parquet...")
+    manifeste = lire_manifeste(output_dir)
+    a_convertir = [f for f in fichiers_txt if not _deja_converti(f, manifeste.get(f.name), output_dir)]
+    if len(a_convertir) < len(fichiers_txt):
+        LOG.info(f"{len(fichiers_txt) - len(a_convertir)} fichier(s) déjà converti(s), ignoré(s).")
+    if not a_convertir:
+        LOG.info("✅ Rien à convertir.")
+        return
 
-    for f in tqdm(fichiers_txt, desc="Conversion en cours", unit="fichier"):
-        try:
-            df = lire_fichier_deces(f)
-            df = nettoyer_deces(df)
+    workers = max(1, min(workers, len(a_convertir)))
+    LOG.info(f"Conversion de {len(a_convertir)} fichiers TXT → Parquet ({workers} processus)...")
+
+    def terminer(f: Path, entree: dict):
+        # Le manifeste est mis à jour (dans le processus principal) avant toute suppression de la source
+        manifeste[f.name] = entree
+        ecrire_manifeste(output_dir, manifeste)
+        LOG.info(f"Nombre de ligne après nettoyage: {entree['lignes']:_}")
+
+        if delete_original:
+            os.remove(f)
+            LOG.info(f"🗑️  Fichier source supprimé : {f.name}")
+
+    barre = tqdm(total=len(a_convertir), desc="Conversion en cours", unit="fichier")
+    if workers == 1:
+        for f in a_convertir:
+            try:
+                terminer(f, _convertir_fichier(f, output_dir))
+            except Exception as e:
+                LOG.error(f"Erreur lors de la conversion de {f.name}: {e}")
+            barre.update()
+    else:
+        # Les processus envoient leurs messages au journal du processus principal (un seul fichier rotatif)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialiser_journal_processus,
+            initargs=(queue_journal_processus(),),
+        ) as pool:
+            futures = {pool.submit(_convertir_fichier, f, output_dir): f for f in a_convertir}
+            for future in as_completed(futures):
+                f = futures[future]
+                try:
+                    terminer(f, future.result())
+                except Exception as e:
+                    LOG.error(f"Erreur lors de la conversion de {f.name}: {e}")
+                barre.update()
+    barre.close()
+
+    LOG.info("✅ Conversion complète terminée.")
 
-            LOG.info(f"Nombre de ligne après nettoyage: {len(df):_}")
-            parquet_path = output_dir / (f.stem.replace("-", "_") + ".parquet")
-            df.to_parquet(parquet_path, index=False)
 
-            size_in = f.stat().st_size / 1024 / 1024
-            size_out = parquet_path.stat().st_size / 1024 / 1024
-            LOG.info(f"{f.name}: {size_in:.1f} Mo → {parquet_path.name}: {size_out:.1f} Mo")
+# ---------------------------------------------------------------------
+@profiler()
+def ingerer_deces(fichiers: list[Path], output_dir: Path, delete_original: bool = False):
+    """
+    Ajoute au jeu partitionné des fichiers décès incrémentaux (ex: fichiers mensuels INSEE).
+    Seuls les enregistrements absents de l’index (clé `numero_acte` + `code_lieu_deces` + `date_deces`)
+    sont écrits, dans de nouveaux fichiers `{nom_fichier}-*.parquet` : le coût est proportionnel au delta.
+
+    Les fichiers sont traités dans l’ordre, l’un après l’autre (chacun se dédoublonne contre les précédents).
+
+    Args:
+        fichiers (list[Path]): fichiers `.txt` à ingérer
+        output_dir (Path): racine du jeu partitionné
+        delete_original (bool): supprime le fichier source après ingestion si True
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifeste = lire_manifeste(output_dir)
 
-            if delete_original:
-                os.remove(f)
-                LOG.info(f"🗑️  Fichier source supprimé : {f.name}")
+    for f in fichiers:
+        if _deja_converti(f, manifeste.get(f.name), output_dir):
+            LOG.info(f"{f.name} déjà ingéré, ignoré.")
+            continue
 
+        try:
+            entree = _convertir_fichier(f, output_dir, dedupliquer=True)
         except Exception as e:
-            LOG.error(f"Erreur lors de la conversion de {f.name}: {e}")
+            LOG.error(f"Erreur lors de l’ingestion de {f.name}: {e}")
+            continue
 
-    LOG.info("✅ Conversion complète terminée.")
+        manifeste[f.name] = entree
+        ecrire_manifeste(output_dir, manifeste)
+        LOG.info(f"{f.name}: {entree['lignes']:_} nouvel(s) enregistrement(s) ajouté(s).")
+
+        if delete_original:
+            os.remove(f)
+            LOG.info(f"🗑️  Fichier source supprimé : {f.name}")
+
+    LOG.info("✅ Ingestion terminée.")
 
 
 # ---------------------------------------------------------------------
-def charger_parquet_multi(base_dir: Path) -> pd.DataFrame:
+@profiler()
+def charger_parquet_multi(
+    base_dir: Path,
+    colonnes: list[str] | None = None,
+    filtre: ds.Expression | None = None,
+) -> pd.DataFrame:
     """
-    Charge tous les fichiers `.parquet` d’un dossier et les fusionne en un seul DataFrame.
+    Charge tous les fichiers `.parquet` du jeu décès partitionné (voir `dataset_deces`) en un seul DataFrame.
+    `colonnes` et `filtre` sont transmis au lecteur Parquet : seuls les colonnes et row groups utiles sont lus.
     """
 
-    fichiers = sorted(base_dir.glob("*.parquet"))
-    if not fichiers:
+    dataset = dataset_deces(base_dir)
+    if not dataset.files:
         LOG.warning(f"Aucun fichier Parquet trouvé dans {base_dir}")
         return pd.DataFrame()
 
-    LOG.info(f"Chargement de {len(fichiers)} fichiers Parquet depuis {base_dir}...")
-    dfs = [pd.read_parquet(f) for f in fichiers]
-    df = pd.concat(dfs, ignore_index=True)
+    LOG.info(f"Chargement de {len(dataset.files)} fichiers Parquet depuis {base_dir}...")
+    # Table Arrow fragmentée (un morceau par fichier, sans concaténation), convertie en libérant chaque colonne
+    table = dataset.to_table(columns=colonnes, filter=filtre)
+    df = table_vers_pandas(table, COLONNES_CATEGORIELLES_DECES, liberer=True)
     LOG.info(f"✅ Données fusionnées : {len(df):,} lignes totales.")
     return df
+
+
+#######################################################################
+#                 LECTURE DU JEU DÉCÈS PARTITIONNÉ
+#######################################################################
+def fichiers_deces(base_dir: Path) -> list[Path]:
+    """
+    Fichiers de données du jeu décès partitionné (`MOTIF_DECES`), triés.
+    """
+    return sorted(base_dir.glob(MOTIF_DECES))
+
+
+def dataset_deces(base_dir: Path) -> ds.Dataset:
+    """
+    Ouvre le jeu décès partitionné à partir de la liste explicite de ses fichiers (`fichiers_deces`) :
+    rien d’autre du dossier (README, manifeste, cube, index, temporaires) n’est lu comme du Parquet.
+    """
+    return ds.dataset(
+        [f.as_posix() for f in fichiers_deces(base_dir)],
+        schema=SCHEMA_DECES,
+        format=FORMAT_PARQUET_DECES,
+        partitioning=PARTITIONNEMENT_DECES,
+        partition_base_dir=base_dir.as_posix(),
+        filesystem=FS_MMAP,
+    )
+
+
+# ---------------------------------------------------------------------
+def valeurs_partition(base_dir: Path, cle: str) -> list[str]:
+    """
+    Liste les valeurs d’une clé de partition (ex: `annee_deces`) à partir des seuls noms de dossiers.
+    """
+    return sorted({
+        p.name.split("=", 1)[1]
+        for p in base_dir.rglob(f"{cle}=*")
+        if p.is_dir() and p.name != f"{cle}=__HIVE_DEFAULT_PARTITION__"
+    })
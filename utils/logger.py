@@ -1,7 +1,21 @@
 import os
+import sys
+import json
+import time
+import uuid
+import queue
+import atexit
 import logging
+import functools
+import threading
+import contextvars
+import multiprocessing
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+if sys.platform != "win32":
+    import resource
 
 # Codes ANSI pour les couleurs console
 COLORS = {
@@ -21,107 +35,277 @@ EMOJIS = {
 }
 
 
+# Formats du fichier de log : contexte simple pour INFO & CRITICAL, détaillé (fichier) pour WARNING & ERROR
+FORMAT_FICHIER_SIMPLE = "%(asctime)s [%(levelname)s] [%(funcName)s(%(lineno)d)] - %(message)s"
+FORMAT_FICHIER_COMPLET = "%(asctime)s [%(levelname)s] [%(filename)s in %(funcName)s(%(lineno)d)] - %(message)s"
+FORMAT_DATE = "%Y-%m-%d %H:%M:%S"
+
+# Ligne de séparation écrite par `Logger.separator` (fichier seulement)
+SEPARATEUR = "-" * 80
+
+# Nom du logger partagé par tous les modules
+NOM_LOGGER = "AppLogger"
+
+
 class ColorFormatter(logging.Formatter):
     """Formatter console avec couleurs + infos de contexte (fichier, fonction, ligne)."""
 
-    def format(self, record):
-        level = record.levelname
-        emoji = EMOJIS.get(level, "")
-        color = COLORS.get(level, "")
-        reset = COLORS["RESET"]
-
-        # === Format différent selon le niveau ===
-        if level == "INFO":
-            # Format simple (sans fichier/ligne)
-            log_fmt = f"{emoji} [%(levelname)s] - %(message)s"
-        elif level in ["WARNING", "ERROR", "CRITICAL"]:
-            # Format détaillé avec fichier, fonction et ligne
-            log_fmt = (
-                f"{emoji} [%(levelname)s] "
-                f"[%(filename)s: %(funcName)s(%(lineno)d)] - %(message)s"
+    def __init__(self):
+        super().__init__()
+        # Formatters construits une seule fois (et non à chaque message)
+        self._formatters = {
+            # INFO : format simple (sans fichier/ligne), seul le tag [INFO] est coloré
+            "INFO": logging.Formatter(f"{EMOJIS['INFO']} {COLORS['INFO']}[%(levelname)s]{COLORS['RESET']} - %(message)s"),
+        }
+        for level in ("WARNING", "ERROR", "CRITICAL"):
+            # Format détaillé avec fichier, fonction et ligne (toute la ligne est colorée dans `format`)
+            self._formatters[level] = logging.Formatter(
+                f"{EMOJIS[level]} [%(levelname)s] [%(filename)s: %(funcName)s(%(lineno)d)] - %(message)s"
             )
-        else:
-            log_fmt = f"[%(levelname)s] - %(message)s"
+        self._defaut = logging.Formatter("[%(levelname)s] - %(message)s")
 
-        # Appliquer le format
-        formatter = logging.Formatter(log_fmt)
+    def format(self, record):
+        formatter = self._formatters.get(record.levelname, self._defaut)
         log_msg = formatter.format(record)
+        if record.levelname in ("WARNING", "ERROR", "CRITICAL"):
+            log_msg = f"{COLORS[record.levelname]}{log_msg}{COLORS['RESET']}"
+        return log_msg
 
-        # === Coloration du texte ===
-        if level == "INFO":
-            # Colorer uniquement le tag [INFO]
-            log_msg = log_msg.replace("[INFO]", f"{COLORS['INFO']}[INFO]{COLORS['RESET']}")
-        elif level in ["WARNING", "ERROR", "CRITICAL"]:
-            # Colorer toute la ligne
-            log_msg = f"{color}{log_msg}{reset}"
 
-        return log_msg
+class FileFormatter(logging.Formatter):
+    """Formatter fichier : un seul handler, le format (simple / détaillé) est choisi selon le niveau."""
+
+    def __init__(self):
+        super().__init__()
+        self._simple = logging.Formatter(FORMAT_FICHIER_SIMPLE, datefmt=FORMAT_DATE)
+        self._complet = logging.Formatter(FORMAT_FICHIER_COMPLET, datefmt=FORMAT_DATE)
+
+    def format(self, record):
+        if getattr(record, "separateur", False):
+            return SEPARATEUR
+        if record.levelno in (logging.WARNING, logging.ERROR):
+            return self._complet.format(record)
+        return self._simple.format(record)
+
+
+def _hors_separateur(record) -> bool:
+    return not getattr(record, "separateur", False)
+
+
+def _est_metrique(record) -> bool:
+    return hasattr(record, "metrique")
+
+
+def _hors_metrique(record) -> bool:
+    return not _est_metrique(record)
+
+
+class MetriqueFormatter(logging.Formatter):
+    """Une ligne JSON par span, sérialisée par le thread d’écoute (hors du chemin de l’appelant)."""
+
+    def format(self, record):
+        return json.dumps(record.metrique, ensure_ascii=False, default=str)
+
+
+#######################################################################
+#                       JOURNALISATION ASYNCHRONE
+#######################################################################
+# Les appelants ne font que déposer l’enregistrement dans une file ; un thread d’écoute unique
+# (`QueueListener`) formate et écrit dans l’unique fichier rotatif et dans la console ;
+# les spans de métriques (`ecrire_metrique`) suivent le même chemin, vers leur propre fichier rotatif.
+# Les processus de conversion envoient leurs enregistrements au processus principal par une file
+# `multiprocessing` (voir `queue_journal_processus` / `initialiser_journal_processus`) :
+# un seul processus fait tourner le fichier, les lignes ne s’entremêlent plus.
+
+class _QueueHandlerLocal(QueueHandler):
+    """File intra-processus : l’enregistrement est transmis tel quel (formatage différé au thread d’écoute)."""
+
+    def prepare(self, record):
+        return record
+
+
+class _Relais(logging.Handler):
+    """Réinjecte dans le logger principal les enregistrements venus des processus fils."""
+
+    def emit(self, record):
+        logging.getLogger(NOM_LOGGER).handle(record)
+
+
+# État du journal du processus principal (un seul fichier, une seule file, quel que soit le nombre de `Logger`)
+_ETAT = {"fichier": None, "handlers": [], "ecouteur": None, "queue_processus": None, "relais": None}
+
+# Streamlit réexécute le script (et crée un `Logger`) dans le thread de chaque session :
+# la configuration du journal partagé est faite par un seul thread à la fois
+_VERROU_JOURNAL = threading.RLock()
+
+
+def dossier_logs() -> Path:
+    """Dossier des journaux : `logs/` sous le répertoire courant, sauf si `DASHBOARD_LOGS` en désigne un autre."""
+    dossier = Path(os.environ.get("DASHBOARD_LOGS") or Path.cwd() / "logs")
+    dossier.mkdir(parents=True, exist_ok=True)
+    return dossier
+
+
+def journal_asynchrone() -> bool:
+    """Journalisation par file (défaut), sauf si `DASHBOARD_LOG_ASYNC=0`."""
+    return os.environ.get("DASHBOARD_LOG_ASYNC", "1") != "0"
+
+
+def _handlers_sinks(log_path: Path) -> list[logging.Handler]:
+    # Un seul handler rotatif par fichier (deux handlers sur le même fichier tournaient chacun de leur côté)
+    fichier = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3, encoding="utf-8", delay=True)
+    fichier.setLevel(logging.INFO)
+    fichier.setFormatter(FileFormatter())
+    fichier.addFilter(_hors_metrique)
+
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    console.setFormatter(ColorFormatter())
+    console.addFilter(_hors_separateur)
+    console.addFilter(_hors_metrique)
+
+    metriques = RotatingFileHandler(
+        log_path.parent / FICHIER_METRIQUES, maxBytes=TAILLE_MAX_METRIQUES, backupCount=NB_ARCHIVES_METRIQUES,
+        encoding="utf-8", delay=True,
+    )
+    metriques.setFormatter(MetriqueFormatter())
+    metriques.addFilter(_est_metrique)
+    return [fichier, console, metriques]
+
+
+def _arreter_journal():
+    """Vide la file puis ferme les handlers (appelé à la sortie et avant un changement de fichier)."""
+    with _VERROU_JOURNAL:
+        if _ETAT["ecouteur"] is not None:
+            _ETAT["ecouteur"].stop()
+            _ETAT["ecouteur"] = None
+        for handler in _ETAT["handlers"]:
+            handler.close()
+        _ETAT["handlers"] = []
+        _ETAT["fichier"] = None
+
+
+def _configurer_journal(log_path: Path):
+    logger = logging.getLogger(NOM_LOGGER)
+    if _ETAT["fichier"] == log_path and logger.handlers:
+        return
+
+    with _VERROU_JOURNAL:
+        if _ETAT["fichier"] == log_path and logger.handlers:
+            return
+        _arreter_journal()
+        handlers = _handlers_sinks(log_path)
+        if journal_asynchrone():
+            file_attente = queue.SimpleQueue()
+            _ETAT["ecouteur"] = QueueListener(file_attente, *handlers, respect_handler_level=True)
+            _ETAT["ecouteur"].start()
+            logger.handlers = [_QueueHandlerLocal(file_attente)]
+        else:
+            logger.handlers = list(handlers)
+        _ETAT["handlers"] = handlers
+        _ETAT["fichier"] = log_path
+
+
+def queue_journal_processus():
+    """
+    File `multiprocessing` vers le journal du processus principal, à passer à `initialiser_journal_processus`
+    (initializer d’un `ProcessPoolExecutor`). Créée une seule fois, relayée par un thread dédié.
+    """
+    if _ETAT["queue_processus"] is None:
+        # Contexte `spawn` : la file est transmissible aux processus créés par `fork` comme par `spawn`
+        _ETAT["queue_processus"] = multiprocessing.get_context("spawn").Queue()
+        _ETAT["relais"] = QueueListener(_ETAT["queue_processus"], _Relais())
+        _ETAT["relais"].start()
+        # Enregistré après l’import de `multiprocessing.util` : le relais s’arrête avant la fermeture de la file
+        atexit.register(_arreter_relais)
+    return _ETAT["queue_processus"]
+
+
+def _arreter_relais():
+    with _VERROU_JOURNAL:
+        if _ETAT["relais"] is not None:
+            _ETAT["relais"].stop()
+            _ETAT["relais"] = None
+
+
+def initialiser_journal_processus(file_attente):
+    """
+    Initializer des processus fils : tous leurs messages partent dans `file_attente`, vers le processus principal.
+    """
+    logger = logging.getLogger(NOM_LOGGER)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [QueueHandler(file_attente)]
+
+
+def _journal_secours(log_file: str) -> list[logging.Handler]:
+    """
+    Handlers d’un processus fils non relié au principal : ajout simple au fichier (sans rotation,
+    qui reste l’affaire du processus principal) et console.
+    """
+    fichier = logging.FileHandler(dossier_logs() / log_file, encoding="utf-8", delay=True)
+    fichier.setFormatter(FileFormatter())
+    fichier.addFilter(_hors_metrique)
+    console = logging.StreamHandler()
+    console.setFormatter(ColorFormatter())
+    console.addFilter(_hors_separateur)
+    console.addFilter(_hors_metrique)
+    metriques = logging.FileHandler(dossier_logs() / FICHIER_METRIQUES, encoding="utf-8", delay=True)
+    metriques.setFormatter(MetriqueFormatter())
+    metriques.addFilter(_est_metrique)
+    return [fichier, console, metriques]
+
+
+def _apres_fork():
+    # Le thread d’écoute n’existe pas dans le fils : ses messages iraient dans une file que personne ne lit
+    logger = logging.getLogger(NOM_LOGGER)
+    fichier = _ETAT["fichier"].name if _ETAT["fichier"] is not None else "app.log"
+    _ETAT.update({"fichier": None, "handlers": [], "ecouteur": None, "queue_processus": None, "relais": None})
+    if logger.handlers:
+        logger.handlers = _journal_secours(fichier)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_apres_fork)
+
+
+def vider_journal():
+    """
+    Attend que les enregistrements en file soient écrits (relais des processus fils, puis thread d’écoute),
+    par ex. avant de relire `metrics.jsonl` dans le même processus.
+    """
+    with _VERROU_JOURNAL:
+        for cle in ("relais", "ecouteur"):
+            if _ETAT[cle] is not None:
+                _ETAT[cle].stop()
+                _ETAT[cle].start()
+        for handler in _ETAT["handlers"]:
+            handler.flush()
+
+
+@atexit.register
+def _fermer_journal():
+    _arreter_relais()
+    _arreter_journal()
 
 
 class Logger:
     def __init__(self, log_file="app.log"):
-        # === AJOUT : dossier logs à la racine ===
-        base_dir = Path.cwd()
-        logs_dir = base_dir / "logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
+        # === AJOUT : dossier logs à la racine (ou `DASHBOARD_LOGS`) ===
+        logs_dir = dossier_logs()
 
-        # === Chemin complet du fichier log ===
-        log_path = logs_dir / log_file
-        log_file = str(log_path)
-
-        # === Initialisation du logger ===
-        self.logger = logging.getLogger("AppLogger")
+        # === Initialisation du logger (partagé : le dernier `Logger` créé choisit le fichier) ===
+        self.logger = logging.getLogger(NOM_LOGGER)
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = False
 
-        # Nettoyer les handlers existants pour éviter les doublons
-        if self.logger.handlers:
-            for h in list(self.logger.handlers):
-                self.logger.removeHandler(h)
-
-        # Formatter fichier pour INFO & CRITICAL (sans fichier/ligne)
-        file_formatter_simple = logging.Formatter(
-            "%(asctime)s [%(levelname)s] [%(funcName)s(%(lineno)d)] - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-
-        # Formatter fichier pour WARNING & ERROR (avec fichier/ligne)
-        file_formatter_full = logging.Formatter(
-            "%(asctime)s [%(levelname)s] [%(filename)s in %(funcName)s(%(lineno)d)] - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-
-        class InfoCritFilter(logging.Filter):
-            def filter(self, record):
-                return record.levelno in (logging.INFO, logging.CRITICAL)
-
-        class WarnErrorFilter(logging.Filter):
-            def filter(self, record):
-                return record.levelno in (logging.WARNING, logging.ERROR)
-
-        # Handler fichier pour INFO & CRITICAL
-        self.file_handler_simple = RotatingFileHandler(
-            log_file, maxBytes=1_000_000, backupCount=3, encoding="utf-8"
-        )
-        self.file_handler_simple.setLevel(logging.INFO)
-        self.file_handler_simple.addFilter(InfoCritFilter())
-        self.file_handler_simple.setFormatter(file_formatter_simple)
-        self.logger.addHandler(self.file_handler_simple)
-
-        # Handler fichier pour WARNING/ERROR
-        self.file_handler_full = RotatingFileHandler(
-            log_file, maxBytes=1_000_000, backupCount=3, encoding="utf-8"
-        )
-        self.file_handler_full.setLevel(logging.WARNING)
-        self.file_handler_full.addFilter(WarnErrorFilter())
-        self.file_handler_full.setFormatter(file_formatter_full)
-        self.logger.addHandler(self.file_handler_full)
-
-        # Handler console coloré
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(ColorFormatter())
-        self.logger.addHandler(console_handler)
+        if multiprocessing.parent_process() is not None:
+            # Processus fils : la configuration vient du parent (`initialiser_journal_processus`)
+            if not self.logger.handlers:
+                self.logger.handlers = _journal_secours(log_file)
+            return
+
+        _configurer_journal(logs_dir / log_file)
 
     # Wrappers avec stack-level pour pointer sur ton code (et non logger.py)
     def info(self, message, *args, **kwargs):
@@ -138,6 +322,218 @@ class Logger:
 
     def separator(self):
         """Ajoute une ligne de séparation uniquement dans le fichier de LOG."""
-        if self.file_handler_simple:
-            self.file_handler_simple.stream.write("-" * 80 + "\n")
-            self.file_handler_simple.flush()
+        self.logger.info(SEPARATEUR, extra={"separateur": True})
+
+
+#######################################################################
+#                       MÉTRIQUES (spans JSONL)
+#######################################################################
+# Fichier JSONL des spans, à côté des journaux (une ligne JSON par étape mesurée),
+# tourné par le thread d’écoute du journal au-delà de TAILLE_MAX_METRIQUES
+FICHIER_METRIQUES = "metrics.jsonl"
+TAILLE_MAX_METRIQUES = 10_000_000
+NB_ARCHIVES_METRIQUES = 5
+
+# Logger des spans : enfant du logger partagé, ses enregistrements passent par la même file
+NOM_METRIQUES = f"{NOM_LOGGER}.metriques"
+
+# Identifiant d’exécution partagé avec les processus de conversion (hérité via l’environnement)
+VARIABLE_EXECUTION = "DASHBOARD_EXECUTION"
+
+# Span englobant, pour reconstituer l’arbre des étapes
+_span_courant = contextvars.ContextVar("span_courant", default=None)
+
+
+def metriques_actives() -> bool:
+    """
+    Les spans sont écrits pendant une exécution mesurée (`demarrer_execution` : scripts de conversion,
+    tests de charge) ; `DASHBOARD_METRIQUES=1` / `0` force l’écriture / la désactive. Par défaut,
+    le tableau de bord n’en écrit pas : aucun coût sur les réexécutions des sessions.
+    """
+    forcage = os.environ.get("DASHBOARD_METRIQUES")
+    if forcage is not None:
+        return forcage != "0"
+    return VARIABLE_EXECUTION in os.environ
+
+
+def demarrer_execution() -> str:
+    """
+    Démarre une nouvelle exécution : tous les spans écrits ensuite (y compris par les processus fils)
+    portent cet identifiant, ce qui permet d’en faire le résumé.
+    """
+    execution = uuid.uuid4().hex[:12]
+    os.environ[VARIABLE_EXECUTION] = execution
+    return execution
+
+
+def rss_pic_mo() -> float:
+    """
+    Pic de mémoire résidente du processus (Mo). Sous Linux, `VmHWM` de `/proc/self/status` :
+    contrairement à `ru_maxrss`, il ne reprend pas le pic du processus parent (fork + exec).
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for ligne in f:
+                if ligne.startswith("VmHWM:"):
+                    return int(ligne.split()[1]) / 1024
+    except OSError:
+        pass
+    if sys.platform == "win32":
+        return 0.0
+    # `ru_maxrss` est en octets sous macOS, en kilo-octets sous Linux
+    facteur = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / facteur
+
+
+def reinitialiser_pic_rss():
+    """Ramène le pic RSS (`VmHWM`) à la mémoire résidente actuelle (Linux uniquement, sans effet ailleurs)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _nb_lignes(objet) -> int | None:
+    """Nombre de lignes d’un DataFrame / d’une table Arrow, None pour tout autre objet."""
+    if hasattr(objet, "num_rows"):
+        return objet.num_rows
+    if hasattr(objet, "shape") and len(objet.shape) >= 1:
+        return objet.shape[0]
+    return None
+
+
+class Span:
+    """
+    Mesure d’une étape : temps mural, temps CPU, lignes en entrée / sortie, débit et hausse du pic RSS.
+
+    Exemple :
+        with Span("nettoyer_deces", lignes_entree=len(df)) as span:
+            df = nettoyer_deces(df)
+            span.lignes_sortie = len(df)
+
+    Le pic RSS (`VmHWM` / `ru_maxrss`) ne fait que croître : `rss_pic_delta_mo` vaut 0 pour une étape
+    qui ne dépasse pas le pic déjà atteint par le processus.
+    """
+
+    def __init__(self, nom: str, lignes_entree: int | None = None, **attributs):
+        self.nom = nom
+        self.lignes_entree = lignes_entree
+        self.lignes_sortie = None
+        self.attributs = attributs
+
+    def __enter__(self):
+        self._parent = _span_courant.get()
+        self._jeton = _span_courant.set(self.nom)
+        # Métriques désactivées : ni lecture de /proc, ni écriture (seul l’arbre des spans est tenu)
+        self._actif = metriques_actives()
+        if self._actif:
+            self._rss = rss_pic_mo()
+            self._cpu = time.process_time()
+            self._debut = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _span_courant.reset(self._jeton)
+        if not self._actif:
+            return False
+        secondes = time.perf_counter() - self._debut
+        cpu = time.process_time() - self._cpu
+
+        lignes = self.lignes_sortie if self.lignes_sortie is not None else self.lignes_entree
+        enregistrement = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "execution": os.environ.get(VARIABLE_EXECUTION),
+            "pid": os.getpid(),
+            "span": self.nom,
+            "parent": self._parent,
+            "secondes": round(secondes, 6),
+            "cpu_secondes": round(cpu, 6),
+            "lignes_entree": self.lignes_entree,
+            "lignes_sortie": self.lignes_sortie,
+            "lignes_par_s": round(lignes / secondes) if lignes is not None and secondes > 0 else None,
+            "rss_pic_delta_mo": round(rss_pic_mo() - self._rss, 1),
+            "erreur": None if exc_type is None else exc_type.__name__,
+            **self.attributs,
+        }
+        ecrire_metrique(enregistrement)
+        return False
+
+
+def profiler(nom: str | None = None):
+    """
+    Décorateur : mesure chaque appel dans un `Span`. Les lignes en entrée / sortie sont déduites
+    du premier argument et du résultat lorsqu’il s’agit d’un DataFrame ou d’une table Arrow.
+    """
+    def decorateur(fonction):
+        nom_span = nom or fonction.__name__
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            with Span(nom_span, lignes_entree=_nb_lignes(args[0]) if args else None) as span:
+                resultat = fonction(*args, **kwargs)
+                span.lignes_sortie = _nb_lignes(resultat)
+                return resultat
+        return enveloppe
+    return decorateur
+
+
+# ---------------------------------------------------------------------
+def chemin_metriques() -> Path:
+    return dossier_logs() / FICHIER_METRIQUES
+
+
+def ecrire_metrique(enregistrement: dict):
+    """
+    Dépose un span dans la file du journal : le thread d’écoute le sérialise et l’ajoute au fichier JSONL
+    rotatif. Les processus de conversion passent par la file `multiprocessing` du journal :
+    seul le processus principal écrit et fait tourner le fichier.
+    """
+    logger = logging.getLogger(NOM_METRIQUES)
+    if not logging.getLogger(NOM_LOGGER).handlers:
+        Logger()
+    logger.info(enregistrement["span"], extra={"metrique": enregistrement})
+
+
+def lire_metriques(execution: str | None = None) -> list[dict]:
+    """Spans du fichier JSONL et de ses archives (uniquement ceux de `execution` si précisé)."""
+    vider_journal()
+    chemin = chemin_metriques()
+    fichiers = [chemin.with_name(f"{chemin.name}.{i}") for i in range(NB_ARCHIVES_METRIQUES, 0, -1)] + [chemin]
+    spans = []
+    for fichier in fichiers:
+        if not fichier.exists():
+            continue
+        with open(fichier, encoding="utf-8") as f:
+            for ligne in f:
+                try:
+                    span = json.loads(ligne)
+                except json.JSONDecodeError:
+                    continue
+                if execution is None or span.get("execution") == execution:
+                    spans.append(span)
+    return spans
+
+
+def resume_metriques(spans: list[dict]) -> str:
+    """
+    Tableau texte par étape : nombre d’appels, temps mural et CPU cumulés, lignes, débit, pic RSS.
+    Trié par temps mural décroissant : les étapes lentes apparaissent en premier.
+    """
+    etapes = {}
+    for span in spans:
+        e = etapes.setdefault(span["span"], {"appels": 0, "secondes": 0.0, "cpu": 0.0, "lignes": None, "rss": 0.0})
+        e["appels"] += 1
+        e["secondes"] += span["secondes"]
+        e["cpu"] += span["cpu_secondes"]
+        lignes = span["lignes_sortie"] if span["lignes_sortie"] is not None else span["lignes_entree"]
+        if lignes is not None:
+            e["lignes"] = (e["lignes"] or 0) + lignes
+        e["rss"] = max(e["rss"], span["rss_pic_delta_mo"])
+
+    lignes = [f"{'Étape':<32} {'Appels':>7} {'Temps (s)':>10} {'CPU (s)':>9} {'Lignes':>13} {'Lignes/s':>12} {'ΔRSS max (Mo)':>14}"]
+    for nom, e in sorted(etapes.items(), key=lambda item: item[1]["secondes"], reverse=True):
+        debit = f"{e['lignes'] / e['secondes']:>12_.0f}" if e["lignes"] and e["secondes"] else f"{'-':>12}"
+        nb = f"{e['lignes']:>13_}" if e["lignes"] is not None else f"{'-':>13}"
+        lignes.append(f"{nom:<32} {e['appels']:>7} {e['secondes']:>10.2f} {e['cpu']:>9.2f} {nb} {debit} {e['rss']:>14.1f}")
+    return "\n".join(lignes)
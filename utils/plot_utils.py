@@ -1,10 +1,31 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-import geopandas as gpd
-
 def plot_map(df, column, title, cmap="Reds"):
+    # Import local : matplotlib n’est chargé que si une carte est dessinée
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(12, 12))
     df.plot(column=column, cmap=cmap, linewidth=0.6, edgecolor="#333", legend=True, ax=ax)
     ax.set_title(title, fontsize=16, fontweight="bold", pad=20)
     ax.set_axis_off()
     return fig
+
+
+def carte_choroplethe(valeurs, colonne_code, colonne_valeur, couche, titre, couleurs="Reds"):
+    """
+    Carte Plotly : `valeurs` (une ligne par code, déjà agrégées) jointes côté navigateur aux contours
+    pré-simplifiés de `couche` (GeoJSON, propriété `code`, voir `utils.geo.charger_couche`).
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Choropleth(
+        geojson=couche,
+        featureidkey="properties.code",
+        locations=valeurs[colonne_code],
+        z=valeurs[colonne_valeur],
+        colorscale=couleurs,
+        marker_line_width=0.3,
+        marker_line_color="#333",
+        colorbar_title=colonne_valeur,
+    ))
+    fig.update_geos(fitbounds="locations", visible=False)
+    fig.update_layout(title=titre, margin={"l": 0, "r": 0, "t": 40, "b": 0})
+    return fig
@@ -0,0 +1,281 @@
+import re
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pathlib import Path
+from utils.logger import Logger, Span
+from utils.schema import table_vers_pandas
+
+LOG = Logger()
+
+# Dossier de l’index de recherche (préfixe `_` : ignoré lors de la découverte du jeu partitionné)
+DOSSIER_RECHERCHE = "_recherche"
+
+# Longueur (octets) des clés de préfixe : au-delà, les candidats sont vérifiés sur la clé complète
+LONGUEUR_PREFIXE = 16
+
+# Trigrammes calculés sur les premiers caractères du nom (recherche « le nom contient »)
+LONGUEUR_TRIGRAMMES = 32
+
+# Colonnes affichées pour chaque personne trouvée (lues dans les partitions, aux lignes indexées)
+COLONNES_RESULTAT = [
+    "nom_prenom",
+    "date_naissance",
+    "commune_naissance",
+    "pays_naissance",
+    "date_deces",
+    "code_lieu_deces",
+]
+
+# Codes des caractères d’une clé normalisée (0 = remplissage) : A-Z → 1..26, espace → 27, `*` → 28
+_CODES = np.zeros(256, dtype=np.uint16)
+_CODES[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)] = np.arange(1, 27)
+_CODES[ord(" ")] = 27
+_CODES[ord("*")] = 28
+_NB_TRIGRAMMES = 32 ** 3
+
+_LIGATURES = {"Œ": "OE", "Æ": "AE", "ß": "SS"}
+
+
+#######################################################################
+#                           NORMALISATION
+#######################################################################
+def normaliser_noms(valeurs: pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    """
+    Clé de recherche `NOM*PRENOMS` : majuscules sans accents, tout autre caractère qu’une lettre
+    (tiret, apostrophe, `/` final...) remplacé par un espace, espaces superflus supprimés.
+    """
+    texte = pc.utf8_upper(valeurs)
+    for ligature, remplacement in _LIGATURES.items():
+        texte = pc.replace_substring(texte, ligature, remplacement)
+    texte = pc.replace_substring_regex(pc.utf8_normalize(texte, "NFKD"), r"\p{Mn}", "")
+    texte = pc.replace_substring_regex(texte, r"[^A-Z*]+", " ")
+    texte = pc.replace_substring_regex(texte, r" *\* *", "*")
+    return pc.utf8_trim_whitespace(texte.fill_null(""))
+
+
+def normaliser_requete(texte: str) -> str:
+    return normaliser_noms(pa.array([texte or ""]))[0].as_py()
+
+
+def _prefixes(cles: pa.Array) -> np.ndarray:
+    # Clés tronquées / complétées par des octets nuls : tableau `S16`, comparable octet à octet
+    fixe = pc.utf8_rpad(pc.utf8_slice_codeunits(cles, 0, LONGUEUR_PREFIXE), LONGUEUR_PREFIXE, padding="\x00")
+    fixe = fixe.cast(pa.binary()).cast(pa.binary(LONGUEUR_PREFIXE))
+    return np.frombuffer(fixe.buffers()[1], dtype=f"S{LONGUEUR_PREFIXE}")[fixe.offset:fixe.offset + len(fixe)].copy()
+
+
+def _trigrammes(cles: pa.Array) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Paires (trigramme, rang) distinctes, triées par trigramme puis par rang.
+    """
+    debut = pc.utf8_slice_codeunits(cles, 0, LONGUEUR_TRIGRAMMES)
+    fixe = pc.utf8_rpad(debut, LONGUEUR_TRIGRAMMES, padding="\x00").cast(pa.binary()).cast(pa.binary(LONGUEUR_TRIGRAMMES))
+    octets = np.frombuffer(fixe.buffers()[1], dtype=np.uint8)
+    octets = octets[fixe.offset * LONGUEUR_TRIGRAMMES:(fixe.offset + len(fixe)) * LONGUEUR_TRIGRAMMES]
+    codes = _CODES[octets.reshape(len(fixe), LONGUEUR_TRIGRAMMES)].astype(np.uint32)
+
+    a, b, c = codes[:, :-2], codes[:, 1:-1], codes[:, 2:]
+    valides = (a > 0) & (b > 0) & (c > 0)
+    ids = ((a << 10) | (b << 5) | c)[valides].astype(np.uint16)
+    rangs = np.broadcast_to(np.arange(len(fixe), dtype=np.uint32)[:, None], valides.shape)[valides]
+
+    # Tri stable par trigramme (tri par base sur 16 bits) : les rangs, parcourus dans l’ordre, restent croissants
+    ordre = np.argsort(ids, kind="stable")
+    ids, rangs = ids[ordre], rangs[ordre]
+    distincts = np.ones(len(ids), dtype=bool)
+    distincts[1:] = (ids[1:] != ids[:-1]) | (rangs[1:] != rangs[:-1])
+    return ids[distincts].astype(np.uint32), rangs[distincts]
+
+
+def _trigrammes_requete(texte: str) -> np.ndarray:
+    codes = _CODES[np.frombuffer(texte.encode("ascii", "ignore"), dtype=np.uint8)].astype(np.uint32)
+    if len(codes) < 3:
+        return np.empty(0, dtype=np.uint32)
+    return np.unique((codes[:-2] << 10) | (codes[1:-1] << 5) | codes[2:])
+
+
+#######################################################################
+#                           CONSTRUCTION
+#######################################################################
+def ecrire_segment_recherche(dossier: Path, nom_base: str, fichiers: list[str]) -> list[str]:
+    """
+    Écrit l’index de recherche d’un fichier source (`_recherche/{nom_base}/`), à partir des fichiers
+    de partition déjà écrits (et triés) : les positions indexées sont celles des lignes dans ces fichiers.
+
+    - `table.arrow` : clés `NOM*PRENOMS` triées, avec (fichier, ligne) de chaque personne ;
+    - `cles.npy` / `prenoms.npy` (+ `prenoms_rang.npy`) : préfixes triés des clés et des prénoms ;
+    - `trigrammes_offsets.npy` / `trigrammes.npy` : listes (CSR) des rangs dont le nom contient chaque trigramme ;
+    - `fichiers.json` : fichiers de partition (chemins relatifs au jeu).
+
+    Returns:
+        list[str]: fichiers produits (chemins relatifs à `dossier`)
+    """
+    noms, numeros, lignes = [], [], []
+    for i, fichier in enumerate(fichiers):
+        colonne = pq.read_table(dossier / fichier, columns=["nom_prenom"], memory_map=True).column(0)
+        noms.append(colonne)
+        numeros.append(np.full(len(colonne), i, dtype=np.uint32))
+        lignes.append(np.arange(len(colonne), dtype=np.uint32))
+
+    if noms:
+        cles = normaliser_noms(pa.chunked_array([c for col in noms for c in col.chunks], type=pa.string())).combine_chunks()
+        numeros, lignes = np.concatenate(numeros), np.concatenate(lignes)
+    else:
+        cles, numeros, lignes = pa.array([], type=pa.string()), np.empty(0, np.uint32), np.empty(0, np.uint32)
+
+    # Tri par clé : une recherche par préfixe est un intervalle de rangs
+    ordre = pc.sort_indices(cles)
+    cles = cles.take(ordre)
+    table = pa.table({"cle": cles, "fichier": numeros[ordre.to_numpy()], "ligne": lignes[ordre.to_numpy()]})
+
+    # Prénoms : texte après le premier `*` (vide pour un nom sans séparateur)
+    prenoms = pc.replace_substring_regex(cles, r"^[^*]*\*?", "", max_replacements=1)
+    ordre_prenoms = pc.sort_indices(prenoms)
+
+    tri_ids, tri_rangs = _trigrammes(pc.list_element(pc.split_pattern(cles, "*", max_splits=1), 0))
+
+    relatif = Path(DOSSIER_RECHERCHE) / nom_base
+    sortie = dossier / relatif
+    sortie.mkdir(parents=True, exist_ok=True)
+    with pa.OSFile(str(sortie / "table.arrow"), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    np.save(sortie / "cles.npy", _prefixes(cles))
+    np.save(sortie / "prenoms.npy", _prefixes(prenoms.take(ordre_prenoms)))
+    np.save(sortie / "prenoms_rang.npy", ordre_prenoms.to_numpy().astype(np.uint32))
+    np.save(sortie / "trigrammes_offsets.npy", np.searchsorted(tri_ids, np.arange(_NB_TRIGRAMMES + 1)).astype(np.int64))
+    np.save(sortie / "trigrammes.npy", tri_rangs)
+    (sortie / "fichiers.json").write_text(json.dumps(fichiers), encoding="utf-8")
+
+    return sorted((relatif / f.name).as_posix() for f in sortie.iterdir())
+
+
+#######################################################################
+#                           RECHERCHE
+#######################################################################
+def _intervalle(prefixes: np.ndarray, texte: str) -> tuple[int, int]:
+    cle = texte.encode("ascii", "ignore")[:LONGUEUR_PREFIXE]
+    debut = int(np.searchsorted(prefixes, cle, side="left"))
+    if len(cle) == LONGUEUR_PREFIXE:
+        return debut, int(np.searchsorted(prefixes, cle, side="right"))
+    # Les clés ne contiennent que des lettres, espaces et `*` (< 0x7F)
+    return debut, int(np.searchsorted(prefixes, cle + b"\x7f", side="left"))
+
+
+class SegmentRecherche:
+    """
+    Index de recherche d’un fichier source, projeté en mémoire (`mmap`) : une recherche par préfixe
+    coûte deux recherches dichotomiques, une recherche « contient » l’intersection de quelques listes de trigrammes.
+    """
+
+    def __init__(self, dossier: Path):
+        self.dossier = dossier
+        self.table = pa.ipc.open_file(pa.memory_map(str(dossier / "table.arrow"), "r")).read_all()
+        self.cles = np.load(dossier / "cles.npy", mmap_mode="r")
+        self.prenoms = np.load(dossier / "prenoms.npy", mmap_mode="r")
+        self.prenoms_rang = np.load(dossier / "prenoms_rang.npy", mmap_mode="r")
+        self.trigrammes_offsets = np.load(dossier / "trigrammes_offsets.npy", mmap_mode="r")
+        self.trigrammes = np.load(dossier / "trigrammes.npy", mmap_mode="r")
+        self.fichiers = json.loads((dossier / "fichiers.json").read_text(encoding="utf-8"))
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def _verifier(self, rangs: np.ndarray, motif: str) -> np.ndarray:
+        # Vérification exacte sur les clés complètes (préfixes tronqués, faux positifs des trigrammes)
+        garde = pc.match_substring_regex(self.table.column("cle").take(rangs), motif)
+        return rangs[garde.to_numpy(zero_copy_only=False)]
+
+    def rangs(self, nom: str = "", prenom: str = "", contient: bool = False) -> np.ndarray:
+        """
+        Rangs (triés) des personnes dont le nom commence par (ou contient) `nom` et dont les prénoms
+        commencent par `prenom` (textes déjà normalisés).
+        """
+        if nom and contient and len(nom) >= 3:
+            candidats = None
+            listes = sorted(
+                (self.trigrammes[self.trigrammes_offsets[t]:self.trigrammes_offsets[t + 1]] for t in _trigrammes_requete(nom)),
+                key=len,
+            )
+            for liste in listes:
+                candidats = np.asarray(liste) if candidats is None else np.intersect1d(candidats, liste, assume_unique=True)
+                if not len(candidats):
+                    break
+            motif = f"^[^*]*{re.escape(nom)}" + (rf"[^*]*\*{re.escape(prenom)}" if prenom else "")
+            return self._verifier(candidats, motif)
+
+        if nom:
+            debut, fin = _intervalle(self.cles, nom)
+            rangs = np.arange(debut, fin)
+            if prenom:
+                # Nom commençant par `nom` : on part du plus court des deux intervalles (noms / prénoms)
+                debut_p, fin_p = _intervalle(self.prenoms, prenom)
+                if fin_p - debut_p < len(rangs):
+                    rangs = np.sort(np.asarray(self.prenoms_rang[debut_p:fin_p]))
+                return self._verifier(rangs, rf"^{re.escape(nom)}[^*]*\*{re.escape(prenom)}")
+            return self._verifier(rangs, f"^{re.escape(nom)}") if len(nom) > LONGUEUR_PREFIXE else rangs
+
+        if prenom:
+            debut, fin = _intervalle(self.prenoms, prenom)
+            rangs = np.sort(np.asarray(self.prenoms_rang[debut:fin]))
+            return self._verifier(rangs, rf"\*{re.escape(prenom)}") if len(prenom) > LONGUEUR_PREFIXE else rangs
+
+        return np.empty(0, dtype=np.int64)
+
+
+class IndexRecherche:
+    """
+    Recherche de personnes dans tout le jeu décès (un segment par fichier source converti ou ingéré).
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.segments = [
+            SegmentRecherche(dossier)
+            for dossier in sorted((base_dir / DOSSIER_RECHERCHE).glob("*"))
+            if (dossier / "table.arrow").exists()
+        ]
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    def chercher(self, nom: str = "", prenom: str = "", contient: bool = False, limite: int = 100) -> pd.DataFrame:
+        """
+        Personnes dont le nom commence par `nom` (ou le contient si `contient`, au moins 3 lettres)
+        et dont les prénoms commencent par `prenom`, avec dates et lieux de naissance et de décès.
+        Accents, casse et ponctuation sont ignorés. Au plus `limite` résultats, par ordre alphabétique.
+        """
+        nom, prenom = normaliser_requete(nom), normaliser_requete(prenom)
+        with Span("recherche.chercher", texte_nom=nom, texte_prenom=prenom, contient=contient) as span:
+            trouves = []
+            for numero, segment in enumerate(self.segments):
+                rangs = segment.rangs(nom, prenom, contient)[:limite]
+                if len(rangs):
+                    table = segment.table.take(rangs)
+                    trouves.append(table.append_column("segment", pa.array(np.full(len(rangs), numero, dtype=np.int32))))
+            if not trouves:
+                return pd.DataFrame(columns=COLONNES_RESULTAT + ["sexe", "annee_deces"])
+
+            # Les `limite` premières clés, tous segments confondus
+            selection = pa.concat_tables(trouves).sort_by("cle").slice(0, limite)
+            resultat = self._lire_lignes(selection)
+            span.lignes_sortie = len(resultat)
+        return resultat
+
+    def _lire_lignes(self, selection: pa.Table) -> pd.DataFrame:
+        # Une lecture par fichier de partition concerné (colonnes affichées seulement, fichiers projetés en mémoire)
+        morceaux = []
+        groupes = selection.group_by(["segment", "fichier"]).aggregate([("ligne", "list")]).to_pydict()
+        for segment, fichier, lignes in zip(groupes["segment"], groupes["fichier"], groupes["ligne_list"]):
+            relatif = self.segments[segment].fichiers[fichier]
+            table = pq.read_table(self.base_dir / relatif, columns=COLONNES_RESULTAT, memory_map=True).take(lignes)
+            # Sexe et année de décès : clés de partition, lues dans le chemin du fichier
+            partitions = dict(part.split("=", 1) for part in Path(relatif).parts[:-1])
+            for cle in ("sexe", "annee_deces"):
+                table = table.append_column(cle, pa.array([partitions.get(cle)] * table.num_rows, pa.string()))
+            morceaux.append(table)
+        df = table_vers_pandas(pa.concat_tables(morceaux))
+        return df.sort_values(["nom_prenom", "date_deces"], ignore_index=True)
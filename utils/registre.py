@@ -0,0 +1,297 @@
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pathlib import Path
+from typing import Callable
+from utils.cache import version_jeu
+from utils.logger import Logger, Span
+from utils.loader import (
+    PARTITIONNEMENT_DECES,
+    PARTITIONNEMENT_NAISSANCES,
+    PARTITIONNEMENT_VIOLENCES,
+    MANIFESTE,
+    convert_to_parquet,
+    dataset_deces,
+    dataset_naissances,
+    dataset_violences,
+    fichiers_deces,
+    fichiers_naissances,
+    fichiers_violences,
+    ingerer_naissances,
+    ingerer_violences,
+    valeurs_partition,
+)
+from utils.schema import (
+    SCHEMA_DECES,
+    SCHEMA_NAISSANCES,
+    SCHEMA_VIOLENCES,
+    COLONNES_CATEGORIELLES_DECES,
+    COLONNES_CATEGORIELLES_NAISSANCES,
+    COLONNES_CATEGORIELLES_VIOLENCES,
+    table_vers_pandas,
+)
+
+LOG = Logger()
+
+
+class JeuDonnees:
+    """
+    Déclaration d’un jeu de données du tableau de bord et chemin de lecture commun à toutes les sections :
+
+    - stockage : dossier, fichiers et dataset Arrow (fonctions `lister` / `ouvrir` du chargeur, qui n’ouvrent que
+      les fichiers de partition), schéma Arrow et clés de partition Hive ;
+    - source : format des fichiers bruts, motifs, dossier par défaut et convertisseur (parallèle) vers ce stockage ;
+    - lecture : projection et filtres poussés jusqu’au lecteur Parquet (partitions, statistiques des row groups),
+      comptages agrégés par Arrow ; seules les colonnes et lignes utiles sont matérialisées.
+
+    `version()` change à chaque conversion : elle sert de clé aux caches partagés (`dashboard/sections/jeux.py`).
+    """
+
+    def __init__(
+        self,
+        nom: str,
+        libelle: str,
+        dossier: Path,
+        lister: Callable[[Path], list[Path]],
+        ouvrir: Callable[[Path], ds.Dataset],
+        schema: pa.Schema,
+        partitionnement: ds.Partitioning,
+        colonnes_categorielles: list[str],
+        format_source: str,
+        dossier_source: Path,
+        motifs_source: list[str],
+        convertisseur: Callable[..., object],
+        cle_annee: str | None = None,
+        supprimer_sources: bool = False,
+    ):
+        self.nom = nom
+        self.libelle = libelle
+        self.dossier = dossier
+        self.lister = lister
+        self.ouvrir = ouvrir
+        self.schema = schema
+        self.partitionnement = partitionnement
+        self.colonnes_categorielles = colonnes_categorielles
+        self.format_source = format_source
+        self.dossier_source = dossier_source
+        self.motifs_source = motifs_source
+        self.convertisseur = convertisseur
+        self.cle_annee = cle_annee
+        self.supprimer_sources = supprimer_sources
+
+    def __repr__(self) -> str:
+        return f"JeuDonnees({self.nom!r}, dossier={str(self.dossier)!r})"
+
+    @property
+    def cles_partition(self) -> list[str]:
+        return self.partitionnement.schema.names
+
+    # -----------------------------------------------------------------
+    def fichiers(self) -> list[Path]:
+        return self.lister(self.dossier)
+
+    def version(self) -> str:
+        """
+        Version du jeu : empreinte du manifeste de conversion s’il existe, sinon des fichiers (noms, tailles, dates).
+        """
+        if (self.dossier / MANIFESTE).exists():
+            return version_jeu(self.dossier)
+        etats = [(str(f.relative_to(self.dossier)), f.stat().st_size, f.stat().st_mtime_ns) for f in self.fichiers()]
+        return hashlib.sha1(repr(etats).encode("utf-8")).hexdigest()[:12]
+
+    def valeurs(self, cle: str) -> list[str]:
+        """Valeurs d’une clé de partition, lues dans les seuls noms de dossiers."""
+        if cle not in self.cles_partition:
+            raise ValueError(f"{cle} n’est pas une clé de partition du jeu {self.nom}")
+        return valeurs_partition(self.dossier, cle)
+
+    def annees(self) -> list[int]:
+        return [int(a) for a in self.valeurs(self.cle_annee)] if self.cle_annee else []
+
+    def dataset(self) -> ds.Dataset:
+        return self.ouvrir(self.dossier)
+
+    # -----------------------------------------------------------------
+    def _verifier(self, colonnes) -> list[str]:
+        inconnues = [c for c in colonnes if c not in self.schema.names]
+        if inconnues:
+            raise ValueError(f"Colonne(s) inconnue(s) du jeu {self.nom} : {', '.join(inconnues)}")
+        return list(colonnes)
+
+    def filtre(self, valeurs: dict | None = None, bornes: dict | None = None) -> ds.Expression | None:
+        """
+        Expression de filtre Arrow : `valeurs` {colonne: valeurs retenues}, `bornes` {colonne: (min, max)}
+        (bornes incluses, None = pas de borne). Une clé de partition élimine des dossiers entiers,
+        les autres colonnes s’appuient sur les statistiques min / max des row groups.
+        """
+        conditions = []
+        for colonne, retenues in (valeurs or {}).items():
+            type_arrow = self.schema.field(self._verifier([colonne])[0]).type
+            if pa.types.is_dictionary(type_arrow):
+                type_arrow = type_arrow.value_type
+            conditions.append(ds.field(colonne).isin(pa.array(list(retenues)).cast(type_arrow)))
+        for colonne, (minimum, maximum) in (bornes or {}).items():
+            self._verifier([colonne])
+            if minimum is not None:
+                conditions.append(ds.field(colonne) >= minimum)
+            if maximum is not None:
+                conditions.append(ds.field(colonne) <= maximum)
+
+        if not conditions:
+            return None
+        filtre = conditions[0]
+        for condition in conditions[1:]:
+            filtre = filtre & condition
+        return filtre
+
+    def table(
+        self,
+        colonnes: list[str] | None = None,
+        valeurs: dict | None = None,
+        bornes: dict | None = None,
+        limite: int | None = None,
+    ) -> pa.Table:
+        """
+        Lignes retenues par les filtres (voir `filtre`), limitées aux `colonnes` demandées (toutes si None).
+        """
+        if colonnes is not None:
+            colonnes = self._verifier(colonnes)
+        filtre = self.filtre(valeurs, bornes)
+        with Span("registre.lire", jeu=self.nom) as span:
+            dataset = self.dataset()
+            if limite is not None:
+                table = dataset.head(limite, columns=colonnes, filter=filtre)
+            else:
+                table = dataset.to_table(columns=colonnes, filter=filtre)
+            span.lignes_sortie = table.num_rows
+        return table
+
+    def charger(
+        self,
+        colonnes: list[str] | None = None,
+        valeurs: dict | None = None,
+        bornes: dict | None = None,
+        limite: int | None = None,
+    ) -> pd.DataFrame:
+        """Comme `table`, en DataFrame (codes en `category`)."""
+        table = self.table(colonnes, valeurs, bornes, limite)
+        LOG.info(f"{table.num_rows:_} lignes {self.nom} chargées depuis {self.dossier}")
+        return table_vers_pandas(table, self.colonnes_categorielles, liberer=True)
+
+    def compter(self, dimensions: list[str], valeurs: dict | None = None, bornes: dict | None = None) -> pd.DataFrame:
+        """
+        Nombre de lignes (`nombre`) par combinaison des `dimensions`, triées : seules les colonnes
+        des dimensions sont lues, le regroupement est fait par Arrow sans passer par pandas.
+        """
+        dimensions = self._verifier(dimensions)
+        table = self.table(dimensions, valeurs, bornes)
+        # Regroupement sur les valeurs (et non les indices de dictionnaire, propres à chaque fichier)
+        table = pa.table({
+            nom: table[nom].cast(table.schema.field(nom).type.value_type) if pa.types.is_dictionary(table.schema.field(nom).type) else table[nom]
+            for nom in dimensions
+        })
+        comptes = table.group_by(dimensions).aggregate([([], "count_all")]).rename_columns(dimensions + ["nombre"])
+        comptes = comptes.sort_by([(nom, "ascending") for nom in dimensions])
+        return comptes.to_pandas()
+
+    # -----------------------------------------------------------------
+    def fichiers_source(self, source_dir: Path | None = None) -> list[Path]:
+        source_dir = source_dir or self.dossier_source
+        return sorted({f for motif in self.motifs_source for f in source_dir.glob(motif)})
+
+    def convertir(self, source_dir: Path | None = None, workers: int = 1):
+        """
+        Convertit les fichiers bruts de `source_dir` (défaut : `dossier_source`) dans le stockage du jeu,
+        `workers` fichiers en parallèle.
+        """
+        source_dir = source_dir or self.dossier_source
+        LOG.info(f"Jeu {self.nom} : conversion {self.format_source} depuis {source_dir} ({workers} processus)")
+        return self.convertisseur(self, source_dir, workers)
+
+
+# ---------------------------------------------------------------------
+def _convertir_deces(jeu: JeuDonnees, source_dir: Path, workers: int):
+    return convert_to_parquet(source_dir, jeu.dossier, delete_original=jeu.supprimer_sources, workers=workers)
+
+
+def _ingestion(ingerer: Callable[..., int]) -> Callable[[JeuDonnees, Path, int], int]:
+    """
+    Convertisseur des jeux ingérés par année (`ingerer(fichiers, dossier, workers=...)`) : les fichiers bruts
+    retenus par `motifs_source` sont normalisés dans le stockage du jeu, puis supprimés si `supprimer_sources`.
+    """
+    def convertir(jeu: JeuDonnees, source_dir: Path, workers: int) -> int:
+        fichiers = jeu.fichiers_source(source_dir)
+        if not fichiers:
+            LOG.warning(f"Aucun fichier {jeu.nom} ({', '.join(jeu.motifs_source)}) trouvé dans {source_dir}")
+            return 0
+        nb_lignes = ingerer(fichiers, jeu.dossier, workers=workers)
+        if jeu.supprimer_sources:
+            for fichier in fichiers:
+                fichier.unlink()
+        return nb_lignes
+
+    return convertir
+
+
+#######################################################################
+#                           REGISTRE
+#######################################################################
+# Un jeu ajouté ici est disponible pour toutes les sections (`dashboard/sections/jeux.py`) et `main_convert.py`
+JEUX = {
+    "deces": JeuDonnees(
+        nom="deces",
+        libelle="Décès",
+        dossier=Path("data_processed/deces"),
+        lister=fichiers_deces,
+        ouvrir=dataset_deces,
+        schema=SCHEMA_DECES,
+        partitionnement=PARTITIONNEMENT_DECES,
+        colonnes_categorielles=COLONNES_CATEGORIELLES_DECES,
+        format_source="TXT à positions fixes (INSEE, fichier des personnes décédées)",
+        dossier_source=Path("data_processed/deces"),
+        motifs_source=["*.txt"],
+        convertisseur=_convertir_deces,
+        cle_annee="annee_deces",
+        supprimer_sources=True,
+    ),
+    "naissances": JeuDonnees(
+        nom="naissances",
+        libelle="Naissances",
+        dossier=Path("data_processed/naissances"),
+        lister=fichiers_naissances,
+        ouvrir=dataset_naissances,
+        schema=SCHEMA_NAISSANCES,
+        partitionnement=PARTITIONNEMENT_NAISSANCES,
+        colonnes_categorielles=COLONNES_CATEGORIELLES_NAISSANCES,
+        format_source="CSV / Parquet (INSEE, fichier détail des naissances)",
+        # Fichiers bruts posés à la racine du jeu (ex: `naissances_2022.parquet`), hors partitions
+        dossier_source=Path("data_processed/naissances"),
+        motifs_source=["*.csv", "*.parquet"],
+        convertisseur=_ingestion(ingerer_naissances),
+        cle_annee="annee_naissance",
+    ),
+    "violences": JeuDonnees(
+        nom="violences",
+        libelle="Violences",
+        dossier=Path("data_processed/violences"),
+        lister=fichiers_violences,
+        ouvrir=dataset_violences,
+        schema=SCHEMA_VIOLENCES,
+        partitionnement=PARTITIONNEMENT_VIOLENCES,
+        colonnes_categorielles=COLONNES_CATEGORIELLES_VIOLENCES,
+        format_source="CSV (SSMSI, base départementale de la délinquance enregistrée)",
+        # Fichiers bruts posés à la racine du jeu (ex: `donnee-dep-data.gouv-2024.csv`), hors partitions
+        dossier_source=Path("data_processed/violences"),
+        motifs_source=["*.csv"],
+        convertisseur=_ingestion(ingerer_violences),
+        cle_annee="annee",
+    ),
+}
+
+
+def jeu(nom: str) -> JeuDonnees:
+    try:
+        return JEUX[nom]
+    except KeyError:
+        raise ValueError(f"Jeu inconnu : {nom} (jeux enregistrés : {', '.join(JEUX)})") from None
@@ -0,0 +1,193 @@
+import pandas as pd
+import pyarrow as pa
+
+
+#######################################################################
+#                           DECES
+#######################################################################
+# Dictionnaire Arrow pour les colonnes à faible cardinalité (codes COG, noms de lieux...)
+_DICT = pa.dictionary(pa.int32(), pa.string())
+
+# Schéma Arrow des décès nettoyés (fixe d’un lot à l’autre et d’un fichier à l’autre).
+# `sexe` reste une chaîne simple : c’est une clé de partition, elle n’est pas stockée dans les fichiers.
+# `precision_*` : partie fiable des dates AAAAMMJJ (voir `utils.dates.PRECISION_*`).
+SCHEMA_DECES = pa.schema([
+    ("nom_prenom", pa.string()),
+    ("sexe", pa.string()),
+    ("date_naissance", pa.date32()),
+    ("code_lieu_naissance", _DICT),
+    ("commune_naissance", _DICT),
+    ("pays_naissance", _DICT),
+    ("date_deces", pa.date32()),
+    ("code_lieu_deces", _DICT),
+    ("numero_acte", _DICT),
+    ("age_deces", pa.int16()),
+    ("annee_deces", pa.int16()),
+    ("mois_deces", pa.int8()),
+    ("precision_naissance", pa.int8()),
+    ("precision_deces", pa.int8()),
+])
+
+# Schéma d’écriture des fichiers Parquet : les colonnes dictionnaire sont stockées en chaînes simples.
+# Parquet les encode lui-même en dictionnaire, fichier par fichier (seules les valeurs présentes),
+# alors qu’un dictionnaire Arrow écrit tel quel serait recopié en entier dans chaque partition.
+COLONNES_DICTIONNAIRE_DECES = [champ.name for champ in SCHEMA_DECES if pa.types.is_dictionary(champ.type)]
+SCHEMA_STOCKAGE_DECES = pa.schema([
+    pa.field(champ.name, champ.type.value_type) if champ.name in COLONNES_DICTIONNAIRE_DECES else champ
+    for champ in SCHEMA_DECES
+])
+
+# Colonnes stockées en `category` côté pandas
+COLONNES_CATEGORIELLES_DECES = [
+    "sexe",
+    "code_lieu_naissance",
+    "commune_naissance",
+    "pays_naissance",
+    "code_lieu_deces",
+    "numero_acte",
+]
+
+# Colonnes entières (types pandas nullables)
+TYPES_ENTIERS_DECES = {
+    "age_deces": "Int16",
+    "annee_deces": "Int16",
+    "mois_deces": "Int8",
+    "precision_naissance": "Int8",
+    "precision_deces": "Int8",
+}
+
+
+#######################################################################
+#                           NAISSANCES
+#######################################################################
+# Renommage des colonnes du fichier INSEE (documentation officielle)
+COLONNES_NAISSANCES = {
+    "AGEMERE": "age_mere",
+    "AGEXACTM": "age_exact_mere",
+    "ANAIS": "annee_naissance",
+    "DEPDOMM": "dep_domicile_mere",
+    "DEPNAIS": "dep_naissance_enfant",
+    "GAGEXAPOM": "groupe_age_second_parent_exact",
+    "GAGPOM": "groupe_age_second_parent",
+    "INDLNM": "lieu_naissance_mere",
+    "INDNATM": "nationalite_mere",
+    "MNAIS": "mois_naissance_enfant",
+    "NBENF": "nombre_enfants_accouchement",
+    "REGDOMM": "region_domicile_mere",
+    "REGNAIS": "region_naissance_enfant",
+    "SEXE": "sexe_enfant"
+}
+
+# Colonnes entières (après renommage) ; toutes les autres sont des codes → `category`
+TYPES_ENTIERS_NAISSANCES = {
+    "age_mere": "Int8",
+    "age_exact_mere": "Int8",
+    "annee_naissance": "Int16",
+    "mois_naissance_enfant": "Int8",
+    "nombre_enfants_accouchement": "Int8",
+}
+
+# Schéma Arrow des naissances normalisées à l’ingestion (toutes années) : entiers courts, codes en dictionnaire.
+# `annee_naissance` est la clé de partition du jeu naissances : elle n’est pas stockée dans les fichiers.
+_ENTIERS_ARROW = {"Int8": pa.int8(), "Int16": pa.int16()}
+SCHEMA_NAISSANCES = pa.schema([
+    (nom, _ENTIERS_ARROW[TYPES_ENTIERS_NAISSANCES[nom]] if nom in TYPES_ENTIERS_NAISSANCES else _DICT)
+    for nom in COLONNES_NAISSANCES.values()
+])
+COLONNES_CATEGORIELLES_NAISSANCES = [champ.name for champ in SCHEMA_NAISSANCES if pa.types.is_dictionary(champ.type)]
+SCHEMA_STOCKAGE_NAISSANCES = pa.schema([
+    pa.field(champ.name, champ.type.value_type) if champ.name in COLONNES_CATEGORIELLES_NAISSANCES else champ
+    for champ in SCHEMA_NAISSANCES
+])
+
+
+#######################################################################
+#                           VIOLENCES
+#######################################################################
+# Renommage des colonnes de la base départementale de la délinquance enregistrée (SSMSI, data.gouv.fr) :
+# noms des millésimes récents et des anciens fichiers
+COLONNES_VIOLENCES = {
+    "Code_departement": "code_departement",
+    "Code.département": "code_departement",
+    "Code_region": "code_region",
+    "Code.région": "code_region",
+    "annee": "annee",
+    "indicateur": "indicateur",
+    "classe": "indicateur",
+    "unite_de_compte": "unite_de_compte",
+    "unité.de.compte": "unite_de_compte",
+    "nombre": "nombre",
+    "faits": "nombre",
+    "taux_pour_mille": "taux_pour_mille",
+    "tauxpourmille": "taux_pour_mille",
+    "insee_pop": "population",
+    "POP": "population",
+}
+
+# Schéma Arrow de la base normalisée à l’ingestion : une ligne par (année, département, indicateur).
+# `annee` est la clé de partition du jeu violences : elle n’est pas stockée dans les fichiers.
+SCHEMA_VIOLENCES = pa.schema([
+    ("annee", pa.int16()),
+    ("code_departement", _DICT),
+    ("code_region", _DICT),
+    ("indicateur", _DICT),
+    ("unite_de_compte", _DICT),
+    ("nombre", pa.int32()),
+    ("taux_pour_mille", pa.float64()),
+    ("population", pa.int32()),
+])
+COLONNES_CATEGORIELLES_VIOLENCES = [champ.name for champ in SCHEMA_VIOLENCES if pa.types.is_dictionary(champ.type)]
+SCHEMA_STOCKAGE_VIOLENCES = pa.schema([
+    pa.field(champ.name, champ.type.value_type) if champ.name in COLONNES_CATEGORIELLES_VIOLENCES else champ
+    for champ in SCHEMA_VIOLENCES
+])
+
+
+#######################################################################
+#                       CONVERSIONS
+#######################################################################
+# Types Arrow → types pandas compacts (entiers nullables, dates sur 4 octets)
+_TYPES_PANDAS = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.date32(): pd.ArrowDtype(pa.date32()),
+}
+
+
+def table_vers_pandas(table: pa.Table, categorielles: list[str] | None = None, liberer: bool = False) -> pd.DataFrame:
+    """
+    Convertit une table Arrow en DataFrame aux types compacts :
+    dictionnaires → `category`, entiers → `Int8/Int16/Int32` nullables, dates → `date32[pyarrow]`.
+    Les colonnes `categorielles` encore en chaînes (ex: clés de partition) sont encodées en dictionnaire.
+
+    Les colonnes ne sont pas regroupées en blocs 2D (pas de copie supplémentaire). Si `liberer`, chaque colonne
+    Arrow est relâchée dès sa conversion (pic mémoire ≈ une seule copie) : `table` ne doit plus servir ensuite.
+    """
+    for nom in categorielles or []:
+        if nom in table.column_names and not pa.types.is_dictionary(table.schema.field(nom).type):
+            i = table.column_names.index(nom)
+            table = table.set_column(i, nom, table.column(nom).dictionary_encode())
+    return table.to_pandas(types_mapper=_TYPES_PANDAS.get, split_blocks=True, self_destruct=liberer)
+
+
+# ---------------------------------------------------------------------
+def _typer(df: pd.DataFrame, entiers: dict, categorielles: list[str]) -> pd.DataFrame:
+    for nom, dtype in entiers.items():
+        if nom in df.columns:
+            df[nom] = pd.to_numeric(df[nom], errors="coerce").astype(dtype)
+    for nom in categorielles:
+        if nom in df.columns:
+            df[nom] = df[nom].astype("category")
+    return df
+
+
+def typer_deces(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applique les types compacts du schéma décès à un DataFrame (en place).
+    """
+    for nom in ("date_naissance", "date_deces"):
+        if nom in df.columns and pd.api.types.is_datetime64_any_dtype(df[nom]):
+            df[nom] = df[nom].astype(pd.ArrowDtype(pa.date32()))
+    return _typer(df, TYPES_ENTIERS_DECES, COLONNES_CATEGORIELLES_DECES)
+
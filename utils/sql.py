@@ -0,0 +1,122 @@
+import os
+import duckdb
+import pandas as pd
+from pathlib import Path
+from utils.loader import MOTIF_DECES, MOTIF_NAISSANCES
+from utils.logger import Logger, Span
+
+LOG = Logger()
+
+TYPES_PARTITIONS_DECES = {"annee_deces": "SMALLINT", "mois_deces": "TINYINT", "sexe": "VARCHAR"}
+
+# Mémoire de travail par défaut (Mo), surchargeable par DASHBOARD_SQL_MEMOIRE_MO ; au-delà, DuckDB déborde sur disque
+MEMOIRE_MO_DEFAUT = 2048
+
+# Département d’un code COG (même règle que `utils.geo.departement`)
+_MACRO_DEPARTEMENT = """
+CREATE OR REPLACE MACRO departement(code) AS
+    CASE WHEN code[1:2] IN ('97', '98') THEN code[1:3] ELSE code[1:2] END
+"""
+
+
+def _litteral(chemin: Path) -> str:
+    return "'" + chemin.as_posix().replace("'", "''") + "'"
+
+
+def _vue_deces(con: duckdb.DuckDBPyConnection, base_dir: Path) -> bool:
+    if not any(base_dir.glob(MOTIF_DECES)):
+        LOG.warning(f"SQL : aucun fichier décès dans {base_dir}, vue `deces` non créée")
+        return False
+    types = ", ".join(f"'{nom}': '{type_sql}'" for nom, type_sql in TYPES_PARTITIONS_DECES.items())
+    source = f"read_parquet({_litteral(base_dir / MOTIF_DECES)}, hive_partitioning = true, hive_types = {{{types}}}"
+    con.execute(f"CREATE OR REPLACE VIEW deces AS SELECT * FROM {source})")
+    # Position de chaque ligne (fichier, ligne) : ordre total et stable, pour paginer un tri sans doublon ni trou
+    con.execute(f"CREATE OR REPLACE VIEW deces_lignes AS SELECT * FROM {source}, filename = true, file_row_number = true)")
+    return True
+
+
+def _vue_naissances(con: duckdb.DuckDBPyConnection, dossier: Path) -> bool:
+    if not any(dossier.glob(MOTIF_NAISSANCES)):
+        LOG.warning(f"SQL : aucun fichier naissances dans {dossier}, vue `naissances` non créée")
+        return False
+    con.execute(f"""
+        CREATE OR REPLACE VIEW naissances AS
+        SELECT * FROM read_parquet({_litteral(dossier / MOTIF_NAISSANCES)}, hive_partitioning = true,
+                                   hive_types = {{'annee_naissance': 'SMALLINT'}})
+    """)
+    return True
+
+
+# ---------------------------------------------------------------------
+def connecter(
+    base_deces: Path | None = None,
+    dossier_naissances: Path | None = None,
+    threads: int | None = None,
+    memoire_mo: int | None = None,
+) -> duckdb.DuckDBPyConnection:
+    """
+    Moteur SQL embarqué (DuckDB, en mémoire) exposant les vues `deces` et `naissances` sur les fichiers Parquet
+    (ainsi que `deces_lignes` : `deces` + colonnes `filename` et `file_row_number`).
+
+    Les requêtes lisent les fichiers en flux, sur plusieurs threads, en ne décodant que les colonnes et
+    row groups utiles (statistiques, partitions Hive) ; au-delà de `memoire_mo`, les opérateurs débordent
+    sur disque au lieu d’échouer. La macro `departement(code)` donne le département d’un code COG.
+    Une session par thread : utiliser `con.cursor()` (mêmes vues, exécution indépendante).
+    """
+    if memoire_mo is None:
+        memoire_mo = int(os.environ.get("DASHBOARD_SQL_MEMOIRE_MO", MEMOIRE_MO_DEFAUT))
+    con = duckdb.connect(config={
+        "threads": threads or os.cpu_count() or 1,
+        "memory_limit": f"{memoire_mo}MB",
+    })
+    con.execute(_MACRO_DEPARTEMENT)
+
+    vues = []
+    if base_deces is not None and _vue_deces(con, base_deces):
+        vues.append("deces")
+    if dossier_naissances is not None and _vue_naissances(con, dossier_naissances):
+        vues.append("naissances")
+    threads = con.execute("SELECT current_setting('threads')").fetchone()[0]
+    LOG.info(f"SQL : vues {', '.join(vues) or 'aucune'} ({threads} threads, {memoire_mo} Mo)")
+    return con
+
+
+def requete(con: duckdb.DuckDBPyConnection, sql: str, parametres: list | dict | None = None) -> pd.DataFrame:
+    """
+    Exécute une requête (paramètres `?` ou `$nom`) et renvoie un DataFrame (seul le résultat est matérialisé).
+    """
+    with Span("sql.requete") as span:
+        resultat = con.execute(sql, parametres).to_arrow_table()
+        span.lignes_sortie = resultat.num_rows
+    return resultat.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# ---------------------------------------------------------------------
+def deces_par_semaine(
+    con: duckdb.DuckDBPyConnection,
+    annees: list[int] | None = None,
+    sexes: list[str] | None = None,
+    par_departement: bool = False,
+) -> pd.DataFrame:
+    """
+    Décès par semaine ISO (début de semaine `semaine`), et par département du lieu de décès si demandé.
+    Les filtres année / sexe éliminent des partitions entières sans ouvrir leurs fichiers.
+    """
+    dimensions = ["CAST(date_trunc('week', date_deces) AS DATE) AS semaine"]
+    if par_departement:
+        dimensions.append("departement(code_lieu_deces) AS departement")
+    conditions, parametres = ["date_deces IS NOT NULL"], {}
+    if annees is not None:
+        conditions.append("list_contains($annees, annee_deces)")
+        parametres["annees"] = [int(a) for a in annees]
+    if sexes is not None:
+        conditions.append("list_contains($sexes, sexe)")
+        parametres["sexes"] = [str(s) for s in sexes]
+    sql = f"""
+        SELECT {', '.join(dimensions)}, count(*) AS nb_deces
+        FROM deces
+        WHERE {' AND '.join(conditions)}
+        GROUP BY ALL
+        ORDER BY ALL
+    """
+    return requete(con, sql, parametres)
@@ -0,0 +1,68 @@
+import os
+import re
+import sys
+import subprocess
+from pathlib import Path
+
+# Racine du projet et dossier du tableau de bord (les sections s’importent en `sections.xxx`)
+RACINE = Path(__file__).resolve().parent.parent
+DOSSIER_DASHBOARD = RACINE / "dashboard"
+
+# Ligne `-X importtime` : "import time: <self us> | <cumulé us> | <module>"
+_LIGNE_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)")
+
+
+def mesurer_import(module: str) -> dict:
+    """
+    Importe `module` dans un interpréteur neuf (`python -X importtime`) : coût d’un démarrage à froid.
+
+    Returns:
+        dict: `module`, `total_ms` (import cumulé) et `modules` ({paquet racine: temps propre ms})
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(RACINE), str(DOSSIER_DASHBOARD), env.get("PYTHONPATH", "")])
+    resultat = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=RACINE, env=env, capture_output=True, text=True,
+    )
+    if resultat.returncode != 0:
+        raise RuntimeError(f"Import de {module} impossible : {resultat.stderr.strip().splitlines()[-1]}")
+
+    # Temps propre cumulé par paquet racine (pandas, pyarrow, plotly...) et temps total du module demandé
+    paquets = {}
+    total_ms = 0.0
+    for ligne in resultat.stderr.splitlines():
+        m = _LIGNE_IMPORTTIME.match(ligne)
+        if not m:
+            continue
+        nom = m.group(3)
+        if nom == module:
+            total_ms = int(m.group(2)) / 1000
+        racine = nom.split(".")[0]
+        paquets[racine] = paquets.get(racine, 0.0) + int(m.group(1)) / 1000
+    return {"module": module, "total_ms": total_ms, "modules": paquets}
+
+
+# ---------------------------------------------------------------------
+def rapport_demarrage(modules: list[str], top: int = 5) -> list[dict]:
+    """
+    Mesure le démarrage à froid de chaque module et garde les `top` dépendances les plus lourdes.
+    """
+    rapport = []
+    for module in modules:
+        mesure = mesurer_import(module)
+        lourds = sorted(mesure["modules"].items(), key=lambda item: item[1], reverse=True)[:top]
+        rapport.append({"module": module, "total_ms": mesure["total_ms"], "plus_lourds": lourds})
+    return rapport
+
+
+def formater_rapport(rapport: list[dict], budget_ms: float | None = None) -> str:
+    """
+    Tableau texte du rapport (une ligne par module, ✅ / ❌ selon le budget).
+    """
+    lignes = [f"{'Module':<30} {'Import (ms)':>12}  Dépendances les plus lourdes"]
+    for ligne in rapport:
+        statut = "" if budget_ms is None else (" ✅" if ligne["total_ms"] <= budget_ms else " ❌")
+        lourds = ", ".join(f"{nom} {ms:.0f}" for nom, ms in ligne["plus_lourds"])
+        lignes.append(f"{ligne['module']:<30} {ligne['total_ms']:>12.0f}{statut}  {lourds}")
+    return "\n".join(lignes)
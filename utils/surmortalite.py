@@ -0,0 +1,198 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pathlib import Path
+from utils.cube import DOSSIER_CUBE
+from utils.logger import Logger, Span
+
+LOG = Logger()
+
+# Dossier des séries mensuelles en cache (préfixe `_` : ignoré lors de la découverte du jeu partitionné)
+DOSSIER_SURMORTALITE = "_surmortalite"
+
+# Tranches d’âge (bornes inférieures incluses ; la dernière borne ferme la dernière tranche)
+TRANCHES_AGE = [0, 15, 45, 65, 75, 85, 141]
+
+SCHEMA_SERIES = pa.schema([
+    ("annee_deces", pa.int16()),
+    ("mois_deces", pa.int8()),
+    ("sexe", pa.string()),
+    ("tranche_age", pa.int8()),
+    ("nb_deces", pa.int64()),
+])
+DIMENSIONS_SERIES = SCHEMA_SERIES.names[:-1]
+
+
+def libelles_tranches(tranches: list[int] = TRANCHES_AGE) -> list[str]:
+    return [f"{bas}-{haut - 1} ans" for bas, haut in zip(tranches[:-2], tranches[1:-1])] + [f"{tranches[-2]} ans et +"]
+
+
+#######################################################################
+#                       SÉRIES MENSUELLES
+#######################################################################
+def _agreger_cube(chemin: Path, tranches: list[int]) -> pa.Table:
+    """
+    Décès d’un fichier du cube par année, mois, sexe et tranche d’âge (âge ou mois inconnus écartés).
+    """
+    cube = pq.read_table(chemin, columns=["annee_deces", "mois_deces", "sexe", "age_deces", "nb_deces"])
+    connus = pc.and_(pc.is_valid(cube["age_deces"]), pc.and_(pc.is_valid(cube["mois_deces"]), pc.is_valid(cube["annee_deces"])))
+    cube = cube.filter(connus)
+    ages = cube["age_deces"].to_numpy()
+    tranche = np.clip(np.searchsorted(tranches, ages, side="right") - 1, 0, len(tranches) - 2).astype(np.int8)
+    table = cube.drop_columns(["age_deces"]).append_column("tranche_age", pa.array(tranche))
+    return _sommer([table])
+
+
+def _sommer(tables: list[pa.Table]) -> pa.Table:
+    if not tables:
+        return SCHEMA_SERIES.empty_table()
+    total = pa.concat_tables([t.select(SCHEMA_SERIES.names).cast(SCHEMA_SERIES) for t in tables])
+    total = total.group_by(DIMENSIONS_SERIES).aggregate([("nb_deces", "sum")])
+    return total.rename_columns(DIMENSIONS_SERIES + ["nb_deces"]).select(SCHEMA_SERIES.names).cast(SCHEMA_SERIES)
+
+
+class SeriesMensuelles:
+    """
+    Décès mensuels par sexe et tranche d’âge, tenus à jour de manière incrémentale sur disque
+    (`_surmortalite/series.parquet` + état des fichiers du cube déjà comptés) :
+    l’ingestion d’un nouveau mois n’ajoute que le cube de ce fichier, sans relire les années passées.
+    Si un fichier déjà compté change ou disparaît (reconversion), la série est reconstruite depuis le cube.
+    """
+
+    def __init__(self, base_dir: Path, tranches: list[int] = TRANCHES_AGE):
+        self.base_dir = base_dir
+        self.tranches = list(tranches)
+        self.dossier = base_dir / DOSSIER_SURMORTALITE
+        self.chemin = self.dossier / "series.parquet"
+        self.chemin_etat = self.dossier / "etat.json"
+
+    def _etat_cube(self) -> dict:
+        return {
+            f.name: [f.stat().st_size, f.stat().st_mtime_ns]
+            for f in sorted((self.base_dir / DOSSIER_CUBE).glob("*.parquet"))
+        }
+
+    def charger(self) -> pa.Table:
+        actuel = self._etat_cube()
+        etat = json.loads(self.chemin_etat.read_text(encoding="utf-8")) if self.chemin_etat.exists() else {}
+        comptes = etat.get("cubes", {})
+
+        reconstruire = (
+            etat.get("tranches") != self.tranches
+            or not self.chemin.exists()
+            or any(actuel.get(nom) != valeur for nom, valeur in comptes.items())
+        )
+        if reconstruire:
+            comptes, series = {}, SCHEMA_SERIES.empty_table()
+        else:
+            series = pq.read_table(self.chemin, schema=SCHEMA_SERIES)
+
+        nouveaux = [nom for nom in actuel if nom not in comptes]
+        if not nouveaux:
+            return series
+
+        with Span("surmortalite.series", fichiers=len(nouveaux), reconstruction=reconstruire) as span:
+            ajouts = [_agreger_cube(self.base_dir / DOSSIER_CUBE / nom, self.tranches) for nom in nouveaux]
+            series = _sommer([series] + ajouts)
+            span.lignes_sortie = series.num_rows
+
+        # Écriture atomique (série puis état) : une écriture interrompue provoque au pire une reconstruction
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        tmp = self.chemin.with_name(f".{self.chemin.name}.{os.getpid()}.tmp")
+        pq.write_table(series, tmp)
+        os.replace(tmp, self.chemin)
+        comptes.update({nom: actuel[nom] for nom in nouveaux})
+        tmp = self.chemin_etat.with_name(f".{self.chemin_etat.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"tranches": self.tranches, "cubes": comptes}, indent=2), encoding="utf-8")
+        os.replace(tmp, self.chemin_etat)
+
+        LOG.info(f"Surmortalité : {len(nouveaux)} fichier(s) du cube ajouté(s) à la série" + (" (reconstruction)" if reconstruire else ""))
+        return series
+
+
+#######################################################################
+#                       DÉCÈS ATTENDUS
+#######################################################################
+def surmortalite(
+    series: pa.Table | pd.DataFrame,
+    nb_annees: int = 5,
+    exclure: tuple[int, ...] = (),
+    tranches: list[int] = TRANCHES_AGE,
+) -> pd.DataFrame:
+    """
+    Décès attendus et surmortalité par année, mois, sexe et tranche d’âge.
+
+    Les attendus d’un mois sont la moyenne du même mois, même sexe et même tranche sur les `nb_annees`
+    années précédentes (hors années `exclure`, ex. 2020) ; l’écart-type est celui de ces années,
+    au moins l’écart-type de Poisson (√attendus). `z` = (observés − attendus) / écart-type.
+    Calcul vectorisé sur un tableau dense [année, mois, sexe, tranche] par sommes cumulées sur les années.
+    """
+    df = series.to_pandas() if isinstance(series, pa.Table) else series
+    colonnes = ["annee_deces", "mois_deces", "sexe", "tranche_age", "observes", "attendus", "ecart_type", "exces", "z", "nb_annees_reference"]
+    if df.empty:
+        return pd.DataFrame(columns=colonnes)
+
+    annees = np.arange(int(df["annee_deces"].min()), int(df["annee_deces"].max()) + 1)
+    sexes = sorted(df["sexe"].dropna().unique())
+    nb_tranches = len(tranches) - 1
+    df = df[df["sexe"].isin(sexes)]
+
+    # Tableau dense des décès observés
+    i_annee = df["annee_deces"].to_numpy(dtype=np.int64) - annees[0]
+    i_mois = df["mois_deces"].to_numpy(dtype=np.int64) - 1
+    i_sexe = np.searchsorted(sexes, df["sexe"].to_numpy(dtype=object))
+    i_tranche = df["tranche_age"].to_numpy(dtype=np.int64)
+    observes = np.zeros((len(annees), 12, len(sexes), nb_tranches))
+    np.add.at(observes, (i_annee, i_mois, i_sexe, i_tranche), df["nb_deces"].to_numpy(dtype=np.float64))
+
+    # Fenêtre glissante des années de référence : sommes cumulées (pondérées par les années retenues)
+    retenues = (~np.isin(annees, list(exclure))).astype(np.float64)
+    poids = retenues[:, None, None, None]
+    zeros = np.zeros((1,) + observes.shape[1:])
+    cumul_n = np.concatenate([[0.0], np.cumsum(retenues)])[:, None, None, None]
+    cumul_x = np.concatenate([zeros, np.cumsum(poids * observes, axis=0)])
+    cumul_x2 = np.concatenate([zeros, np.cumsum(poids * observes ** 2, axis=0)])
+    fin = np.arange(len(annees))
+    debut = np.maximum(fin - nb_annees, 0)
+    n = cumul_n[fin] - cumul_n[debut]
+    somme = cumul_x[fin] - cumul_x[debut]
+    somme2 = cumul_x2[fin] - cumul_x2[debut]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        attendus = np.where(n >= 2, somme / n, np.nan)
+        variance = np.where(n >= 2, (somme2 - somme ** 2 / n) / (n - 1), np.nan)
+        ecart_type = np.sqrt(np.maximum(np.maximum(variance, 0), attendus))
+        exces = observes - attendus
+        z = np.where(ecart_type > 0, exces / ecart_type, np.nan)
+
+    grille = np.meshgrid(annees, np.arange(1, 13), np.arange(len(sexes)), np.arange(nb_tranches), indexing="ij")
+    resultat = pd.DataFrame({
+        "annee_deces": grille[0].ravel(),
+        "mois_deces": grille[1].ravel(),
+        "sexe": np.asarray(sexes, dtype=object)[grille[2].ravel()],
+        "tranche_age": grille[3].ravel(),
+        "observes": observes.ravel(),
+        "attendus": attendus.ravel(),
+        "ecart_type": ecart_type.ravel(),
+        "exces": exces.ravel(),
+        "z": z.ravel(),
+        "nb_annees_reference": np.broadcast_to(n, observes.shape).ravel().astype(np.int16),
+    })
+    return resultat[resultat["attendus"].notna()].reset_index(drop=True)[colonnes]
+
+
+def agreger_surmortalite(resultat: pd.DataFrame, dimensions: list[str]) -> pd.DataFrame:
+    """
+    Regroupe la surmortalité selon `dimensions` (ex. année + mois, tous sexes et âges confondus) :
+    observés, attendus et variances s’additionnent ; `z` est recalculé sur le regroupement.
+    """
+    groupes = resultat.assign(variance=resultat["ecart_type"] ** 2).groupby(dimensions, as_index=False)
+    total = groupes[["observes", "attendus", "variance"]].sum()
+    total["ecart_type"] = np.sqrt(total.pop("variance"))
+    total["exces"] = total["observes"] - total["attendus"]
+    total["z"] = total["exces"] / total["ecart_type"].where(total["ecart_type"] > 0)
+    return total